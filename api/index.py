@@ -4,15 +4,81 @@ Vercel entry point for n8n-workflows search engine.
 Simple FastAPI app for serverless deployment.
 """
 
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse, HTMLResponse, FileResponse
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import JSONResponse, HTMLResponse, FileResponse, Response
 from fastapi.staticfiles import StaticFiles
+from email.utils import formatdate
 import json
+import os
 from pathlib import Path
 
 # Create FastAPI app
 app = FastAPI(title="N8N Workflows API", version="1.0.0")
 
+# Cache-Control for a URL pinned to the current deployment with ?v= (its content can never change)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Everything served here (vercel_workflows.json, search_categories.json, workflow files, static/)
+# is a deploy artifact, so one version per deployment ETags every response. Built on first use.
+_deployment_version = None
+
+def deployment_version():
+    """(version, Last-Modified or None) of this deployment: Vercel's deployment id or commit, else file stats."""
+    global _deployment_version
+    if _deployment_version is None:
+        data_path = Path(__file__).parent / "vercel_workflows.json"
+        last_modified = formatdate(data_path.stat().st_mtime, usegmt=True) if data_path.exists() else None
+        version = os.environ.get("VERCEL_DEPLOYMENT_ID") or os.environ.get("VERCEL_GIT_COMMIT_SHA")
+        if not version:
+            # Local runs: any change to the data file, the page or this module gives a new version
+            stats = [path.stat() for path in (data_path, Path(__file__).parent.parent / "static" / "index.html",
+                                              Path(__file__))
+                     if path.exists()]
+            version = "-".join(f"{st.st_mtime_ns:x}.{st.st_size:x}" for st in stats) or "none"
+        _deployment_version = (version, last_modified)
+    return _deployment_version
+
+def etag_matches(if_none_match, etag: str) -> bool:
+    """Whether an If-None-Match header names `etag` (weak comparison, as for GET)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+@app.middleware("http")
+async def deployment_etags(request: Request, call_next):
+    """ETag and Last-Modified every successful GET response by deployment; a matching
+    If-None-Match turns a 200 into a 304, and ?v=<version> URLs are cached as immutable."""
+    if request.method != "GET":
+        return await call_next(request)
+    version, last_modified = deployment_version()
+    pinned = request.query_params.get("v") == version
+    headers = {"ETag": f'"{version}"', "Cache-Control": IMMUTABLE_CACHE_CONTROL if pinned else "no-cache"}
+    if last_modified:
+        headers["Last-Modified"] = last_modified
+    response = await call_next(request)
+    if response.status_code != 200:
+        return response
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
+
+# Filename -> path for every deployed workflow file, built on first use.
+# Deployed files never change during an instance's lifetime, so it is never refreshed.
+_workflow_paths = None
+
+def find_workflow_path(filename: str):
+    """Path of the workflow file called `filename` under api/workflows, or None."""
+    global _workflow_paths
+    if _workflow_paths is None:
+        paths = {}
+        for file_path in (Path(__file__).parent / "workflows").rglob("*.json"):
+            paths.setdefault(file_path.name, file_path)
+        _workflow_paths = paths
+    return _workflow_paths.get(filename)
+
 @app.get("/", response_class=HTMLResponse)
 async def root():
     """Serve the main documentation page."""
@@ -244,15 +310,8 @@ async def deep_search_workflows(q: str = "", limit: int = 50):
 @app.get("/api/workflows/{filename}")
 async def get_workflow(filename: str):
     try:
-        # First try to read the actual workflow file (search recursively)
-        workflows_dir = Path(__file__).parent / "workflows"
-        workflow_file_path = None
-        
-        # Search recursively through all subdirectories
-        for file_path in workflows_dir.rglob(filename):
-            if file_path.is_file():
-                workflow_file_path = file_path
-                break
+        # First try to read the actual workflow file
+        workflow_file_path = find_workflow_path(filename)
         
         if workflow_file_path and workflow_file_path.exists():
             with open(workflow_file_path, 'r', encoding='utf-8') as f:
@@ -324,15 +383,8 @@ async def get_workflow(filename: str):
 async def get_workflow_diagram(filename: str):
     """Generate workflow diagram using Mermaid.js syntax."""
     try:
-        # First try to read the actual workflow file (search recursively)
-        workflows_dir = Path(__file__).parent / "workflows"
-        workflow_file_path = None
-        
-        # Search recursively through all subdirectories
-        for file_path in workflows_dir.rglob(filename):
-            if file_path.is_file():
-                workflow_file_path = file_path
-                break
+        # First try to read the actual workflow file
+        workflow_file_path = find_workflow_path(filename)
         
         if workflow_file_path and workflow_file_path.exists():
             with open(workflow_file_path, 'r', encoding='utf-8') as f:
@@ -72,6 +72,8 @@ class VercelWorkflowDB:
     
     def __init__(self):
         self.data = self._load_data()
+        # Exact filename -> workflow, for detail and download lookups
+        self.by_filename = {w.get('filename'): w for w in self.data.get('workflows', [])}
     
     def _load_data(self):
         """Load pre-built workflow data from JSON file."""
@@ -101,6 +103,10 @@ class VercelWorkflowDB:
             'last_indexed': '2025-08-21'
         })
     
+    def get_by_filename(self, filename):
+        """One workflow by exact filename, or None."""
+        return self.by_filename.get(filename)
+    
     def search_workflows(self, query='', limit=20, offset=0):
         """Search workflows from pre-built data."""
         workflows = self.data.get('workflows', [])
@@ -204,15 +210,12 @@ async def get_workflow_detail(filename: str):
         print(f"DEBUG: Requested workflow filename: {filename} - Vercel deployment test")
         
         # Get workflow metadata from database
-        workflows, _ = db.search_workflows(f'filename:"{filename}"', limit=1)
-        print(f"DEBUG: Database search returned {len(workflows)} workflows")
+        workflow_meta = db.get_by_filename(filename)
         
-        if not workflows:
+        if workflow_meta is None:
             print(f"DEBUG: Workflow {filename} not found in database")
             raise HTTPException(status_code=404, detail="Workflow not found in database")
         
-        workflow_meta = workflows[0]
-        
         # Try to load from vercel_workflows.json
         raw_json = None
         try:
@@ -272,13 +275,11 @@ async def download_workflow(filename: str):
     """Download workflow JSON file with proper n8n structure."""
     try:
         # Get workflow metadata from database
-        workflows, _ = db.search_workflows(f'filename:"{filename}"', limit=1)
+        workflow_meta = db.get_by_filename(filename)
         
-        if not workflows:
+        if workflow_meta is None:
             raise HTTPException(status_code=404, detail="Workflow not found in database")
         
-        workflow_meta = workflows[0]
-        
         # Try to load from vercel_workflows.json
         raw_json = None
         try:
@@ -4,20 +4,25 @@ FastAPI Server for N8N Workflow Documentation
 High-performance API with sub-100ms response times.
 """
 
-from fastapi import FastAPI, HTTPException, Query, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Query, BackgroundTasks, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse, JSONResponse
+from fastapi.responses import HTMLResponse, FileResponse, JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel, field_validator
 from typing import Optional, List, Dict, Any
+from email.utils import formatdate
 import json
 import os
 import asyncio
 from pathlib import Path
+from urllib.parse import quote
 import uvicorn
 
-from workflow_db import WorkflowDatabase
+import workflow_svg
+from workflow_db import WorkflowDatabase, encode_cursor
+from async_db import AsyncWorkflowDatabase, IOExecutor, WorkflowFileIndex, read_json, read_json_hashed
+from query_cache import QueryCache, FileHashCache
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -36,22 +41,95 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize database
+# Initialize database; handlers query it through the bounded I/O executor and the result cache
 db = WorkflowDatabase()
+io_executor = IOExecutor()
+query_cache = QueryCache()
+async_db = AsyncWorkflowDatabase(db, io_executor, query_cache)
+
+# Where workflow files may live, in lookup order (local development, cwd, Vercel)
+WORKFLOW_ROOTS = [
+    Path(__file__).parent / "workflows",
+    Path.cwd() / "workflows",
+    Path("/var/task/workflows"),
+    Path("/tmp/workflows"),
+]
+workflow_files = WorkflowFileIndex(WORKFLOW_ROOTS, generation=db.index_generation)
+
+# Mermaid text per workflow, generated on first request and kept until its file_hash changes
+diagram_cache = FileHashCache()
+
+# Stop event for the optional in-process workflow watcher
+watch_stop_event = None
+
+# Cache-Control for a URL pinned to the current version with ?v= (its content can never change)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+# Bump when generate_mermaid_diagram or the download rewrite changes what is served for an
+# unchanged file; with workflow_svg.RENDER_VERSION it is part of every ETag and ?v= version
+RESPONSE_VERSION = 1
+
+# GET routes whose responses change only when the index generation does
+GENERATION_KEYED_PATHS = ("/api/stats", "/api/workflows", "/api/integrations", "/api/suggest", "/api/categories")
+GENERATION_KEYED_PREFIXES = ("/api/workflows/category/",)
+
+@app.middleware("http")
+async def generation_etags(request: Request, call_next):
+    """ETag search, stats and category responses with generation_version().
+    
+    The route always runs, so a matching If-None-Match becomes a 304 only for a
+    response that would have been a 200 (an unknown category is still a 404);
+    repeat queries are answered from the query cache.
+    """
+    path = request.url.path
+    if request.method != "GET" or not (path in GENERATION_KEYED_PATHS or path.startswith(GENERATION_KEYED_PREFIXES)):
+        return await call_next(request)
+    version = await generation_version()
+    headers = cache_headers(request, version, f'"{version}"')
+    response = await call_next(request)
+    if response.status_code != 200:
+        return response
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return response
 
 # Startup function to verify database
 @app.on_event("startup")
 async def startup_event():
     """Verify database connectivity on startup."""
+    global watch_stop_event
     try:
-        stats = db.get_stats()
+        stats = await async_db.get_stats()
         if stats['total'] == 0:
             print("⚠️  Warning: No workflows found in database. Run indexing first.")
         else:
             print(f"✅ Database connected: {stats['total']} workflows indexed")
+            if await io_executor.run(db.needs_reindex):
+                print("⚠️  Warning: Index schema or renderer changed. Run indexing to rebuild diagrams.")
     except Exception as e:
         print(f"❌ Database connection failed: {e}")
         raise
+    
+    # Build the type-ahead index and the file path index now rather than on first use
+    await async_db.suggest("")
+    await io_executor.run(workflow_files.lookup, "")
+    
+    # Keep the index fresh as workflow files change (Linux only)
+    if os.environ.get('WORKFLOW_WATCH', '').lower() in ('1', 'true', 'yes'):
+        try:
+            from workflow_watcher import start_watch_thread
+            watch_stop_event = start_watch_thread(db)
+        except Exception as e:
+            print(f"⚠️  Warning: Workflow watcher not started: {e}")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the workflow watcher if it is running and close database connections."""
+    if watch_stop_event is not None:
+        watch_stop_event.set()
+    io_executor.shutdown()
+    db.close()
 
 # Response models
 class WorkflowSummary(BaseModel):
@@ -65,8 +143,14 @@ class WorkflowSummary(BaseModel):
     node_count: int = 0
     integrations: List[str] = []
     tags: List[str] = []
+    category: str = "Uncategorized"
     created_at: Optional[str] = None
     updated_at: Optional[str] = None
+    file_hash: Optional[str] = None
+    # Versioned (immutable) URLs; clients without svg_url fall back to Mermaid
+    svg_url: Optional[str] = None
+    thumbnail_url: Optional[str] = None
+    download_url: Optional[str] = None
     
     class Config:
         # Allow conversion of int to bool for active field
@@ -82,12 +166,16 @@ class WorkflowSummary(BaseModel):
 
 class SearchResponse(BaseModel):
     workflows: List[WorkflowSummary]
-    total: int
+    total: Optional[int]  # None with count=none
     page: int
     per_page: int
-    pages: int
+    pages: Optional[int]
     query: str
     filters: Dict[str, Any]
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    total_mode: str = "exact"  # exact, cached, estimate or none
+    facets: Optional[Dict[str, Dict[str, int]]] = None
 
 class StatsResponse(BaseModel):
     total: int
@@ -100,7 +188,7 @@ class StatsResponse(BaseModel):
     last_indexed: str
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Serve the main documentation page."""
     static_dir = Path("static")
     index_file = static_dir / "index.html"
@@ -112,18 +200,30 @@ async def root():
         <p>Current directory: """ + str(Path.cwd()) + """</p>
         </body></html>
         """)
-    return FileResponse(str(index_file))
+    headers = file_cache_headers(index_file)
+    if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(str(index_file), headers=headers)
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
     return {"status": "healthy", "message": "N8N Workflow API is running"}
 
+@app.get("/api/metrics")
+async def get_metrics():
+    """I/O executor queue depth and timing, and query result and diagram cache counters."""
+    return {
+        "io_executor": io_executor.metrics(),
+        "query_cache": async_db.cache_metrics(),
+        "diagram_cache": diagram_cache.metrics()
+    }
+
 @app.get("/api/stats", response_model=StatsResponse)
 async def get_stats():
     """Get workflow database statistics."""
     try:
-        stats = db.get_stats()
+        stats = await async_db.get_stats()
         return StatsResponse(**stats)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching stats: {str(e)}")
@@ -139,8 +239,7 @@ async def get_vercel_data_debug():
             vercel_data_path = Path(__file__).parent.parent / "vercel_workflows.json"
         
         if vercel_data_path.exists():
-            with open(vercel_data_path, 'r', encoding='utf-8') as f:
-                vercel_data = json.load(f)
+            vercel_data = await io_executor.run(read_json, vercel_data_path)
             
             # Find Stock Q&A Workflow specifically
             stock_workflow = None
@@ -183,21 +282,43 @@ async def search_workflows(
     trigger: str = Query("all", description="Filter by trigger type"),
     complexity: str = Query("all", description="Filter by complexity"),
     active_only: bool = Query(False, description="Show only active workflows"),
-    page: int = Query(1, ge=1, description="Page number"),
-    per_page: int = Query(20, ge=1, le=100, description="Items per page")
+    node_type: str = Query("", description="Only workflows using this node type, e.g. n8n-nodes-base.slack"),
+    integration: str = Query("", description="Only workflows using this integration, e.g. Slack"),
+    tag: str = Query("", description="Only workflows with this tag"),
+    category: str = Query("all", description="Filter by category (see /api/categories)"),
+    page: int = Query(1, ge=1, description="Page number (ignored when cursor is given)"),
+    per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page; constant cost at any depth"),
+    count: str = Query("exact", pattern="^(exact|estimate|none)$",
+                       description="How to compute total: exact, estimate (cheap, approximate) or none"),
+    facets: str = Query("", description="Comma-separated facet counts to include: trigger,complexity,category,integration")
 ):
-    """Search and filter workflows with pagination."""
+    """Search and filter workflows with page/offset or cursor pagination."""
     try:
         offset = (page - 1) * per_page
         
-        workflows, total = db.search_workflows(
-            query=q,
-            trigger_filter=trigger,
-            complexity_filter=complexity,
-            active_only=active_only,
-            limit=per_page,
-            offset=offset
-        )
+        try:
+            result = await async_db.search_workflows_page(
+                query=q,
+                trigger_filter=trigger,
+                complexity_filter=complexity,
+                active_only=active_only,
+                limit=per_page,
+                offset=offset,
+                node_type=node_type,
+                integration=integration,
+                tag=tag,
+                category=category,
+                cursor=cursor,
+                count=count,
+                facets=tuple(facet.strip() for facet in facets.split(",") if facet.strip())
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        workflows, total = result['workflows'], result['total']
+        
+        # The cursor resumes right after the last row of this page
+        next_cursor = encode_cursor(workflows[-1], bool(q.strip())) if result['has_more'] else None
         
         # Convert to Pydantic models with error handling
         workflow_summaries = []
@@ -215,8 +336,11 @@ async def search_workflows(
                     'node_count': workflow.get('node_count', 0),
                     'integrations': workflow.get('integrations', []),
                     'tags': workflow.get('tags', []),
+                    'category': workflow.get('category', 'Uncategorized'),
                     'created_at': workflow.get('created_at'),
-                    'updated_at': workflow.get('updated_at')
+                    'updated_at': workflow.get('updated_at'),
+                    'file_hash': workflow.get('file_hash'),
+                    **resource_urls(workflow)
                 }
                 workflow_summaries.append(WorkflowSummary(**clean_workflow))
             except Exception as e:
@@ -224,7 +348,7 @@ async def search_workflows(
                 # Continue with other workflows instead of failing completely
                 continue
         
-        pages = (total + per_page - 1) // per_page  # Ceiling division
+        pages = (total + per_page - 1) // per_page if total is not None else None  # Ceiling division
         
         return SearchResponse(
             workflows=workflow_summaries,
@@ -236,27 +360,43 @@ async def search_workflows(
             filters={
                 "trigger": trigger,
                 "complexity": complexity,
-                "active_only": active_only
-            }
+                "active_only": active_only,
+                "node_type": node_type,
+                "integration": integration,
+                "tag": tag,
+                "category": category
+            },
+            next_cursor=next_cursor,
+            has_more=result['has_more'],
+            total_mode=result['total_mode'],
+            facets=result.get('facets')
         )
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching workflows: {str(e)}")
 
 @app.get("/api/workflows/{filename}")
-async def get_workflow_detail(filename: str):
-    """Get detailed workflow information including raw JSON."""
+async def get_workflow_detail(filename: str, request: Request):
+    """Get detailed workflow information including raw JSON.
+    
+    The ETag combines the file_hash with the index generation, since the
+    metadata (e.g. category) can change without the file changing.
+    """
     try:
         print(f"DEBUG: Requested workflow filename: {filename} - Vercel deployment test")
         
-        # Get workflow metadata from database
-        workflows, _ = db.search_workflows(f'filename:"{filename}"', limit=1)
-        print(f"DEBUG: Database search returned {len(workflows)} workflows")
+        # Get workflow metadata from database (filename is a UNIQUE key)
+        workflow_meta = await async_db.get_by_filename(filename)
         
-        if not workflows:
+        if workflow_meta is None:
             print(f"DEBUG: Workflow {filename} not found in database")
             raise HTTPException(status_code=404, detail="Workflow not found in database")
         
-        workflow_meta = workflows[0]
+        version = await generation_version()
+        headers = cache_headers(request, version, f'"detail-{workflow_meta.get("file_hash")}-{version}"')
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
         
         # Try to load from filesystem first - check API directory for workflows
         raw_json = None
@@ -272,8 +412,7 @@ async def get_workflow_detail(filename: str):
             
             if vercel_data_path.exists():
                 print(f"Loading from vercel_workflows.json: {vercel_data_path}")
-                with open(vercel_data_path, 'r', encoding='utf-8') as f:
-                    vercel_data = json.load(f)
+                vercel_data = await io_executor.run(read_json, vercel_data_path)
                 
                 # Find the workflow in the vercel data
                 for workflow in vercel_data.get('workflows', []):
@@ -308,89 +447,64 @@ async def get_workflow_detail(filename: str):
             if api_file_path.exists():
                 try:
                     print(f"Found workflow file directly in API directory: {api_file_path}")
-                    with open(api_file_path, 'r', encoding='utf-8') as f:
-                        raw_json = json.load(f)
+                    raw_json = await io_executor.run(read_json, api_file_path)
                 except Exception as e:
                     print(f"Error loading direct file: {e}")
             
-            # If still not found, try workflows subdirectory
+            # If still not found, try the workflows directories
             if raw_json is None:
-                api_workflows_path = Path(__file__).parent / "workflows"
-                if api_workflows_path.exists():
-                    try:
-                        json_files = list(api_workflows_path.rglob("*.json"))
-                        matching_files = [f for f in json_files if f.name == filename]
-                        if matching_files:
-                            file_path = matching_files[0]
-                            print(f"Found workflow file in API directory: {file_path}")
-                            with open(file_path, 'r', encoding='utf-8') as f:
-                                raw_json = json.load(f)
-                        else:
-                            print(f"Workflow file not found in API directory: {filename}")
-                    except Exception as e:
-                        print(f"Error loading workflow from API directory: {e}")
-        
-        # Continue with filesystem fallback if vercel data didn't work
-        if raw_json is None:
-            try:
-                json_files = list(api_workflows_path.rglob("*.json"))
-                matching_files = [f for f in json_files if f.name == filename]
-                if matching_files:
-                    file_path = matching_files[0]
-                    print(f"Found workflow file in workflows subdirectory: {file_path}")
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        raw_json = json.load(f)
-                else:
-                    print(f"Workflow file not found in workflows subdirectory: {filename}")
-            except Exception as e:
-                print(f"Error loading workflow from workflows subdirectory: {e}")
+                try:
+                    file_path = await io_executor.run(workflow_files.lookup, filename)
+                    if file_path is not None:
+                        print(f"Found workflow file in workflows directory: {file_path}")
+                        raw_json = await io_executor.run(read_json, file_path)
+                    else:
+                        print(f"Workflow file not found in workflows directories: {filename}")
+                except Exception as e:
+                    print(f"Error loading workflow from workflows directory: {e}")
         
         if raw_json is None:
             raise HTTPException(status_code=404, detail=f"Workflow file '{filename}' not found")
         
-        return {
+        return JSONResponse(content={
             "metadata": workflow_meta,
             "raw_json": raw_json
-        }
+        }, headers=headers)
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading workflow: {str(e)}")
 
 @app.get("/api/workflows/{filename}/download")
-async def download_workflow(filename: str):
-    """Download workflow JSON file with proper n8n structure."""
+async def download_workflow(filename: str, request: Request):
+    """Download workflow JSON file with proper n8n structure.
+    
+    ETagged by file_hash: a matching If-None-Match is a 304 without reading
+    the file, and versioned URLs (see workflow_version) are cached as immutable.
+    """
     try:
-        # Use robust path resolution for both local and Vercel
-        possible_paths = [
-            Path(__file__).parent / "workflows",  # Local development
-            Path.cwd() / "workflows",              # Current working directory
-            Path("/var/task/workflows"),           # Vercel serverless
-            Path("/tmp/workflows"),                # Vercel temp directory
-        ]
+        workflow_meta = await async_db.get_by_filename(filename)
+        if workflow_meta is None:
+            raise HTTPException(status_code=404, detail=f"Workflow '{filename}' not found in database")
         
-        file_path = None
-        for workflows_path in possible_paths:
-            if workflows_path.exists():
-                try:
-                    json_files = list(workflows_path.rglob("*.json"))
-                    matching_files = [f for f in json_files if f.name == filename]
-                    if matching_files:
-                        file_path = matching_files[0]
-                        print(f"Found workflow file for download at: {file_path}")
-                        break
-                except Exception as e:
-                    print(f"Error searching in {workflows_path}: {e}")
-                    continue
+        file_hash = workflow_meta.get('file_hash')
+        headers = workflow_cache_headers(request, "download", file_hash) if file_hash else {"Cache-Control": "no-cache"}
+        if file_hash and etag_matches(request.headers.get('if-none-match'), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        
+        # Filename -> path index over the local and Vercel workflow directories
+        file_path = await io_executor.run(workflow_files.lookup, filename)
+        if file_path is not None:
+            print(f"Found workflow file for download at: {file_path}")
         
         if not file_path or not os.path.exists(file_path):
             print(f"Warning: Download requested for missing file: {filename}")
-            print(f"Tried paths: {[str(p) for p in possible_paths]}")
+            print(f"Tried paths: {[str(p) for p in WORKFLOW_ROOTS]}")
             raise HTTPException(status_code=404, detail=f"Workflow file '{filename}' not found on filesystem")
         
         # Read the workflow file
-        with open(file_path, 'r', encoding='utf-8') as f:
-            workflow_data = json.load(f)
+        workflow_data = await io_executor.run(read_json, file_path)
+        headers["Last-Modified"] = formatdate(os.path.getmtime(file_path), usegmt=True)
         
         print(f"DEBUG: Loaded workflow data type: {type(workflow_data)}")
         print(f"DEBUG: Original workflow data keys: {list(workflow_data.keys())}")
@@ -407,8 +521,8 @@ async def download_workflow(filename: str):
             print(f"DEBUG: Workflow already has id: {workflow_data['id']}")
         
         if 'name' not in workflow_data:
-            # Use filename as name (remove .json extension)
-            workflow_name = filename.replace('.json', '').replace('_', ' ')
+            # Use the indexed name (derived from the filename when the file has none)
+            workflow_name = workflow_meta['name']
             workflow_data['name'] = workflow_name
             print(f"DEBUG: Added missing name: {workflow_name}")
         else:
@@ -422,9 +536,12 @@ async def download_workflow(filename: str):
             content=workflow_data,
             headers={
                 "Content-Disposition": f'attachment; filename="{filename}"',
-                "Content-Type": "application/json"
+                "Content-Type": "application/json",
+                **headers
             }
         )
+    except HTTPException:
+        raise
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"Workflow file '{filename}' not found")
     except Exception as e:
@@ -432,46 +549,53 @@ async def download_workflow(filename: str):
         raise HTTPException(status_code=500, detail=f"Error downloading workflow: {str(e)}")
 
 @app.get("/api/workflows/{filename}/diagram")
-async def get_workflow_diagram(filename: str):
-    """Get Mermaid diagram code for workflow visualization."""
+async def get_workflow_diagram(filename: str, request: Request):
+    """Get Mermaid diagram code for workflow visualization.
+    
+    Diagrams are generated on first request and kept per file_hash; the
+    hash is also the ETag, so a repeat view is a 304 without reading the file,
+    and versioned URLs (see workflow_version) are cached as immutable. A
+    generated diagram is keyed by the hash of the bytes actually read, so a
+    file edited since the last index run is never cached or revalidated
+    under its old hash.
+    """
     try:
-        # Use robust path resolution for both local and Vercel
-        possible_paths = [
-            Path(__file__).parent / "workflows",  # Local development
-            Path.cwd() / "workflows",              # Current working directory
-            Path("/var/task/workflows"),           # Vercel serverless
-            Path("/tmp/workflows"),                # Vercel temp directory
-        ]
-        
-        file_path = None
-        for workflows_path in possible_paths:
-            if workflows_path.exists():
-                try:
-                    json_files = list(workflows_path.rglob("*.json"))
-                    matching_files = [f for f in json_files if f.name == filename]
-                    if matching_files:
-                        file_path = matching_files[0]
-                        print(f'Loading diagram from: {file_path}')
-                        break
-                except Exception as e:
-                    print(f"Error searching in {workflows_path}: {e}")
-                    continue
-        
-        if not file_path or not file_path.exists():
-            print(f"Warning: Diagram requested for missing file: {filename}")
-            print(f"Tried paths: {[str(p) for p in possible_paths]}")
-            raise HTTPException(status_code=404, detail=f"Workflow file '{filename}' not found on filesystem")
-        
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        nodes = data.get('nodes', [])
-        connections = data.get('connections', {})
-        
-        # Generate Mermaid diagram
-        diagram = generate_mermaid_diagram(nodes, connections)
-        
-        return {"diagram": diagram}
+        workflow_meta = await async_db.get_by_filename(filename)
+        if workflow_meta is None:
+            raise HTTPException(status_code=404, detail=f"Workflow '{filename}' not found in database")
+        
+        file_hash = workflow_meta.get('file_hash')
+        headers = workflow_cache_headers(request, "mermaid", file_hash) if file_hash else {"Cache-Control": "no-cache"}
+        if file_hash and etag_matches(request.headers.get('if-none-match'), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        
+        diagram = diagram_cache.get(filename, file_hash) if file_hash else None
+        if diagram is None:
+            # Filename -> path index over the local and Vercel workflow directories
+            file_path = await io_executor.run(workflow_files.lookup, filename)
+            if file_path is not None:
+                print(f'Loading diagram from: {file_path}')
+            
+            if not file_path or not file_path.exists():
+                print(f"Warning: Diagram requested for missing file: {filename}")
+                print(f"Tried paths: {[str(p) for p in WORKFLOW_ROOTS]}")
+                raise HTTPException(status_code=404, detail=f"Workflow file '{filename}' not found on filesystem")
+            
+            data, read_hash = await io_executor.run(read_json_hashed, file_path)
+            
+            nodes = data.get('nodes', [])
+            connections = data.get('connections', {})
+            
+            # Generate Mermaid diagram
+            diagram = generate_mermaid_diagram(nodes, connections)
+            diagram_cache.put(filename, read_hash, diagram)
+            if read_hash != file_hash:
+                # Edited since it was indexed: describe what was served, not the index
+                headers = workflow_cache_headers(request, "mermaid", read_hash)
+                if etag_matches(request.headers.get('if-none-match'), headers["ETag"]):
+                    return Response(status_code=304, headers=headers)
+        
+        return JSONResponse(content={"diagram": diagram}, headers=headers)
     except HTTPException:
         raise
     except FileNotFoundError:
@@ -483,6 +607,82 @@ async def get_workflow_diagram(filename: str):
         print(f"Error generating diagram for {filename}: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error generating diagram: {str(e)}")
 
+@app.get("/api/workflows/{filename}/svg")
+async def get_workflow_svg(filename: str, request: Request):
+    """Workflow diagram as a static SVG, rendered at index time from n8n node positions."""
+    return await svg_response(filename, request, thumbnail=False)
+
+@app.get("/api/workflows/{filename}/thumbnail.svg")
+async def get_workflow_thumbnail(filename: str, request: Request):
+    """Small label-free SVG of the workflow graph for result cards."""
+    return await svg_response(filename, request, thumbnail=True)
+
+async def svg_response(filename: str, request: Request, thumbnail: bool) -> Response:
+    """Serve a stored SVG with a file_hash ETag; a matching If-None-Match gets a 304
+    and versioned URLs (see workflow_version) are cached as immutable."""
+    try:
+        stored = await async_db.get_svg(filename, thumbnail=thumbnail)
+        if stored is None and await async_db.get_by_filename(filename) is None:
+            raise HTTPException(status_code=404, detail=f"Workflow '{filename}' not found")
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error loading diagram: {str(e)}")
+    if stored is None:
+        raise HTTPException(status_code=404, detail=f"No diagram for workflow '{filename}' (reindex to render one)")
+    svg, file_hash = stored
+    headers = {"Cache-Control": "no-cache"}
+    if file_hash:
+        headers = workflow_cache_headers(request, "thumb" if thumbnail else "svg", file_hash)
+        if etag_matches(request.headers.get('if-none-match'), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+    return Response(content=svg, media_type="image/svg+xml", headers=headers)
+
+def resource_urls(workflow: Dict[str, Any]) -> Dict[str, str]:
+    """svg_url, thumbnail_url and download_url for a search result, pinned to its current version."""
+    path = f"/api/workflows/{quote(workflow.get('filename', ''))}"
+    version = f"?v={workflow_version(workflow['file_hash'])}" if workflow.get('file_hash') else ""
+    return {
+        "svg_url": f"{path}/svg{version}",
+        "thumbnail_url": f"{path}/thumbnail.svg{version}",
+        "download_url": f"{path}/download{version}"
+    }
+
+def workflow_version(file_hash: str) -> str:
+    """Version of a per-workflow response: the file plus the code that renders it."""
+    return f"{file_hash}-r{workflow_svg.RENDER_VERSION}.{RESPONSE_VERSION}"
+
+async def generation_version() -> str:
+    """Version of a generation-keyed response: the index plus the code that renders it."""
+    return f"{await async_db.version()}-r{workflow_svg.RENDER_VERSION}.{RESPONSE_VERSION}"
+
+def workflow_cache_headers(request: Request, kind: str, file_hash: str) -> Dict[str, str]:
+    """cache_headers for a per-workflow response; ?v= must name workflow_version(file_hash)."""
+    version = workflow_version(file_hash)
+    return cache_headers(request, version, f'"{kind}-{version}"')
+
+def cache_headers(request: Request, version: str, etag: str) -> Dict[str, str]:
+    """ETag plus Cache-Control: immutable when the URL pins `version` with ?v=, otherwise revalidate."""
+    pinned = request.query_params.get("v") == version
+    return {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL if pinned else "no-cache"}
+
+def file_cache_headers(path: Path) -> Dict[str, str]:
+    """Revalidation headers for a file served as-is, from its mtime and size."""
+    st = path.stat()
+    return {
+        "ETag": f'"{st.st_mtime_ns:x}-{st.st_size:x}"',
+        "Last-Modified": formatdate(st.st_mtime, usegmt=True),
+        "Cache-Control": "no-cache"
+    }
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header names `etag` (weak comparison, as for GET)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
 def generate_mermaid_diagram(nodes: List[Dict], connections: Dict) -> str:
     """Generate Mermaid.js flowchart code from workflow nodes and connections."""
     if not nodes:
@@ -561,31 +761,57 @@ async def reindex_workflows(background_tasks: BackgroundTasks, force: bool = Fal
     return {"message": "Reindexing started in background"}
 
 @app.get("/api/integrations")
-async def get_integrations():
-    """Get list of all unique integrations."""
+async def get_integrations(
+    sort: str = Query("count", pattern="^(count|name)$", description="Order by workflow count or by name"),
+    page: int = Query(1, ge=1, description="Page number"),
+    per_page: int = Query(50, ge=1, le=500, description="Integrations per page"),
+    top: int = Query(3, ge=0, le=20, description="Newest workflows listed per integration")
+):
+    """List integrations with their workflow counts, trigger mix and top workflows."""
     try:
-        stats = db.get_stats()
-        # For now, return basic info. Could be enhanced to return detailed integration stats
-        return {"integrations": [], "count": stats['unique_integrations']}
+        offset = (page - 1) * per_page
+        integrations, total = await async_db.get_integrations(
+            sort=sort, limit=per_page, offset=offset, top=top
+        )
+        return {
+            "integrations": integrations,
+            "count": total,
+            "page": page,
+            "per_page": per_page,
+            "pages": (total + per_page - 1) // per_page,
+            "sort": sort
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching integrations: {str(e)}")
 
+@app.get("/api/suggest")
+async def suggest(
+    q: str = Query("", max_length=100, description="Prefix typed so far"),
+    limit: int = Query(8, ge=1, le=20, description="Completions per group")
+):
+    """Type-ahead completions for workflow names, integrations and node types, most used first."""
+    try:
+        suggestions = await async_db.suggest(q, limit=limit)
+        return {"query": q, **suggestions}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error fetching suggestions: {str(e)}")
+
 @app.get("/api/categories")
 async def get_categories():
-    """Get available workflow categories for filtering."""
+    """Get available workflow categories for filtering, with indexed workflow counts."""
     try:
+        counts = await async_db.get_category_counts()
+        
         # Try to load from the generated unique categories file
         categories_file = Path("context/unique_categories.json")
         if categories_file.exists():
-            with open(categories_file, 'r', encoding='utf-8') as f:
-                categories = json.load(f)
-            return {"categories": categories}
+            categories = await io_executor.run(read_json, categories_file)
+            return {"categories": categories, "counts": counts}
         else:
             # Fallback: extract categories from search_categories.json
             search_categories_file = Path("context/search_categories.json")
             if search_categories_file.exists():
-                with open(search_categories_file, 'r', encoding='utf-8') as f:
-                    search_data = json.load(f)
+                search_data = await io_executor.run(read_json, search_categories_file)
                 
                 unique_categories = set()
                 for item in search_data:
@@ -595,25 +821,28 @@ async def get_categories():
                         unique_categories.add('Uncategorized')
                 
                 categories = sorted(list(unique_categories))
-                return {"categories": categories}
+                return {"categories": categories, "counts": counts}
             else:
                 # Last resort: return basic categories
-                return {"categories": ["Uncategorized"]}
+                return {"categories": ["Uncategorized"], "counts": counts}
                 
     except Exception as e:
         print(f"Error loading categories: {e}")
         raise HTTPException(status_code=500, detail=f"Error fetching categories: {str(e)}")
 
 @app.get("/api/category-mappings")
-async def get_category_mappings():
-    """Get filename to category mappings for client-side filtering."""
+async def get_category_mappings(request: Request):
+    """Get filename to category mappings (the web UI now filters with /api/workflows?category=)."""
     try:
         search_categories_file = Path("context/search_categories.json")
         if not search_categories_file.exists():
             return {"mappings": {}}
         
-        with open(search_categories_file, 'r', encoding='utf-8') as f:
-            search_data = json.load(f)
+        headers = file_cache_headers(search_categories_file)
+        if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+        
+        search_data = await io_executor.run(read_json, search_categories_file)
         
         # Convert to a simple filename -> category mapping
         mappings = {}
@@ -623,7 +852,7 @@ async def get_category_mappings():
             if filename:
                 mappings[filename] = category
         
-        return {"mappings": mappings}
+        return JSONResponse(content={"mappings": mappings}, headers=headers)
         
     except Exception as e:
         print(f"Error loading category mappings: {e}")
@@ -639,7 +868,7 @@ async def search_workflows_by_category(
     try:
         offset = (page - 1) * per_page
         
-        workflows, total = db.search_by_category(
+        workflows, total = await async_db.search_by_category(
             category=category,
             limit=per_page,
             offset=offset
@@ -660,8 +889,11 @@ async def search_workflows_by_category(
                     'node_count': workflow.get('node_count', 0),
                     'integrations': workflow.get('integrations', []),
                     'tags': workflow.get('tags', []),
+                    'category': workflow.get('category', 'Uncategorized'),
                     'created_at': workflow.get('created_at'),
-                    'updated_at': workflow.get('updated_at')
+                    'updated_at': workflow.get('updated_at'),
+                    'file_hash': workflow.get('file_hash'),
+                    **resource_urls(workflow)
                 }
                 workflow_summaries.append(WorkflowSummary(**clean_workflow))
             except Exception as e:
@@ -677,7 +909,8 @@ async def search_workflows_by_category(
             per_page=per_page,
             pages=pages,
             query=f"category:{category}",
-            filters={"category": category}
+            filters={"category": category},
+            has_more=offset + len(workflows) < total
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error searching by category: {str(e)}")
@@ -704,11 +937,14 @@ def create_static_directory():
     static_dir.mkdir(exist_ok=True)
     return static_dir
 
-def run_server(host: str = "127.0.0.1", port: int = 8000, reload: bool = False):
+def run_server(host: str = "127.0.0.1", port: int = 8000, reload: bool = False, watch: bool = False):
     """Run the FastAPI server."""
     # Ensure static directory exists
     create_static_directory()
     
+    if watch:
+        os.environ['WORKFLOW_WATCH'] = '1'
+    
     # Debug: Check database connectivity
     try:
         stats = db.get_stats()
@@ -717,6 +953,9 @@ def run_server(host: str = "127.0.0.1", port: int = 8000, reload: bool = False):
             print("🔄 Database is empty. Indexing workflows...")
             db.index_all_workflows()
             stats = db.get_stats()
+        elif db.needs_reindex():
+            print("🔄 Index schema or renderer changed. Reindexing workflows...")
+            db.index_all_workflows()
     except Exception as e:
         print(f"❌ Database error: {e}")
         print("🔄 Attempting to create and index database...")
@@ -757,7 +996,8 @@ if __name__ == "__main__":
     parser.add_argument('--host', default='127.0.0.1', help='Host to bind to')
     parser.add_argument('--port', type=int, default=8000, help='Port to bind to')
     parser.add_argument('--reload', action='store_true', help='Enable auto-reload for development')
+    parser.add_argument('--watch', action='store_true', help='Reindex workflow files as they change (Linux inotify)')
     
     args = parser.parse_args()
     
-    run_server(host=args.host, port=args.port, reload=args.reload)
\ No newline at end of file
+    run_server(host=args.host, port=args.port, reload=args.reload, watch=args.watch)
\ No newline at end of file
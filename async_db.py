@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+Async data access for the FastAPI server.
+Blocking SQLite queries and workflow file reads run on a bounded thread pool so
+the event loop keeps serving other clients while they wait.
+"""
+
+import os
+import json
+import time
+import hashlib
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from query_cache import QueryCache, call_key, result_size
+from workflow_db import WorkflowDatabase
+
+# Worker threads for blocking I/O; each thread keeps its own SQLite read connection
+DEFAULT_IO_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+# Seconds a generation read is reused before a refresh is sent to the executor,
+# i.e. roughly how long cached results can outlive a write
+GENERATION_CHECK_INTERVAL = 0.05
+
+
+def read_json(path) -> Any:
+    """Load a JSON file (blocking)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_json_hashed(path) -> Tuple[Any, str]:
+    """Load a JSON file along with the MD5 of its bytes, as stored in workflows.file_hash (blocking)."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return json.loads(raw), hashlib.md5(raw).hexdigest()
+
+
+class WorkflowFileIndex:
+    """Filename -> path map over the workflow directories, rebuilt when the index generation changes.
+
+    Roots are searched in order and the first file with a given name wins.
+    Lookups are a dict read; a rebuild walks the roots once (blocking).
+    """
+
+    def __init__(self, roots: Iterable[Path], generation: Optional[Callable[[], int]] = None):
+        self.roots = list(roots)
+        self._generation = generation
+        self._paths: Optional[Dict[str, Path]] = None
+        self._built_for = None
+        self._lock = threading.Lock()
+
+    def _current(self) -> Optional[int]:
+        return self._generation() if self._generation is not None else None
+
+    def _scan(self) -> Dict[str, Path]:
+        paths = {}
+        seen_roots = set()
+        for root in self.roots:
+            if not root.is_dir() or root.resolve() in seen_roots:
+                continue
+            seen_roots.add(root.resolve())
+            for dirpath, _, files in os.walk(root, onerror=lambda e: print(f"Error searching in {root}: {e}")):
+                for name in files:
+                    if name.endswith('.json'):
+                        paths.setdefault(name, Path(dirpath) / name)
+        return paths
+
+    def lookup(self, filename: str) -> Optional[Path]:
+        """Path of the workflow file called `filename`, or None (blocking on a rebuild)."""
+        generation = self._current()
+        if self._paths is None or self._built_for != generation:
+            with self._lock:
+                if self._paths is None or self._built_for != generation:
+                    self._paths = self._scan()
+                    self._built_for = generation
+        return self._paths.get(filename)
+
+
+class IOExecutor:
+    """Bounded thread pool for blocking work, with queue-depth and latency counters."""
+
+    def __init__(self, max_workers: Optional[int] = None):
+        if max_workers is None:
+            max_workers = int(os.environ.get('WORKFLOW_IO_WORKERS', DEFAULT_IO_WORKERS))
+        self.max_workers = max(1, max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='workflow-io')
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._max_queued = 0
+        self._completed = 0
+        self._failed = 0
+        self._wait_seconds = 0.0
+        self._run_seconds = 0.0
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run fn(*args, **kwargs) on the pool and await its result."""
+        submitted = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+            self._max_queued = max(self._max_queued, self._queued)
+
+        def job():
+            started = time.perf_counter()
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._wait_seconds += started - submitted
+            ok = False
+            try:
+                result = fn(*args, **kwargs)
+                ok = True
+                return result
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+                    self._failed += not ok
+                    self._run_seconds += time.perf_counter() - started
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, job)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Snapshot of pool size, queue depth and average wait/run times."""
+        with self._lock:
+            completed = self._completed
+            return {
+                'max_workers': self.max_workers,
+                'queued': self._queued,
+                'running': self._running,
+                'max_queued': self._max_queued,
+                'completed': completed,
+                'failed': self._failed,
+                'avg_wait_ms': round(self._wait_seconds * 1000 / completed, 3) if completed else 0.0,
+                'avg_run_ms': round(self._run_seconds * 1000 / completed, 3) if completed else 0.0,
+            }
+
+    def shutdown(self):
+        """Stop accepting work and wait for running jobs."""
+        self._executor.shutdown(wait=True)
+
+
+class AsyncWorkflowDatabase:
+    """Awaitable WorkflowDatabase queries, each run on the I/O executor.
+
+    With a QueryCache, results are served from memory until the index
+    generation changes, and concurrent identical misses share one query.
+    The generation itself is read on the executor too, at most once per
+    GENERATION_CHECK_INTERVAL; the event loop never touches SQLite.
+    """
+
+    def __init__(self, db: WorkflowDatabase, executor: IOExecutor, cache: Optional[QueryCache] = None):
+        self.db = db
+        self.executor = executor
+        self.cache = cache
+        self._inflight = {}
+        self.coalesced = 0
+        self._generation = None
+        self._database_id = 0
+        self._generation_read_at = 0.0
+        self._generation_read = None
+
+    async def generation(self) -> int:
+        """The index generation, re-read in the background once GENERATION_CHECK_INTERVAL has passed.
+
+        Only the first call waits for the read; later ones get the last
+        value while a refresh runs, so callers never queue behind the executor.
+        """
+        stale = time.monotonic() - self._generation_read_at >= GENERATION_CHECK_INTERVAL
+        if (self._generation is None or stale) and self._generation_read is None:
+            # Concurrent callers share one read
+            self._generation_read = asyncio.ensure_future(self._read_generation())
+        if self._generation is None:
+            return await asyncio.shield(self._generation_read)
+        return self._generation
+
+    async def version(self) -> str:
+        """The generation qualified by the database id, for ETags and ?v= URLs."""
+        generation = await self.generation()
+        return f"{self._database_id:x}-g{generation}"
+
+    async def _read_generation(self) -> int:
+        try:
+            self._database_id, generation = await self.executor.run(self.db.index_version)
+            self._generation, self._generation_read_at = generation, time.monotonic()
+            return generation
+        finally:
+            self._generation_read = None
+
+    async def _query(self, fn: Callable, *args, **kwargs) -> Any:
+        if self.cache is None:
+            return await self.executor.run(fn, *args, **kwargs)
+        key = call_key(fn, args, kwargs)
+        generation = await self.generation()
+        value = self.cache.get(key, generation)
+        if value is not None:
+            return value
+
+        pending = self._inflight.get((generation, key))
+        if pending is not None:
+            self.coalesced += 1
+            return await asyncio.shield(pending)
+
+        def run_and_size():
+            # Sized on the executor too: serializing a large page would block the event loop
+            result = fn(*args, **kwargs)
+            return result, result_size(result)
+
+        async def load():
+            result, size = await self.executor.run(run_and_size)
+            self.cache.put(key, generation, result, size=size)
+            return result
+
+        task = asyncio.ensure_future(load())
+        self._inflight[(generation, key)] = task
+        task.add_done_callback(lambda _: self._inflight.pop((generation, key), None))
+        return await asyncio.shield(task)
+
+    def cache_metrics(self) -> Optional[Dict[str, Any]]:
+        if self.cache is None:
+            return None
+        return dict(self.cache.metrics(), coalesced=self.coalesced)
+
+    async def search_workflows(self, *args, **kwargs) -> Tuple[List[Dict], int]:
+        return await self._query(self.db.search_workflows, *args, **kwargs)
+
+    async def search_workflows_page(self, *args, **kwargs) -> Dict[str, Any]:
+        return await self._query(self.db.search_workflows_page, *args, **kwargs)
+
+    async def search_by_category(self, *args, **kwargs) -> Tuple[List[Dict], int]:
+        return await self._query(self.db.search_by_category, *args, **kwargs)
+
+    async def get_by_filename(self, filename: str) -> Optional[Dict[str, Any]]:
+        return await self._query(self.db.get_by_filename, filename)
+
+    async def get_many(self, filenames: List[str]) -> Dict[str, Dict[str, Any]]:
+        return await self._query(self.db.get_many, tuple(filenames))  # hashable cache key
+
+    async def get_svg(self, filename: str, thumbnail: bool = False) -> Optional[Tuple[str, Optional[str]]]:
+        return await self._query(self.db.get_svg, filename, thumbnail=thumbnail)
+
+    async def suggest(self, query: str, limit: int = 8) -> Dict[str, List[Dict]]:
+        index = self.db.current_suggest_index(await self.generation())
+        if index is not None:
+            # A lookup in memory: cheaper on the event loop than a hop to the executor
+            return index.complete(query, limit)
+        return await self._query(self.db.suggest, query, limit=limit)
+
+    async def get_stats(self) -> Dict[str, Any]:
+        return await self._query(self.db.get_stats)
+
+    async def get_integrations(self, *args, **kwargs) -> Tuple[List[Dict], int]:
+        return await self._query(self.db.get_integrations, *args, **kwargs)
+
+    async def get_category_counts(self) -> Dict[str, int]:
+        return await self._query(self.db.get_category_counts)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark the shared analysis cache: rebuild the SQLite index and the Vercel
+data from a cold cache, then again after changing a single workflow file.
+Run from the repository root: python benchmarks/bench_analysis_cache.py
+"""
+
+import os
+import sys
+import json
+import shutil
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import build_vercel_data
+import workflow_analysis
+from workflow_analysis import AnalysisCache
+from workflow_db import WorkflowDatabase
+
+analysis_calls = 0
+_analyze_workflow_bytes = workflow_analysis.analyze_workflow_bytes
+
+
+def counting_analyze(raw):
+    global analysis_calls
+    analysis_calls += 1
+    return _analyze_workflow_bytes(raw)
+
+
+workflow_analysis.analyze_workflow_bytes = counting_analyze
+build_vercel_data.analyze_workflow_bytes = counting_analyze
+
+
+def rebuild_both(label: str):
+    """Force-rebuild the index, then build the Vercel data, counting analyses."""
+    global analysis_calls
+    analysis_calls = 0
+    start = time.perf_counter()
+    db = WorkflowDatabase('bench.db', analysis_cache=AnalysisCache('cache.db'))
+    db.index_all_workflows(force_reindex=True, bulk=True)
+    index_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    data = build_vercel_data.build_vercel_data_dict()
+    vercel_time = time.perf_counter() - start
+    return label, index_time, vercel_time, analysis_calls, len(data['workflows'])
+
+
+def main():
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        # Copies, not links: one file is edited below
+        shutil.copytree(os.path.join(REPO_ROOT, 'workflows'), os.path.join(workdir, 'workflows'))
+        os.environ['WORKFLOW_ANALYSIS_CACHE'] = os.path.join(workdir, 'cache.db')
+        os.chdir(workdir)
+
+        results.append(rebuild_both('cold cache'))
+        results.append(rebuild_both('warm, no changes'))
+
+        changed = sorted(os.path.join(d, f) for d, _, fs in os.walk('workflows')
+                         for f in fs if f.endswith('.json'))[0]
+        with open(changed, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data['name'] = data.get('name', '') + ' (edited)'
+        with open(changed, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        results.append(rebuild_both('warm, 1 file changed'))
+
+    print(f"\n{'run':<22} {'index s':>8} {'vercel s':>9} {'analyses':>9} {'workflows':>10}")
+    for label, index_time, vercel_time, calls, count in results:
+        print(f"{label:<22} {index_time:>8.2f} {vercel_time:>9.2f} {calls:>9} {count:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark the async I/O layer: /api/workflows throughput as concurrency grows,
+and /health latency while those searches run, with handlers awaiting the
+bounded executor versus calling SQLite and open() inline on the event loop.
+Run from the repository root: python benchmarks/bench_async_io.py --clients 1 10 50 200
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import httpx
+
+from bench_read_pool import QUERIES, percentile, wait_for_server
+
+# Server entry point: "inline" runs every blocking call directly on the event loop, as before
+SERVER = """
+import sys, uvicorn
+sys.path.insert(0, {root!r})
+import api_server
+from async_db import AsyncWorkflowDatabase, IOExecutor
+from workflow_db import WorkflowDatabase
+
+class InlineExecutor(IOExecutor):
+    async def run(self, fn, *args, **kwargs):
+        return fn(*args, **kwargs)
+
+if {inline!r}:
+    api_server.io_executor = InlineExecutor(1)
+api_server.db = WorkflowDatabase({db_path!r}, use_analysis_cache=False)
+api_server.async_db = AsyncWorkflowDatabase(api_server.db, api_server.io_executor)
+uvicorn.run(api_server.app, host='127.0.0.1', port={port}, log_level='warning', timeout_keep_alive=60)
+"""
+
+
+async def run_mixed(port: int, clients: int, total: int):
+    """Search load from `clients` workers plus one /health prober; returns both latency lists."""
+    search_ms, health_ms = [], []
+    counter = iter(range(total))
+    done = asyncio.Event()
+    limits = httpx.Limits(max_connections=clients + 1, max_keepalive_connections=clients + 1)
+    async with httpx.AsyncClient(base_url=f'http://127.0.0.1:{port}', limits=limits, timeout=300) as client:
+        async def searcher():
+            for i in counter:
+                start = time.perf_counter()
+                response = await client.get('/api/workflows', params=QUERIES[i % len(QUERIES)])
+                response.raise_for_status()
+                search_ms.append((time.perf_counter() - start) * 1000)
+
+        async def prober():
+            while not done.is_set():
+                start = time.perf_counter()
+                (await client.get('/health')).raise_for_status()
+                health_ms.append((time.perf_counter() - start) * 1000)
+                await asyncio.sleep(0.01)
+
+        probe = asyncio.ensure_future(prober())
+        start = time.perf_counter()
+        await asyncio.gather(*(searcher() for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await probe
+    return search_ms, health_ms, elapsed
+
+
+def bench_mode(label: str, inline: bool, db_path: str, port: int, args):
+    script = SERVER.format(root=REPO_ROOT, inline=inline, db_path=db_path, port=port)
+    server = subprocess.Popen([sys.executable, '-c', script])
+    rows = []
+    try:
+        wait_for_server(port)
+        for clients in args.clients:
+            asyncio.run(run_mixed(port, clients, clients))  # warm up
+            search_ms, health_ms, elapsed = asyncio.run(run_mixed(port, clients, args.requests))
+            rows.append((label, clients, len(search_ms) / elapsed, statistics.median(search_ms),
+                         statistics.median(health_ms), percentile(health_ms, 0.99)))
+        metrics = httpx.get(f'http://127.0.0.1:{port}/api/metrics').json()['io_executor']
+    finally:
+        server.terminate()
+        server.wait()
+    return rows, metrics
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Async I/O layer benchmark')
+    parser.add_argument('--clients', type=int, nargs='+', default=[1, 10, 50, 200])
+    parser.add_argument('--requests', type=int, default=1000)
+    parser.add_argument('--port', type=int, default=8775)
+    args = parser.parse_args()
+
+    from workflow_db import WorkflowDatabase
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, 'bench.db')
+        db = WorkflowDatabase(db_path, use_analysis_cache=False)
+        db.workflows_dir = os.path.join(REPO_ROOT, 'workflows')
+        db.index_all_workflows(force_reindex=True, bulk=True)
+        db.close()
+
+        inline_rows, _ = bench_mode('inline', True, db_path, args.port, args)
+        pooled_rows, metrics = bench_mode('executor', False, db_path, args.port + 1, args)
+
+    print(f"\n{'mode':<9} {'clients':>7} {'search/s':>9} {'search p50':>11} {'health p50':>11} {'health p99':>11}")
+    for label, clients, throughput, search_p50, health_p50, health_p99 in inline_rows + pooled_rows:
+        print(f"{label:<9} {clients:>7} {throughput:>9.0f} {search_p50:>11.1f} {health_p50:>11.1f} {health_p99:>11.1f}")
+    print(f"\nexecutor metrics: {metrics}")
+
+
+if __name__ == "__main__":
+    main()
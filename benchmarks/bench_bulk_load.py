@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Benchmark full rebuilds: trigger-driven FTS maintenance vs. bulk-load mode.
+Run from the repository root: python benchmarks/bench_bulk_load.py --sizes 2000 50000
+"""
+
+import os
+import sys
+import sqlite3
+import tempfile
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from workflow_db import WorkflowDatabase
+from corpus import make_corpus
+
+PROBE_QUERIES = ['slack', 'telegram', 'openai', 'webhook']
+
+
+def rebuild(corpus_dir: str, db_path: str, bulk: bool):
+    # Measure analysis itself, not analysis-cache hits
+    db = WorkflowDatabase(db_path, use_analysis_cache=False)
+    db.workflows_dir = corpus_dir
+    start = time.perf_counter()
+    stats = db.index_all_workflows(force_reindex=True, bulk=bulk)
+    elapsed = time.perf_counter() - start
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    conn.close()
+    counts = [db.search_workflows(q, limit=1)[1] for q in PROBE_QUERIES]
+    return elapsed, stats['processed'], os.path.getsize(db_path), counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk-load benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[2000, 50000])
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as workdir:
+            corpus_dir = os.path.join(workdir, 'workflows')
+            make_corpus(corpus_dir, size)
+            for label, bulk in (('triggers', False), ('bulk', True)):
+                db_path = os.path.join(workdir, f'{label}.db')
+                rows.append((size, label) + rebuild(corpus_dir, db_path, bulk))
+
+    print(f"\n{'files':>6}  {'mode':<8}  {'seconds':>8}  {'files/s':>8}  {'db MB':>7}  probe hits")
+    for size, label, elapsed, processed, db_size, counts in rows:
+        print(f"{size:>6}  {label:<8}  {elapsed:>8.2f}  {processed / elapsed:>8.0f}  "
+              f"{db_size / 1e6:>7.1f}  {counts}")
+
+
+if __name__ == "__main__":
+    main()
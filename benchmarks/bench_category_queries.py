@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Benchmark category pages as the corpus grows: the previous OR chain of
+integrations LIKE clauses versus the workflow_integrations semi-join.
+Run from the repository root: python benchmarks/bench_category_queries.py --sizes 2000 10000 50000
+"""
+
+import os
+import sys
+import sqlite3
+import statistics
+import tempfile
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from workflow_db import WorkflowDatabase
+from corpus import make_corpus
+
+
+def like_category_page(conn, services, limit: int = 20):
+    """The category query as it was: count + first page over a LIKE OR chain."""
+    where_clause = " OR ".join("integrations LIKE ?" for _ in services)
+    params = [f'%"{service}"%' for service in services]
+    total = conn.execute(f"SELECT COUNT(*) FROM workflows WHERE {where_clause}", params).fetchone()[0]
+    conn.execute(f"SELECT * FROM workflows WHERE {where_clause} ORDER BY analyzed_at DESC LIMIT {limit}",
+                 params).fetchall()
+    return total
+
+
+def median_ms(fn, repeat: int = 5) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Category query benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[2000, 10000, 50000])
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as workdir:
+            corpus_dir = os.path.join(workdir, 'workflows')
+            make_corpus(corpus_dir, size)
+            db_path = os.path.join(workdir, 'bench.db')
+            db = WorkflowDatabase(db_path)
+            db.workflows_dir = corpus_dir
+            db.index_all_workflows(force_reindex=True, bulk=True)
+
+            conn = sqlite3.connect(db_path)
+            for category, services in db.get_service_categories().items():
+                junction_total = db.search_by_category(category, limit=20)[1]
+                like_total = like_category_page(conn, services)
+                like_ms = median_ms(lambda: like_category_page(conn, services))
+                junction_ms = median_ms(lambda: db.search_by_category(category, limit=20))
+                rows.append((size, category, junction_total, like_total == junction_total, like_ms, junction_ms))
+            conn.close()
+
+    print(f"\n{'size':>6}  {'category':<20} {'matches':>8} {'same':>5} {'LIKE ms':>9} {'join ms':>9} {'speedup':>8}")
+    for size, category, total, same, like_ms, junction_ms in rows:
+        print(f"{size:>6}  {category:<20} {total:>8} {str(same):>5} {like_ms:>9.2f} {junction_ms:>9.2f} "
+              f"{like_ms / junction_ms:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
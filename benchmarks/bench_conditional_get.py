@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark conditional GETs: latency and bytes of a full 200 response against
+a revalidation answered with 304 from the ETag, for the generation-keyed
+search, stats and category routes and the file_hash-keyed workflow routes.
+Run from the repository root: python benchmarks/bench_conditional_get.py --requests 300
+"""
+
+import os
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import httpx
+
+from bench_read_pool import percentile, wait_for_server
+from bench_diagram_cache import SERVER, timed
+
+ROUTES = [
+    '/api/stats',
+    '/api/categories',
+    '/api/integrations',
+    '/api/workflows?q=slack&per_page=50&facets=trigger,complexity,category,integration',
+    '/api/workflows/category/messaging',
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Conditional GET benchmark')
+    parser.add_argument('--requests', type=int, default=300, help='Requests per route and mode')
+    parser.add_argument('--port', type=int, default=8796)
+    args = parser.parse_args()
+
+    from workflow_db import WorkflowDatabase
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, 'bench.db')
+        db = WorkflowDatabase(db_path, use_analysis_cache=False)
+        db.workflows_dir = os.path.join(REPO_ROOT, 'workflows')
+        db.index_all_workflows(force_reindex=True, bulk=True)
+        largest = db._reader().execute("SELECT filename FROM workflows ORDER BY file_size DESC LIMIT 1").fetchone()[0]
+        db.close()
+        routes = ROUTES + [f'/api/workflows/{largest}', f'/api/workflows/{largest}/download']
+
+        script = SERVER.format(root=REPO_ROOT, db_path=db_path, port=args.port)
+        server = subprocess.Popen([sys.executable, '-c', script])
+        try:
+            wait_for_server(args.port)
+            rows = []
+            with httpx.Client(base_url=f'http://127.0.0.1:{args.port}', timeout=60) as client:
+                for path in routes:
+                    _, response = timed(client, path)  # warm the query cache
+                    etag = response.headers['etag']
+                    full = [timed(client, path)[0] for _ in range(args.requests)]
+                    revalidated = []
+                    for _ in range(args.requests):
+                        ms, response = timed(client, path, {'If-None-Match': etag})
+                        assert response.status_code == 304, (path, response.status_code)
+                        revalidated.append(ms)
+                    rows.append((path, len(client.get(path).content), full, revalidated))
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"\n{'route':<44} {'KB':>7} {'200 p50':>8} {'200 p99':>8} {'304 p50':>8} {'304 p99':>8}")
+    for path, size, full, revalidated in rows:
+        print(f"{path[:44]:<44} {size / 1024:>7.1f} {statistics.median(full):>8.2f} {percentile(full, 0.99):>8.2f} "
+              f"{statistics.median(revalidated):>8.2f} {percentile(revalidated, 0.99):>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
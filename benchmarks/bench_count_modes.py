@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark search_workflows_page() count modes: a cold exact COUNT, a cached
+total, the rowid-sample estimate and count-free paging, plus estimate error.
+Run from the repository root: python benchmarks/bench_count_modes.py --size 50000
+"""
+
+import os
+import sys
+import statistics
+import tempfile
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from workflow_db import WorkflowDatabase
+from corpus import make_corpus
+
+SEARCHES = [
+    ('', {}),
+    ('email', {}),
+    ('slack', {'trigger_filter': 'Webhook'}),
+    ('openai', {'complexity_filter': 'high'}),
+    ('', {'integration': 'Telegram'}),
+]
+
+
+def median_ms(fn, repeat: int = 5) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Search count mode benchmark')
+    parser.add_argument('--size', type=int, default=50000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        corpus_dir = os.path.join(workdir, 'workflows')
+        make_corpus(corpus_dir, args.size)
+        db = WorkflowDatabase(os.path.join(workdir, 'bench.db'), use_analysis_cache=False)
+        db.workflows_dir = corpus_dir
+        db.index_all_workflows(force_reindex=True, bulk=True)
+
+        def page(query, filters, count):
+            return db.search_workflows_page(query, limit=20, count=count, **filters)
+
+        def cold(query, filters, count):
+            db._count_cache.clear()
+            return page(query, filters, count)
+
+        print(f"\n{'search':<28} {'total':>7} {'exact ms':>9} {'cached ms':>10} {'estimate ms':>12} "
+              f"{'none ms':>8} {'estimate':>9} {'error':>7}")
+        for query, filters in SEARCHES:
+            label = ' '.join([query or '(none)'] + [f"{k.split('_')[0]}={v}" for k, v in filters.items()])
+            exact = cold(query, filters, 'exact')['total']
+            exact_ms = median_ms(lambda: cold(query, filters, 'exact'))
+            cached_ms = median_ms(lambda: page(query, filters, 'exact'))
+            estimate = cold(query, filters, 'estimate')['total']
+            estimate_ms = median_ms(lambda: cold(query, filters, 'estimate'))
+            none_ms = median_ms(lambda: page(query, filters, 'none'))
+            error = abs(estimate - exact) / exact * 100 if exact else 0.0
+            print(f"{label:<28} {exact:>7} {exact_ms:>9.2f} {cached_ms:>10.2f} {estimate_ms:>12.2f} "
+                  f"{none_ms:>8.2f} {estimate:>9} {error:>6.1f}%")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark workflow detail lookups: the old FTS `filename:"..."` phrase search
+(MATCH plus COUNT) against get_by_filename(), a seek on the UNIQUE filename
+index, and count how often the phrase search returns a different workflow.
+Run from the repository root: python benchmarks/bench_detail_lookup.py --size 50000
+"""
+
+import os
+import sys
+import random
+import statistics
+import tempfile
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from workflow_db import WorkflowDatabase
+from corpus import make_corpus
+
+
+def timed_ms(fn, items):
+    samples = []
+    for item in items:
+        start = time.perf_counter()
+        fn(item)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), sorted(samples)[int(len(samples) * 0.99)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Workflow detail lookup benchmark')
+    parser.add_argument('--size', type=int, default=50000)
+    parser.add_argument('--lookups', type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        corpus_dir = os.path.join(workdir, 'workflows')
+        make_corpus(corpus_dir, args.size)
+        db = WorkflowDatabase(os.path.join(workdir, 'bench.db'), use_analysis_cache=False)
+        db.workflows_dir = corpus_dir
+        db.index_all_workflows(force_reindex=True, bulk=True)
+
+        filenames = [row[0] for row in db._reader().execute("SELECT filename FROM workflows")]
+        sample = random.Random(0).sample(filenames, min(args.lookups, len(filenames)))
+
+        def fts_lookup(filename):
+            workflows, _ = db.search_workflows(f'filename:"{filename}"', limit=1)
+            return workflows[0]['filename'] if workflows else None
+
+        wrong = sum(fts_lookup(filename) != filename for filename in sample)
+        fts_p50, fts_p99 = timed_ms(fts_lookup, sample)
+        pk_p50, pk_p99 = timed_ms(db.get_by_filename, sample)
+
+        print(f"\n{'lookup':<16} {'p50 ms':>8} {'p99 ms':>8}")
+        print(f"{'fts phrase':<16} {fts_p50:>8.3f} {fts_p99:>8.3f}   wrong row {wrong}/{len(sample)}")
+        print(f"{'get_by_filename':<16} {pk_p50:>8.3f} {pk_p99:>8.3f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Benchmark /api/workflows/{filename}/diagram: first view (read, parse and
+generate), a repeat view served from the per-file_hash diagram cache, and a
+conditional repeat view answered with 304 from the ETag.
+Run from the repository root: python benchmarks/bench_diagram_cache.py --requests 500
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import httpx
+
+from bench_read_pool import percentile, wait_for_server
+
+SERVER = """
+import sys, uvicorn
+sys.path.insert(0, {root!r})
+import api_server
+from async_db import AsyncWorkflowDatabase, WorkflowFileIndex
+from workflow_db import WorkflowDatabase
+
+api_server.db = WorkflowDatabase({db_path!r}, use_analysis_cache=False)
+api_server.async_db = AsyncWorkflowDatabase(api_server.db, api_server.io_executor, api_server.query_cache)
+api_server.workflow_files = WorkflowFileIndex(api_server.WORKFLOW_ROOTS, generation=api_server.db.index_generation)
+uvicorn.run(api_server.app, host='127.0.0.1', port={port}, log_level='warning')
+"""
+
+
+def timed(client, path, headers=None):
+    start = time.perf_counter()
+    response = client.get(path, headers=headers or {})
+    return (time.perf_counter() - start) * 1000, response
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Workflow diagram cache benchmark')
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--port', type=int, default=8795)
+    args = parser.parse_args()
+
+    from workflow_db import WorkflowDatabase
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, 'bench.db')
+        db = WorkflowDatabase(db_path, use_analysis_cache=False)
+        db.workflows_dir = os.path.join(REPO_ROOT, 'workflows')
+        db.index_all_workflows(force_reindex=True, bulk=True)
+        filenames = [row[0] for row in db._reader().execute("SELECT filename FROM workflows ORDER BY node_count DESC")]
+        db.close()
+        sample = random.Random(0).sample(filenames, min(args.requests, len(filenames)))
+
+        script = SERVER.format(root=REPO_ROOT, db_path=db_path, port=args.port)
+        server = subprocess.Popen([sys.executable, '-c', script])
+        try:
+            wait_for_server(args.port)
+            results = {'first view': [], 'cached': [], '304': []}
+            with httpx.Client(base_url=f'http://127.0.0.1:{args.port}', timeout=60) as client:
+                for filename in sample:
+                    path = f'/api/workflows/{filename}/diagram'
+                    ms, response = timed(client, path)
+                    results['first view'].append(ms)
+                    etag = response.headers.get('etag')
+                    results['cached'].append(timed(client, path)[0])
+                    ms, response = timed(client, path, {'If-None-Match': etag})
+                    assert response.status_code == 304, response.status_code
+                    results['304'].append(ms)
+                metrics = client.get('/api/metrics').json()['diagram_cache']
+        finally:
+            server.terminate()
+            server.wait()
+
+    print(f"\n{len(sample)} workflows")
+    print(f"{'view':<12} {'p50 ms':>8} {'p99 ms':>8}")
+    for label, latencies in results.items():
+        print(f"{label:<12} {statistics.median(latencies):>8.2f} {percentile(latencies, 0.99):>8.2f}")
+    print(f"\ndiagram cache: {metrics}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Peak-memory benchmark for workflow extraction on the largest workflow files.
+Compares a full json.loads of the document against the streaming extractor.
+Run from the repository root: python benchmarks/bench_extract_memory.py --top 5
+"""
+
+import os
+import sys
+import json
+import argparse
+import resource
+import subprocess
+import tracemalloc
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+MODES = ('json.load', 'streaming')
+
+
+def measure(mode: str, file_path: str) -> dict:
+    """Analyze one file in this (fresh) process and report its memory use."""
+    import workflow_analysis
+    from workflow_db import WorkflowDatabase
+
+    db = WorkflowDatabase.__new__(WorkflowDatabase)
+    with open(file_path, 'rb') as f:
+        raw = f.read()
+
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    if mode == 'json.load':
+        # Whole-document parse, as the indexer did before streaming extraction
+        data = json.loads(raw.decode('utf-8'))
+        content = db.extract_workflow_content(data)
+        db.analyze_nodes(data.get('nodes', []))
+    else:
+        workflow_analysis.STREAMING_MIN_BYTES = 0
+        content = db.analyze_workflow_file(file_path, raw=raw)['content']
+    _, traced_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    return {'rss_delta_kb': rss_after - rss_before, 'traced_peak_kb': traced_peak // 1024,
+            'content_chars': len(content)}
+
+
+def largest_files(count: int):
+    paths = []
+    for dirpath, _, filenames in os.walk(os.path.join(REPO_ROOT, 'workflows')):
+        paths.extend(os.path.join(dirpath, f) for f in filenames if f.endswith('.json'))
+    return sorted(paths, key=os.path.getsize, reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extraction memory benchmark')
+    parser.add_argument('--top', type=int, default=5, help='Number of largest files to measure')
+    parser.add_argument('--child', nargs=2, metavar=('MODE', 'FILE'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(*args.child)))
+        return
+
+    print(f"{'file':<48} {'KB':>5}  {'mode':<10} {'peak RSS +KB':>12} {'traced peak KB':>14} {'content':>8}")
+    for file_path in largest_files(args.top):
+        size_kb = os.path.getsize(file_path) // 1024
+        for mode in MODES:
+            # One process per measurement so ru_maxrss is not polluted by earlier runs
+            out = subprocess.run([sys.executable, __file__, '--child', mode, file_path],
+                                 capture_output=True, text=True, check=True).stdout
+            result = json.loads(out.strip().splitlines()[-1])
+            print(f"{os.path.basename(file_path)[:48]:<48} {size_kb:>5}  {mode:<10} "
+                  f"{result['rss_delta_kb']:>12} {result['traced_peak_kb']:>14} {result['content_chars']:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Benchmark facet counts: one search page with trigger, complexity and category
+facets computed in the same pass (cold, then from the per-generation cache),
+versus the page plus one count request per facet value (what a client had to
+do before).
+Run from the repository root: python benchmarks/bench_facets.py --size 100000
+"""
+
+import os
+import sys
+import statistics
+import tempfile
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from workflow_db import WorkflowDatabase
+from corpus import make_corpus
+
+FACETS = ('trigger', 'complexity', 'category')
+
+CASES = [
+    ('no query', {}),
+    ('trigger=Webhook', {'trigger_filter': 'Webhook'}),
+    ('complexity=high', {'complexity_filter': 'high'}),
+    ('q=email', {'query': 'email'}),
+    ('q=slack webhook', {'query': 'slack webhook'}),
+]
+
+
+def separate_requests(db, params, values):
+    """The first page plus a count request for every facet value, nothing cached."""
+    with db._count_cache_lock:
+        db._count_cache.clear()
+    db.search_workflows_page(limit=20, **params)
+    for facet, value in values:
+        filtered = dict(params)
+        if facet == 'trigger':
+            filtered['trigger_filter'] = value
+        elif facet == 'complexity':
+            filtered['complexity_filter'] = value
+        else:
+            filtered['category'] = value
+        db.search_workflows_page(limit=1, **filtered)
+
+
+def cold_facets(db, params):
+    """A faceted page with nothing cached yet."""
+    with db._count_cache_lock:
+        db._count_cache.clear()
+    db.search_workflows_page(limit=20, facets=FACETS, **params)
+
+
+def median_ms(fn, repeat: int = 7) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Facet count benchmark')
+    parser.add_argument('--size', type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        corpus_dir = os.path.join(workdir, 'workflows')
+        make_corpus(corpus_dir, args.size)
+        db = WorkflowDatabase(os.path.join(workdir, 'bench.db'), use_analysis_cache=False)
+        db.workflows_dir = corpus_dir
+        start = time.perf_counter()
+        db.index_all_workflows(force_reindex=True, bulk=True)
+        print(f"Indexed {args.size} workflows in {time.perf_counter() - start:.1f}s")
+
+        print(f"\n{'case':<18} {'matches':>8} {'values':>7} {'page ms':>8} {'cold ms':>8} {'cached ms':>10} "
+              f"{'separate ms':>12} {'speedup':>8}")
+        for label, params in CASES:
+            result = db.search_workflows_page(limit=20, facets=FACETS, **params)
+            values = [(facet, value) for facet in FACETS for value in result['facets'][facet]]
+            page_ms = median_ms(lambda: db.search_workflows_page(limit=20, **params))
+            cold_ms = median_ms(lambda: cold_facets(db, params))
+            faceted_ms = median_ms(lambda: db.search_workflows_page(limit=20, facets=FACETS, **params))
+            separate_ms = median_ms(lambda: separate_requests(db, params, values), repeat=3)
+            print(f"{label:<18} {result['total']:>8} {len(values):>7} {page_ms:>8.2f} {cold_ms:>8.2f} {faceted_ms:>10.2f} "
+                  f"{separate_ms:>12.2f} {separate_ms / cold_ms:>7.1f}x")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
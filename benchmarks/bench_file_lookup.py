@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark finding a workflow file by name: the per-request rglob the file
+routes used to run against WorkflowFileIndex, a filename -> path map built
+once per index generation.
+Run from the repository root: python benchmarks/bench_file_lookup.py --size 20000
+"""
+
+import os
+import sys
+import random
+import statistics
+import tempfile
+import time
+import argparse
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from async_db import WorkflowFileIndex
+from corpus import make_corpus
+
+
+def rglob_lookup(root: Path, filename: str):
+    """What download_workflow / get_workflow_diagram did on every request."""
+    matching = [f for f in root.rglob("*.json") if f.name == filename]
+    return matching[0] if matching else None
+
+
+def median_ms(fn, items) -> float:
+    samples = []
+    for item in items:
+        start = time.perf_counter()
+        fn(item)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Workflow file lookup benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[2000, 10000, 20000])
+    parser.add_argument('--lookups', type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'size':>7} {'rglob ms':>9} {'index build ms':>15} {'index lookup ms':>16}")
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as workdir:
+            root = Path(workdir) / 'workflows'
+            make_corpus(str(root), size)
+            names = [path.name for path in root.rglob("*.json")]
+            sample = random.Random(0).sample(names, min(args.lookups, len(names)))
+
+            rglob_ms = median_ms(lambda name: rglob_lookup(root, name), sample)
+            index = WorkflowFileIndex([root])
+            start = time.perf_counter()
+            index.lookup('')
+            build_ms = (time.perf_counter() - start) * 1000
+            lookup_ms = median_ms(index.lookup, sample * 100)
+            print(f"{size:>7} {rglob_ms:>9.2f} {build_ms:>15.2f} {lookup_ms:>16.4f}")
+
+
+if __name__ == "__main__":
+    main()
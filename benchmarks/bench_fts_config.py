@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark workflows_fts configurations: index size, rebuild time and query
+latency for each set of FTS5 options (prefix indexes, detail, columnsize,
+tokenizer, bm25 weights) on the same corpus. Build time is the rebuild of
+workflows_fts (about zero when only the weights change).
+Run from the repository root: python benchmarks/bench_fts_config.py --size 20000
+"""
+
+import os
+import sys
+import statistics
+import tempfile
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from workflow_db import WorkflowDatabase
+from corpus import make_corpus
+
+UNWEIGHTED = {'filename': 1, 'name': 1, 'description': 1, 'integrations': 1, 'tags': 1, 'content': 1}
+
+CONFIGS = [
+    ('plain (old)', {'prefix': '', 'weights': UNWEIGHTED}),
+    ('default', {}),
+    ('prefix=2 3', {'prefix': '2 3'}),
+    ('prefix=2 3 4', {'prefix': '2 3 4'}),
+    ('detail=column', {'detail': 'column'}),
+    ('detail=none', {'detail': 'none'}),
+    ('columnsize=0', {'columnsize': False}),
+    ('porter', {'tokenize': 'porter unicode61'}),
+]
+
+QUERIES = ['slack', 'sl*', 'sla*', 'slack*', 'email OR gmail', 'google sheets', 'name:telegram']
+
+
+def fts_bytes(db) -> int:
+    """Bytes used by workflows_fts and its shadow tables."""
+    row = db._reader().execute(
+        "SELECT SUM(pgsize) FROM dbstat WHERE name LIKE 'workflows_fts%'"
+    ).fetchone()
+    return row[0] or 0
+
+
+def median_ms(fn, repeat: int = 7) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='FTS5 configuration benchmark')
+    parser.add_argument('--size', type=int, default=20000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        corpus_dir = os.path.join(workdir, 'workflows')
+        make_corpus(corpus_dir, args.size)
+        db_path = os.path.join(workdir, 'bench.db')
+        db = WorkflowDatabase(db_path, use_analysis_cache=False)
+        db.workflows_dir = corpus_dir
+        db.index_all_workflows(force_reindex=True, bulk=True)
+        db.close()
+
+        print(f"\n{'config':<14} {'fts MB':>7} {'build s':>8} " + ' '.join(f"{q[:12]:>12}" for q in QUERIES))
+        for label, fts_config in CONFIGS:
+            start = time.perf_counter()
+            db = WorkflowDatabase(db_path, use_analysis_cache=False, fts_config=fts_config)
+            build_s = time.perf_counter() - start
+            latencies = []
+            for query in QUERIES:
+                def page():
+                    db._count_cache.clear()
+                    db.search_workflows_page(query, limit=20)
+                try:
+                    latencies.append(f"{median_ms(page):>10.2f}ms")
+                except Exception:
+                    latencies.append(f"{'n/a':>12}")  # e.g. phrase queries without detail=full
+            print(f"{label:<14} {fts_bytes(db) / 1e6:>7.1f} {build_s:>8.2f} " + ' '.join(latencies))
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark: per-workflow node analysis time over the whole corpus, comparing
+the previous per-call table scan with the shared precompiled automaton.
+Run from the repository root: python benchmarks/bench_integration_detection.py
+"""
+
+import os
+import sys
+import json
+import time
+import statistics
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import integration_detection
+from integration_detection import SERVICE_MAPPINGS, analyze_nodes
+from corpus import source_files
+
+
+def legacy_analyze_nodes(nodes):
+    """The analyzer as it was before: rebuilds the table and scans every key per node."""
+    trigger_type = 'Manual'
+    integrations = set()
+    service_mappings = dict(SERVICE_MAPPINGS)  # stands in for the per-call dict literal
+
+    for node in nodes:
+        node_type = node.get('type', '')
+        node_name = node.get('name', '').lower()
+
+        if 'webhook' in node_type.lower() or 'webhook' in node_name:
+            trigger_type = 'Webhook'
+        elif 'cron' in node_type.lower() or 'schedule' in node_type.lower():
+            trigger_type = 'Scheduled'
+        elif 'trigger' in node_type.lower() and trigger_type == 'Manual':
+            if 'manual' not in node_type.lower():
+                trigger_type = 'Webhook'
+
+        service_name = None
+        if node_type.startswith('n8n-nodes-base.'):
+            raw_service = node_type.replace('n8n-nodes-base.', '').lower().replace('trigger', '')
+            service_name = service_mappings.get(raw_service, raw_service.title() if raw_service else None)
+        elif node_type.startswith('@n8n/'):
+            raw_service = node_type.split('.')[-1].lower() if '.' in node_type else node_type.lower()
+            raw_service = raw_service.replace('trigger', '')
+            service_name = service_mappings.get(raw_service, raw_service.title() if raw_service else None)
+        elif '-' in node_type:
+            for part in node_type.lower().split('.'):
+                if 'youtube' in part:
+                    service_name = 'YouTube'
+                    break
+                elif 'telegram' in part:
+                    service_name = 'Telegram'
+                    break
+                elif 'discord' in part:
+                    service_name = 'Discord'
+                    break
+
+        for service_key, service_value in service_mappings.items():
+            if service_key in node_name and service_value:
+                service_name = service_value
+                break
+
+        if service_name and service_name not in ['None', None]:
+            integrations.add(service_name)
+
+    if len(nodes) > 10 and len(integrations) > 3:
+        trigger_type = 'Complex'
+    return trigger_type, integrations
+
+
+def time_per_workflow(analyze, workflows, repeat: int = 5):
+    """Best-of-`repeat` time per workflow, in microseconds."""
+    best = None
+    for _ in range(repeat):
+        samples = []
+        for nodes in workflows:
+            start = time.perf_counter()
+            analyze(nodes)
+            samples.append((time.perf_counter() - start) * 1e6)
+        if best is None or sum(samples) < sum(best):
+            best = samples
+    return best
+
+
+def report(label, samples):
+    ordered = sorted(samples)
+    p99 = ordered[int(len(ordered) * 0.99) - 1]
+    print(f"{label:<22} mean {statistics.mean(samples):7.1f} us   p50 {statistics.median(samples):7.1f} us   "
+          f"p99 {p99:8.1f} us   total {sum(samples) / 1000:7.1f} ms")
+
+
+def main():
+    workflows = []
+    for path in source_files():
+        with open(path, 'r', encoding='utf-8') as f:
+            workflows.append(json.load(f).get('nodes', []))
+    node_total = sum(len(nodes) for nodes in workflows)
+    print(f"{len(workflows)} workflows, {node_total} nodes")
+
+    mismatches = sum(1 for nodes in workflows if legacy_analyze_nodes(nodes) != analyze_nodes(nodes))
+    print(f"Result mismatches vs. legacy analyzer: {mismatches}")
+
+    report("legacy table scan", time_per_workflow(legacy_analyze_nodes, workflows))
+
+    def cold(nodes):
+        integration_detection.detect_service.cache_clear()
+        return analyze_nodes(nodes)
+    report("automaton (no cache)", time_per_workflow(cold, workflows))
+    report("automaton (cached)", time_per_workflow(analyze_nodes, workflows))
+
+
+if __name__ == "__main__":
+    main()
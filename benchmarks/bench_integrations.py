@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Benchmark the integration listing: one page from the trigger-maintained
+integration_stats table versus aggregating workflow_integrations on demand.
+Run from the repository root: python benchmarks/bench_integrations.py --sizes 2000 10000 50000
+"""
+
+import os
+import sys
+import sqlite3
+import statistics
+import tempfile
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from workflow_db import WorkflowDatabase
+from corpus import make_corpus
+
+
+def aggregate_page(conn, limit: int = 50, top: int = 3):
+    """The same page computed from the junction table at request time."""
+    rows = conn.execute("""
+        SELECT wi.integration, w.trigger_type, COUNT(*) FROM workflow_integrations wi
+        JOIN workflows w ON w.id = wi.workflow_rowid
+        GROUP BY wi.integration COLLATE BINARY, w.trigger_type
+    """).fetchall()
+    counts = {}
+    for name, trigger, n in rows:
+        counts.setdefault(name, {})[trigger] = n
+    page = sorted(counts, key=lambda name: (-sum(counts[name].values()), name.lower()))[:limit]
+    return [(name, conn.execute(
+        "SELECT workflow_rowid FROM workflow_integrations WHERE integration = ? ORDER BY workflow_rowid DESC LIMIT ?",
+        (name, top)).fetchall()) for name in page]
+
+
+def median_ms(fn, repeat: int = 7) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Integration listing benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[2000, 10000, 50000])
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as workdir:
+            corpus_dir = os.path.join(workdir, 'workflows')
+            make_corpus(corpus_dir, size)
+            db = WorkflowDatabase(os.path.join(workdir, 'bench.db'), use_analysis_cache=False)
+            db.workflows_dir = corpus_dir
+            db.index_all_workflows(force_reindex=True, bulk=True)
+
+            conn = sqlite3.connect(db.db_path)
+            same = ([item['name'] for item in db.get_integrations(limit=50)[0]]
+                    == [name for name, _ in aggregate_page(conn)])
+            rows.append((size, same, median_ms(lambda: aggregate_page(conn)),
+                         median_ms(lambda: db.get_integrations(limit=50))))
+            conn.close()
+            db.close()
+
+    print(f"\n{'size':>6} {'same':>5} {'aggregate ms':>13} {'stats table ms':>15}")
+    for size, same, aggregate_ms, table_ms in rows:
+        print(f"{size:>6} {str(same):>5} {aggregate_ms:>13.2f} {table_ms:>15.2f}")
+
+
+if __name__ == "__main__":
+    main()
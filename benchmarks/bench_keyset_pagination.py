@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark deep pages of search_workflows: LIMIT/OFFSET versus keyset cursors,
+for the newest-first listing and an FTS-ranked query.
+Run from the repository root: python benchmarks/bench_keyset_pagination.py --size 50000
+"""
+
+import os
+import sys
+import statistics
+import tempfile
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from workflow_db import WorkflowDatabase, encode_cursor
+from corpus import make_corpus
+
+PER_PAGE = 20
+
+
+def median_ms(fn, repeat: int = 5) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Keyset pagination benchmark')
+    parser.add_argument('--size', type=int, default=50000)
+    parser.add_argument('--queries', nargs='+', default=['', 'email'])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        corpus_dir = os.path.join(workdir, 'workflows')
+        make_corpus(corpus_dir, args.size)
+        db = WorkflowDatabase(os.path.join(workdir, 'bench.db'), use_analysis_cache=False)
+        db.workflows_dir = corpus_dir
+        db.index_all_workflows(force_reindex=True, bulk=True)
+
+        print(f"\n{'query':<8} {'page':>6} {'offset ms':>10} {'cursor ms':>10} {'same rows':>10}")
+        for query in args.queries:
+            # Walk every page once with cursors, remembering where each one starts
+            total = db.search_workflows(query, limit=1)[1]
+            last_page = max(1, (total + PER_PAGE - 1) // PER_PAGE)
+            checkpoints = sorted({1, 10, 100, last_page // 2, last_page} & set(range(1, last_page + 1)))
+            cursors, cursor = {1: None}, None
+            for page in range(1, max(checkpoints)):
+                rows, _ = db.search_workflows(query, limit=PER_PAGE, cursor=cursor)
+                cursor = encode_cursor(rows[-1], bool(query))
+                cursors[page + 1] = cursor
+
+            for page in checkpoints:
+                offset = (page - 1) * PER_PAGE
+                by_offset = db.search_workflows(query, limit=PER_PAGE, offset=offset)[0]
+                by_cursor = db.search_workflows(query, limit=PER_PAGE, cursor=cursors[page])[0]
+                same = [r['id'] for r in by_offset] == [r['id'] for r in by_cursor]
+                offset_ms = median_ms(lambda: db.search_workflows(query, limit=PER_PAGE, offset=offset))
+                cursor_ms = median_ms(lambda: db.search_workflows(query, limit=PER_PAGE, cursor=cursors[page]))
+                print(f"{query or '(none)':<8} {page:>6} {offset_ms:>10.2f} {cursor_ms:>10.2f} {str(same):>10}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
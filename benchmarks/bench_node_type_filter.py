@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Benchmark "which workflows use node type X": the indexed nodes table versus
+the FTS and LIKE scans that were the only option before it existed.
+Run from the repository root: python benchmarks/bench_node_type_filter.py --size 100000
+"""
+
+import os
+import sys
+import sqlite3
+import statistics
+import tempfile
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from workflow_db import WorkflowDatabase
+from corpus import make_corpus
+
+NODE_TYPES = [
+    '@n8n/n8n-nodes-langchain.agent',
+    'n8n-nodes-base.telegram',
+    'n8n-nodes-base.stripeTrigger',
+]
+
+
+def median_ms(fn, repeat: int = 20) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Node-type filter benchmark')
+    parser.add_argument('--size', type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        corpus_dir = os.path.join(workdir, 'workflows')
+        make_corpus(corpus_dir, args.size)
+        db_path = os.path.join(workdir, 'bench.db')
+        db = WorkflowDatabase(db_path)
+        db.workflows_dir = corpus_dir
+        start = time.perf_counter()
+        db.index_all_workflows(force_reindex=True, bulk=True)
+        print(f"Indexed {args.size} workflows in {time.perf_counter() - start:.1f}s")
+
+        conn = sqlite3.connect(db_path)
+        print(f"\n{'node type':<34} {'matches':>8} {'nodes idx ms':>13} {'page+count ms':>14} "
+              f"{'FTS ms':>8} {'LIKE ms':>8}")
+        for node_type in NODE_TYPES:
+            matches = conn.execute(
+                "SELECT COUNT(DISTINCT workflow_rowid) FROM nodes WHERE type = ?", (node_type,)
+            ).fetchone()[0]
+            lookup = median_ms(lambda: conn.execute(
+                "SELECT DISTINCT workflow_rowid FROM nodes WHERE type = ? LIMIT 20", (node_type,)
+            ).fetchall())
+            page = median_ms(lambda: db.search_workflows(node_type=node_type, limit=20), repeat=5)
+            fts = median_ms(lambda: conn.execute(
+                "SELECT COUNT(*) FROM workflows_fts WHERE workflows_fts MATCH ?", (f'content:"{node_type}"',)
+            ).fetchone(), repeat=3)
+            like = median_ms(lambda: conn.execute(
+                "SELECT COUNT(*) FROM workflows WHERE content LIKE ?", (f'%{node_type}%',)
+            ).fetchone(), repeat=3)
+            print(f"{node_type:<34} {matches:>8} {lookup:>13.3f} {page:>14.2f} {fts:>8.1f} {like:>8.1f}")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark forced reindexing with 1, 2, 4 and 8 worker processes.
+Run from the repository root: python benchmarks/bench_parallel_index.py
+"""
+
+import os
+import sys
+import sqlite3
+import tempfile
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from workflow_db import WorkflowDatabase
+
+# Columns that legitimately differ between two index runs
+VOLATILE_COLUMNS = {'id', 'analyzed_at'}
+
+
+def snapshot(db_path: str):
+    """Return every indexed row (minus volatile columns) in id order."""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    rows = conn.execute("SELECT * FROM workflows ORDER BY id").fetchall()
+    conn.close()
+    return [{k: row[k] for k in row.keys() if k not in VOLATILE_COLUMNS} for row in rows]
+
+
+def run(jobs: int, workdir: str):
+    db_path = os.path.join(workdir, f"bench_jobs_{jobs}.db")
+    # Measure analysis itself, not analysis-cache hits
+    db = WorkflowDatabase(db_path, use_analysis_cache=False)
+    start = time.perf_counter()
+    stats = db.index_all_workflows(force_reindex=True, jobs=jobs)
+    elapsed = time.perf_counter() - start
+    return elapsed, stats, snapshot(db_path)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Parallel indexing benchmark')
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for jobs in args.jobs:
+            results[jobs] = run(jobs, workdir)
+
+    baseline_jobs = args.jobs[0]
+    baseline_time, _, baseline_rows = results[baseline_jobs]
+
+    print(f"\nCPUs available: {os.cpu_count()}")
+    print(f"{'jobs':>4}  {'seconds':>8}  {'speedup':>7}  {'rows':>5}  identical")
+    for jobs in args.jobs:
+        elapsed, stats, rows = results[jobs]
+        identical = rows == baseline_rows
+        print(f"{jobs:>4}  {elapsed:>8.2f}  {baseline_time / elapsed:>6.2f}x  {len(rows):>5}  {identical}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark the API query result cache: a skewed mix of popular searches and
+category pages from concurrent clients, with and without the cache.
+Run from the repository root: python benchmarks/bench_query_cache.py --clients 50 --requests 4000
+"""
+
+import os
+import sys
+import time
+import random
+import asyncio
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import httpx
+
+from bench_read_pool import percentile, wait_for_server
+
+# Popular requests first; picks follow a Zipf-like distribution over this list
+REQUESTS = [
+    ('/api/workflows', {}),
+    ('/api/workflows', {'q': 'slack'}),
+    ('/api/stats', {}),
+    ('/api/workflows', {'category': 'AI Agent Development'}),
+    ('/api/workflows', {'q': 'email automation'}),
+    ('/api/workflows/category/messaging', {}),
+    ('/api/workflows', {'q': 'google sheets', 'trigger': 'Scheduled'}),
+    ('/api/workflows', {'q': 'openai', 'page': 2}),
+    ('/api/workflows', {'integration': 'Telegram'}),
+    ('/api/workflows', {'complexity': 'high'}),
+    ('/api/workflows', {'q': 'webhook'}),
+    ('/api/workflows/category/ai_ml', {'page': 3}),
+]
+
+SERVER = """
+import sys, uvicorn
+sys.path.insert(0, {root!r})
+import api_server
+from async_db import AsyncWorkflowDatabase
+from workflow_db import WorkflowDatabase
+
+api_server.db = WorkflowDatabase({db_path!r}, use_analysis_cache=False)
+api_server.async_db = AsyncWorkflowDatabase(api_server.db, api_server.io_executor,
+                                            api_server.query_cache if {cached!r} else None)
+uvicorn.run(api_server.app, host='127.0.0.1', port={port}, log_level='warning', timeout_keep_alive=60)
+"""
+
+
+async def run_load(port: int, clients: int, plan):
+    latencies = []
+    work = iter(plan)
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=f'http://127.0.0.1:{port}', limits=limits, timeout=300) as client:
+        async def worker():
+            for path, params in work:
+                start = time.perf_counter()
+                (await client.get(path, params=params)).raise_for_status()
+                latencies.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+
+def bench_mode(label: str, cached: bool, db_path: str, port: int, plan, args):
+    script = SERVER.format(root=REPO_ROOT, cached=cached, db_path=db_path, port=port)
+    server = subprocess.Popen([sys.executable, '-c', script])
+    try:
+        wait_for_server(port)
+        latencies, elapsed = asyncio.run(run_load(port, args.clients, plan))
+        metrics = httpx.get(f'http://127.0.0.1:{port}/api/metrics').json()['query_cache']
+    finally:
+        server.terminate()
+        server.wait()
+    return (label, len(latencies) / elapsed, statistics.median(latencies),
+            percentile(latencies, 0.99), metrics)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Query result cache benchmark')
+    parser.add_argument('--clients', type=int, default=50)
+    parser.add_argument('--requests', type=int, default=4000)
+    parser.add_argument('--port', type=int, default=8785)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    weights = [1 / (rank + 1) for rank in range(len(REQUESTS))]
+    plan = rng.choices(REQUESTS, weights=weights, k=args.requests)
+
+    from workflow_db import WorkflowDatabase
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, 'bench.db')
+        db = WorkflowDatabase(db_path, use_analysis_cache=False)
+        db.workflows_dir = os.path.join(REPO_ROOT, 'workflows')
+        db.index_all_workflows(force_reindex=True, bulk=True)
+        db.close()
+
+        results = [
+            bench_mode('no cache', False, db_path, args.port, plan, args),
+            bench_mode('query cache', True, db_path, args.port + 1, plan, args),
+        ]
+
+    print(f"\n{args.clients} clients, {args.requests} requests, {len(REQUESTS)} distinct (Zipf)")
+    print(f"{'mode':<12} {'req/s':>7} {'p50 ms':>8} {'p99 ms':>8}")
+    for label, throughput, p50, p99, _ in results:
+        print(f"{label:<12} {throughput:>7.0f} {p50:>8.1f} {p99:>8.1f}")
+    print(f"\ncache metrics: {results[1][4]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark /api/workflows latency under 200 concurrent clients with the pooled
+read connections versus opening a fresh SQLite connection for every query.
+Run from the repository root: python benchmarks/bench_read_pool.py --clients 200 --requests 4000
+"""
+
+import os
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+import subprocess
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import httpx
+
+QUERIES = [
+    {},
+    {'q': 'slack'},
+    {'q': 'email automation'},
+    {'trigger': 'Webhook'},
+    {'complexity': 'high', 'page': 2},
+    {'category': 'AI Agent Development'},
+    {'integration': 'Telegram'},
+    {'q': 'google sheets', 'trigger': 'Scheduled'},
+]
+
+# Server entry point: optionally swap in a reader that reconnects per call, as before pooling
+SERVER = """
+import sys, sqlite3, uvicorn
+sys.path.insert(0, {root!r})
+import api_server
+from async_db import AsyncWorkflowDatabase
+from workflow_db import WorkflowDatabase
+
+if {per_call!r}:
+    def _reader(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+    WorkflowDatabase._reader = _reader
+
+api_server.db = WorkflowDatabase({db_path!r}, use_analysis_cache=False)
+api_server.async_db = AsyncWorkflowDatabase(api_server.db, api_server.io_executor)
+uvicorn.run(api_server.app, host='127.0.0.1', port={port}, log_level='warning', timeout_keep_alive=60)
+"""
+
+
+def percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+async def run_load(port: int, clients: int, total: int):
+    """Issue `total` requests from `clients` concurrent workers; return latencies in ms."""
+    latencies = []
+    counter = iter(range(total))
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=f'http://127.0.0.1:{port}', limits=limits, timeout=120) as client:
+        async def worker():
+            for i in counter:
+                start = time.perf_counter()
+                response = await client.get('/api/workflows', params=QUERIES[i % len(QUERIES)])
+                response.raise_for_status()
+                latencies.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+
+def wait_for_server(port: int, timeout: float = 60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if httpx.get(f'http://127.0.0.1:{port}/api/stats', timeout=5).status_code == 200:
+                return
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError('server did not start')
+
+
+def bench_mode(label: str, per_call: bool, db_path: str, args, port_offset: int = 0):
+    port = args.port + port_offset
+    script = SERVER.format(root=REPO_ROOT, per_call=per_call, db_path=db_path, port=port)
+    server = subprocess.Popen([sys.executable, '-c', script])
+    try:
+        wait_for_server(port)
+        asyncio.run(run_load(port, args.clients, args.clients))  # warm up
+        latencies, elapsed = asyncio.run(run_load(port, args.clients, args.requests))
+    finally:
+        server.terminate()
+        server.wait()
+    return (label, statistics.median(latencies), percentile(latencies, 0.99),
+            len(latencies) / elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Read connection pooling benchmark')
+    parser.add_argument('--clients', type=int, default=200)
+    parser.add_argument('--requests', type=int, default=4000)
+    parser.add_argument('--port', type=int, default=8765)
+    args = parser.parse_args()
+
+    from workflow_db import WorkflowDatabase
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db_path = os.path.join(workdir, 'bench.db')
+        db = WorkflowDatabase(db_path, use_analysis_cache=False)
+        db.workflows_dir = os.path.join(REPO_ROOT, 'workflows')
+        db.index_all_workflows(force_reindex=True, bulk=True)
+        db.close()
+
+        results = [
+            bench_mode('per-call connect', True, db_path, args),
+            bench_mode('pooled readers', False, db_path, args, port_offset=1),
+        ]
+
+    print(f"\n{args.clients} clients, {args.requests} requests to /api/workflows")
+    print(f"{'mode':<18} {'p50 ms':>8} {'p99 ms':>8} {'req/s':>8}")
+    for label, p50, p99, throughput in results:
+        print(f"{label:<18} {p50:>8.1f} {p99:>8.1f} {throughput:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
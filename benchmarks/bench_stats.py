@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark get_stats(): the previous aggregate queries plus a json.loads of
+every row's integrations, versus one read of the materialized workflow_stats
+table. Also reports what the maintaining triggers add to a bulk load.
+Run from the repository root: python benchmarks/bench_stats.py --sizes 2000 10000 50000
+"""
+
+import os
+import sys
+import json
+import sqlite3
+import statistics
+import tempfile
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import workflow_db
+from workflow_db import WorkflowDatabase
+from corpus import make_corpus
+
+
+def aggregate_stats(conn):
+    """get_stats() as it was: five aggregates and a scan of every integrations list."""
+    total = conn.execute("SELECT COUNT(*) FROM workflows").fetchone()[0]
+    active = conn.execute("SELECT COUNT(*) FROM workflows WHERE active = 1").fetchone()[0]
+    triggers = dict(conn.execute("SELECT trigger_type, COUNT(*) FROM workflows GROUP BY trigger_type").fetchall())
+    complexity = dict(conn.execute("SELECT complexity, COUNT(*) FROM workflows GROUP BY complexity").fetchall())
+    total_nodes = conn.execute("SELECT SUM(node_count) FROM workflows").fetchone()[0] or 0
+    all_integrations = set()
+    for (integrations,) in conn.execute("SELECT integrations FROM workflows WHERE integrations != '[]'"):
+        all_integrations.update(json.loads(integrations))
+    return {'total': total, 'active': active, 'inactive': total - active, 'triggers': triggers,
+            'complexity': complexity, 'total_nodes': total_nodes, 'unique_integrations': len(all_integrations)}
+
+
+def median_ms(fn, repeat: int = 7) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def bulk_load_seconds(workdir: str, corpus_dir: str, with_triggers: bool) -> float:
+    db_path = os.path.join(workdir, f'load_{with_triggers}.db')
+    db = WorkflowDatabase(db_path, use_analysis_cache=False)
+    db.workflows_dir = corpus_dir
+    if not with_triggers:
+        conn = sqlite3.connect(db_path)
+        for name in workflow_db.STATS_TRIGGERS:
+            conn.execute(f"DROP TRIGGER {name}")
+        conn.commit()
+        conn.close()
+    start = time.perf_counter()
+    db.index_all_workflows(force_reindex=True, bulk=True)
+    elapsed = time.perf_counter() - start
+    db.close()
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Materialized stats benchmark')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[2000, 10000, 50000])
+    args = parser.parse_args()
+
+    rows = []
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as workdir:
+            corpus_dir = os.path.join(workdir, 'workflows')
+            make_corpus(corpus_dir, size)
+            plain_load = bulk_load_seconds(workdir, corpus_dir, with_triggers=False)
+            stats_load = bulk_load_seconds(workdir, corpus_dir, with_triggers=True)
+
+            db = WorkflowDatabase(os.path.join(workdir, 'load_True.db'), use_analysis_cache=False)
+            conn = sqlite3.connect(db.db_path)
+            materialized = dict(db.get_stats())
+            materialized.pop('last_indexed')
+            same = materialized == aggregate_stats(conn)
+            old_ms = median_ms(lambda: aggregate_stats(conn))
+            new_ms = median_ms(db.get_stats)
+            rows.append((size, same, old_ms, new_ms, plain_load, stats_load))
+            conn.close()
+            db.close()
+
+    print(f"\n{'size':>6} {'same':>5} {'aggregate ms':>13} {'table ms':>9} {'load s':>7} {'load+stats s':>13}")
+    for size, same, old_ms, new_ms, plain_load, stats_load in rows:
+        print(f"{size:>6} {str(same):>5} {old_ms:>13.2f} {new_ms:>9.3f} {plain_load:>7.1f} {stats_load:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
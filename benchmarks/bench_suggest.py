@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark /api/suggest lookups: prefix index build time, then p50/p99 latency
+of the API's suggest lookup for 1-5 character prefixes from many concurrent
+"typists", against the full search the UI used to run on every keystroke.
+Run from the repository root: python benchmarks/bench_suggest.py --size 100000
+"""
+
+import os
+import sys
+import random
+import statistics
+import tempfile
+import time
+import argparse
+import asyncio
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from workflow_db import WorkflowDatabase
+from async_db import AsyncWorkflowDatabase, IOExecutor
+from query_cache import QueryCache
+from corpus import make_corpus
+
+WORDS = ['slack', 'google', 'telegram', 'webhook', 'email', 'openai', 'notion', 'airtable', 'discord', 'schedule']
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def typist(lookup, keystrokes: int, seed: int, samples):
+    """Type random words one character at a time, timing each lookup (ms) by prefix length."""
+    rng = random.Random(seed)
+    typed = 0
+    while typed < keystrokes:
+        word = rng.choice(WORDS)
+        for length in range(1, 6):
+            await asyncio.sleep(rng.uniform(0, 0.02))  # keystroke gaps
+            start = time.perf_counter()
+            await lookup(word[:length])
+            samples.setdefault(length, []).append((time.perf_counter() - start) * 1000)
+            typed += 1
+
+
+async def run(lookup, typists: int, keystrokes: int):
+    samples = {}
+    await asyncio.gather(*(typist(lookup, keystrokes, seed, samples) for seed in range(typists)))
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Type-ahead suggestion benchmark')
+    parser.add_argument('--size', type=int, default=100000)
+    parser.add_argument('--typists', type=int, default=200)
+    parser.add_argument('--keystrokes', type=int, default=50, help='Keystrokes per typist')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        corpus_dir = os.path.join(workdir, 'workflows')
+        make_corpus(corpus_dir, args.size)
+        db = WorkflowDatabase(os.path.join(workdir, 'bench.db'), use_analysis_cache=False)
+        db.workflows_dir = corpus_dir
+        db.index_all_workflows(force_reindex=True, bulk=True)
+
+        start = time.perf_counter()
+        db.suggest('')
+        print(f"Suggest index built in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+        # The API path: bounded executor plus the generation-keyed result cache
+        executor = IOExecutor()
+        lookups = [
+            ('suggest', AsyncWorkflowDatabase(db, executor, QueryCache()),
+             lambda async_db, prefix: async_db.suggest(prefix), args.typists, args.keystrokes),
+            ('full search', AsyncWorkflowDatabase(db, executor, QueryCache()),
+             lambda async_db, prefix: async_db.search_workflows_page(prefix + '*', limit=20, count='none'),
+             min(args.typists, 20), 10),
+        ]
+        print(f"\n{'lookup':<12} {'typists':>8} {'prefix':>6} {'p50 ms':>8} {'p99 ms':>8}")
+        for label, async_db, lookup, typists, keystrokes in lookups:
+            samples = asyncio.run(run(lambda prefix: lookup(async_db, prefix), typists, keystrokes))
+            for length in sorted(samples):
+                values = samples[length]
+                print(f"{label:<12} {typists:>8} {length:>6} {statistics.median(values):>8.3f} "
+                      f"{percentile(values, 0.99):>8.3f}")
+        executor.shutdown()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
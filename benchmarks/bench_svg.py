@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Benchmark index-time SVG rendering: render time and output size for the full
+diagram and the card thumbnail over the repository workflows, and the cost of
+serving a stored SVG (one indexed read) by workflow size.
+Run from the repository root: python benchmarks/bench_svg.py
+"""
+
+import os
+import sys
+import statistics
+import tempfile
+import time
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import workflow_svg
+from workflow_analysis import analyze_workflow_bytes
+from workflow_db import WorkflowDatabase
+from corpus import SOURCE_DIR, source_files
+
+
+def percentile(samples, fraction: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Workflow SVG rendering benchmark')
+    parser.parse_args()
+
+    graphs = []
+    for path in source_files():
+        try:
+            analysis = analyze_workflow_bytes(path.read_bytes())
+        except Exception:
+            continue
+        graphs.append((path.name, analysis['nodes'], analysis['edges']))
+
+    print(f"{len(graphs)} workflows")
+    print(f"\n{'variant':<10} {'p50 ms':>8} {'p99 ms':>8} {'avg KB':>8} {'max KB':>8}")
+    for label, thumbnail in (('full', False), ('thumbnail', True)):
+        times, sizes = [], []
+        for _, nodes, edges in graphs:
+            start = time.perf_counter()
+            svg = workflow_svg.render_svg(nodes, edges, thumbnail=thumbnail)
+            times.append((time.perf_counter() - start) * 1000)
+            sizes.append(len(svg) / 1024)
+        print(f"{label:<10} {statistics.median(times):>8.3f} {percentile(times, 0.99):>8.3f} "
+              f"{statistics.mean(sizes):>8.1f} {max(sizes):>8.1f}")
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db = WorkflowDatabase(os.path.join(workdir, 'bench.db'), use_analysis_cache=False)
+        db.workflows_dir = str(SOURCE_DIR)
+        db.index_all_workflows(force_reindex=True, bulk=True)
+        by_size = sorted(graphs, key=lambda graph: len(graph[1]))
+        print(f"\n{'nodes':>6} {'get_svg ms':>11}")
+        for name, nodes, _ in (by_size[len(by_size) // 2], by_size[-1]):
+            samples = []
+            for _ in range(200):
+                start = time.perf_counter()
+                db.get_svg(name)
+                samples.append((time.perf_counter() - start) * 1000)
+            print(f"{len(nodes):>6} {statistics.median(samples):>11.3f}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
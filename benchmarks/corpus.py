@@ -0,0 +1,45 @@
+"""
+Synthetic corpus helpers for the benchmarks.
+Scales the real workflows/ tree up to an arbitrary file count by hard-linking
+(or copying) the originals under replica-prefixed filenames.
+"""
+
+import os
+import shutil
+from pathlib import Path
+from typing import List
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SOURCE_DIR = REPO_ROOT / "workflows"
+
+
+def source_files() -> List[Path]:
+    """All workflow JSON files in the repository, in a stable order."""
+    return sorted(SOURCE_DIR.rglob("*.json"))
+
+
+def make_corpus(dest: str, count: int) -> int:
+    """Populate dest with `count` workflow files and return the number written.
+
+    The first pass keeps the original filenames; later passes prefix them with
+    the replica number so every basename stays unique. Files may be hard links
+    to the originals, so benchmarks must not modify them in place.
+    """
+    sources = source_files()
+    written = 0
+    replica = 0
+    while written < count:
+        for src in sources:
+            if written >= count:
+                break
+            name = src.name if replica == 0 else f"r{replica}_{src.name}"
+            target_dir = Path(dest) / src.parent.name
+            target_dir.mkdir(parents=True, exist_ok=True)
+            target = target_dir / name
+            try:
+                os.link(src, target)
+            except OSError:
+                shutil.copyfile(src, target)
+            written += 1
+        replica += 1
+    return written
@@ -7,19 +7,10 @@ Processes all workflow files and creates a JSON file that can be deployed to Ver
 import json
 import os
 from pathlib import Path
-import hashlib
 from typing import Dict, List, Any, Optional
 
-def get_file_hash(file_path: str) -> str:
-    """Get MD5 hash of file for change detection."""
-    hash_md5 = hashlib.md5()
-    try:
-        with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
-    except:
-        return ""
+from workflow_analysis import (ANALYSIS_ERRORS, AnalysisCache, analyze_workflow_bytes, analyze_workflow_path,
+                               read_workflow_file)
 
 def format_workflow_name(filename: str) -> str:
     """Convert filename to readable workflow name."""
@@ -29,142 +20,30 @@ def format_workflow_name(filename: str) -> str:
         parts = parts[1:]
     return ' '.join(part.capitalize() for part in parts)
 
-def analyze_workflow_file(file_path: str) -> Optional[Dict[str, Any]]:
-    """Analyze a single workflow file and extract metadata."""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except (json.JSONDecodeError, UnicodeDecodeError) as e:
-        print(f"Error reading {file_path}: {str(e)}")
-        return None
-    
-    filename = os.path.basename(file_path)
-    nodes = data.get('nodes', [])
-    
-    # Enhanced service mapping for better recognition
-    service_mappings = {
-        # AI/ML Services
-        'openai': 'OpenAI',
-        'lmchatopenai': 'OpenAI',
-        'anthropic': 'Anthropic', 
-        'agent': 'Agent',
-        'chat': 'Chat',
-        'memorybufferwindow': 'Memory Buffer',
-        'chainllm': 'Chain LLM',
-        'lmchatgooglegemini': 'Google Gemini',
-        'lmchatollama': 'Ollama',
-        'lmopenhuggingfaceinference': 'Hugging Face',
-        'embeddingsgooglegemini': 'Google Embeddings',
-        'toolhttprequest': 'HTTP Tool',
-        'toolwikipedia': 'Wikipedia Tool',
-        'executeworkflow': 'Execute Workflow',
-        'documentdefaultdataloader': 'Document Loader',
-        'outputparserstructured': 'Output Parser',
-        
-        # Messaging & Communication
-        'telegram': 'Telegram',
-        'telegramTrigger': 'Telegram',
-        'discord': 'Discord',
-        'slack': 'Slack', 
-        'whatsapp': 'WhatsApp',
-        'mattermost': 'Mattermost',
-        
-        # Email
-        'gmail': 'Gmail',
-        'gmailtool': 'Gmail',
-        'emailreadimap': 'Email (IMAP)',
-        'emailsendsmt': 'Email (SMTP)',
-        
-        # Cloud Storage
-        'googledrive': 'Google Drive',
-        'googledocs': 'Google Docs',
-        'googlesheets': 'Google Sheets',
-        'googlecalendar': 'Google Calendar', 
-        'googlecalendartool': 'Google Calendar',
-        'googletasks': 'Google Tasks',
-        'dropbox': 'Dropbox',
-        
-        # Databases & Tools
-        'postgres': 'PostgreSQL',
-        'mysql': 'MySQL',
-        'mongodb': 'MongoDB',
-        'airtable': 'Airtable',
-        'airtabletool': 'Airtable',
-        'notion': 'Notion',
-        
-        # Project Management
-        'github': 'GitHub',
-        'gitlab': 'GitLab',
-        'asana': 'Asana',
-        
-        # Forms & Triggers
-        'typeform': 'Typeform',
-        'form': 'Form Trigger',
-        'webhook': 'Webhook',
-        'httprequest': 'HTTP Request',
-        'converttofile': 'Convert to File',
-        'extractfromfile': 'Extract from File',
-        'stickynote': 'Sticky Note',
-        
-        # Calendar & Scheduling
-        'cal': 'Cal.com',
-        'calendly': 'Calendly',
-        'cron': 'Cron',
-        'schedule': 'Schedule',
-        
-        # Other Services
-        'hubspot': 'HubSpot',
-        'stripe': 'Stripe',
-        'paypal': 'PayPal',
-    }
-    
-    # Analyze nodes for integrations and trigger type
-    integrations = set()
-    trigger_type = 'Manual'
-    
-    for node in nodes:
-        node_type = node.get('type', '').lower()
-        node_name = node.get('name', '').lower()
-        
-        # Determine trigger type
-        if 'webhook' in node_type or 'webhook' in node_name:
-            trigger_type = 'Webhook'
-        elif 'cron' in node_type or 'schedule' in node_type:
-            trigger_type = 'Scheduled'
-        elif 'trigger' in node_type and trigger_type == 'Manual':
-            if 'manual' not in node_type:
-                trigger_type = 'Webhook'
-        
-        # Extract integrations with enhanced mapping
-        service_name = None
-        
-        # Handle n8n-nodes-base nodes
-        if node_type.startswith('n8n-nodes-base.'):
-            raw_service = node_type.replace('n8n-nodes-base.', '').lower()
-            raw_service = raw_service.replace('trigger', '')
-            service_name = service_mappings.get(raw_service)
-        
-        # Handle @n8n/ namespaced nodes
-        elif node_type.startswith('@n8n/'):
-            raw_service = node_type.split('.')[-1].lower() if '.' in node_type else node_type.lower()
-            raw_service = raw_service.replace('trigger', '')
-            service_name = service_mappings.get(raw_service)
-        
-        # Check node names for service hints
-        for service_key, service_value in service_mappings.items():
-            if service_key in node_name and service_value:
-                service_name = service_value
-                break
-        
-        # Add to integrations if valid service found
-        if service_name:
-            integrations.add(service_name)
+def analyze_workflow_file(file_path: str, cache: Optional[AnalysisCache] = None,
+                          new_analyses: Optional[List] = None) -> Optional[Dict[str, Any]]:
+    """Analyze a single workflow file and extract metadata.
+
+    The content analysis is shared with the SQLite indexer through the analysis
+    cache; fresh results are appended to new_analyses for the caller to store.
+    """
+    raw, file_hash = read_workflow_file(file_path)
     
-    node_count = len(nodes)
+    analysis = cache.get(file_hash) if cache else None
+    if analysis is None:
+        try:
+            analysis = analyze_workflow_bytes(raw) if raw is not None else analyze_workflow_path(file_path)
+        except ANALYSIS_ERRORS as e:
+            print(f"Error reading {file_path}: {str(e)}")
+            return None
+        if new_analyses is not None:
+            new_analyses.append((file_hash, analysis))
     
-    # Determine if complex based on node variety and count
-    if node_count > 10 and len(integrations) > 3:
-        trigger_type = 'Complex'
+    filename = os.path.basename(file_path)
+    fields = analysis['fields']
+    trigger_type = analysis['trigger_type']
+    integrations = analysis['integrations']
+    node_count = analysis['node_count']
     
     # Determine complexity
     if node_count <= 5:
@@ -175,7 +54,7 @@ def analyze_workflow_file(file_path: str) -> Optional[Dict[str, Any]]:
         complexity = 'high'
     
     # Use JSON name if available and meaningful, otherwise use formatted filename
-    json_name = data.get('name', '').strip()
+    json_name = fields.get('name', '').strip()
     if json_name and json_name != filename.replace('.json', '') and not json_name.startswith('My workflow'):
         workflow_name = json_name
     else:
@@ -220,70 +99,21 @@ def analyze_workflow_file(file_path: str) -> Optional[Dict[str, Any]]:
     return {
         'filename': filename,
         'name': workflow_name,
-        'workflow_id': data.get('id', ''),
-        'active': data.get('active', False),
+        'workflow_id': fields.get('id', ''),
+        'active': fields.get('active', False),
         'description': desc,
         'trigger_type': trigger_type,
         'complexity': complexity,
         'node_count': node_count,
         'integrations': sorted(list(integrations)),
-        'tags': data.get('tags', []),
-        'created_at': data.get('createdAt', ''),
-        'updated_at': data.get('updatedAt', ''),
-        'file_hash': get_file_hash(file_path),
-        'file_size': os.path.getsize(file_path) if os.path.exists(file_path) else 0,
-        'content': extract_workflow_content(data)
+        'tags': fields.get('tags', []),
+        'created_at': fields.get('createdAt', ''),
+        'updated_at': fields.get('updatedAt', ''),
+        'file_hash': file_hash,
+        'file_size': analysis['file_size'],
+        'content': analysis['content']
     }
 
-def extract_workflow_content(data: Dict[str, Any]) -> str:
-    """Extract all searchable content from workflow JSON including nodes, parameters, and sticky notes."""
-    content_parts = []
-    
-    # Extract basic workflow info
-    if 'name' in data:
-        content_parts.append(str(data['name']))
-    
-    if 'description' in data:
-        content_parts.append(str(data['description']))
-    
-    # Extract content from nodes
-    if 'nodes' in data:
-        for node in data['nodes']:
-            # Node type and name
-            if 'type' in node:
-                content_parts.append(str(node['type']))
-            if 'name' in node:
-                content_parts.append(str(node['name']))
-            
-            # Node parameters and configuration
-            if 'parameters' in node:
-                params = node['parameters']
-                if isinstance(params, dict):
-                    for key, value in params.items():
-                        if isinstance(value, str):
-                            content_parts.append(f"{key}: {value}")
-                        elif isinstance(value, dict):
-                            content_parts.append(str(value))
-                        else:
-                            content_parts.append(f"{key}: {str(value)}")
-            
-            # Sticky note content
-            if node.get('type') == 'n8n-nodes-base.stickyNote':
-                if 'parameters' in node and 'content' in node['parameters']:
-                    content_parts.append(str(node['parameters']['content']))
-            
-            # Code node content
-            if node.get('type') == 'n8n-nodes-base.code':
-                if 'parameters' in node and 'jsCode' in node['parameters']:
-                    content_parts.append(str(node['parameters']['jsCode']))
-    
-    # Extract tags
-    if 'tags' in data and isinstance(data['tags'], list):
-        for tag in data['tags']:
-            content_parts.append(str(tag))
-    
-    return ' '.join(content_parts)
-
 def build_vercel_data_dict():
     """Build workflow data for Vercel deployment and return as dictionary."""
     workflows_dir = "workflows"
@@ -320,9 +150,11 @@ def build_vercel_data_dict():
     
     workflows_data = []
     errors = 0
+    cache = AnalysisCache()
+    new_analyses = []
     
     for i, file_path in enumerate(json_files):
-        workflow_data = analyze_workflow_file(str(file_path))
+        workflow_data = analyze_workflow_file(str(file_path), cache, new_analyses)
         if workflow_data:
             # Add category information
             filename = workflow_data['filename']
@@ -336,6 +168,10 @@ def build_vercel_data_dict():
         if (i + 1) % 100 == 0:
             print(f"Processed {i + 1}/{len(json_files)} workflows...")
     
+    # Share fresh analyses with the next build (and with the SQLite indexer)
+    cache.put_many(new_analyses)
+    print(f"Analyzed {len(new_analyses)} changed workflows, {len(workflows_data) - len(new_analyses)} from cache")
+    
     # Calculate statistics
     total = len(workflows_data)
     active = sum(1 for w in workflows_data if w['active'])
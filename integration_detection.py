@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Integration Detection
+Shared node analysis for the SQLite indexer and the Vercel data builder:
+one service mapping table, compiled once into an Aho-Corasick automaton.
+"""
+
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+# Enhanced service mapping for better recognition (node type / name fragment -> integration)
+SERVICE_MAPPINGS = {
+    # Messaging & Communication
+    'telegram': 'Telegram',
+    'telegramTrigger': 'Telegram',
+    'discord': 'Discord',
+    'slack': 'Slack', 
+    'whatsapp': 'WhatsApp',
+    'mattermost': 'Mattermost',
+    'teams': 'Microsoft Teams',
+    'rocketchat': 'Rocket.Chat',
+    
+    # Email
+    'gmail': 'Gmail',
+    'mailjet': 'Mailjet',
+    'emailreadimap': 'Email (IMAP)',
+    'emailsendsmt': 'Email (SMTP)',
+    'outlook': 'Outlook',
+    
+    # Cloud Storage
+    'googledrive': 'Google Drive',
+    'googledocs': 'Google Docs',
+    'googlesheets': 'Google Sheets',
+    'dropbox': 'Dropbox',
+    'onedrive': 'OneDrive',
+    'box': 'Box',
+    
+    # Databases
+    'postgres': 'PostgreSQL',
+    'mysql': 'MySQL',
+    'mongodb': 'MongoDB',
+    'redis': 'Redis',
+    'airtable': 'Airtable',
+    'notion': 'Notion',
+    
+    # Project Management
+    'jira': 'Jira',
+    'github': 'GitHub',
+    'gitlab': 'GitLab',
+    'trello': 'Trello',
+    'asana': 'Asana',
+    'mondaycom': 'Monday.com',
+    
+    # AI/ML Services
+    'openai': 'OpenAI',
+    'anthropic': 'Anthropic',
+    'huggingface': 'Hugging Face',
+    
+    # Social Media
+    'linkedin': 'LinkedIn',
+    'twitter': 'Twitter/X',
+    'facebook': 'Facebook',
+    'instagram': 'Instagram',
+    
+    # E-commerce
+    'shopify': 'Shopify',
+    'stripe': 'Stripe',
+    'paypal': 'PayPal',
+    
+    # Analytics
+    'googleanalytics': 'Google Analytics',
+    'mixpanel': 'Mixpanel',
+    
+    # Calendar & Tasks
+    'googlecalendar': 'Google Calendar', 
+    'googletasks': 'Google Tasks',
+    'cal': 'Cal.com',
+    'calendly': 'Calendly',
+    
+    # Forms & Surveys
+    'typeform': 'Typeform',
+    'googleforms': 'Google Forms',
+    'form': 'Form Trigger',
+    
+    # Development Tools
+    'webhook': 'Webhook',
+    'httpRequest': 'HTTP Request',
+    'graphql': 'GraphQL',
+    'sse': 'Server-Sent Events',
+    
+    # Utility nodes (exclude from integrations)
+    'set': None,
+    'function': None,
+    'code': None,
+    'if': None,
+    'switch': None,
+    'merge': None,
+    'split': None,
+    'stickynote': None,
+    'stickyNote': None,
+    'wait': None,
+    'schedule': None,
+    'cron': None,
+    'manual': None,
+    'stopanderror': None,
+    'noop': None,
+    'noOp': None,
+    'error': None,
+    'limit': None,
+    'aggregate': None,
+    'summarize': None,
+    'filter': None,
+    'sort': None,
+    'removeDuplicates': None,
+    'dateTime': None,
+    'extractFromFile': None,
+    'convertToFile': None,
+    'readBinaryFile': None,
+    'readBinaryFiles': None,
+    'executionData': None,
+    'executeWorkflow': None,
+    'executeCommand': None,
+    'respondToWebhook': None,
+}
+
+
+class ServiceNameMatcher:
+    """Aho-Corasick automaton over the mapping keys.
+
+    first_match(text) returns the service for the earliest key (in table order)
+    that occurs anywhere in text, which is what scanning the table with `in`
+    produced, but in a single pass over the text.
+    """
+
+    def __init__(self, mappings: Dict[str, Optional[str]]):
+        self.services: List[str] = []
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        # Best (lowest) key priority ending at each state, following fail links
+        self.best: List[Optional[int]] = [None]
+
+        for key, service in mappings.items():
+            # Keys without a service never win; mixed-case keys can never match lowercased text
+            if not service or key != key.lower():
+                continue
+            priority = len(self.services)
+            self.services.append(service)
+            state = 0
+            for char in key:
+                if char not in self.goto[state]:
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.best.append(None)
+                    self.goto[state][char] = len(self.goto) - 1
+                state = self.goto[state][char]
+            if self.best[state] is None:
+                self.best[state] = priority
+
+        # Breadth-first pass to fill failure links and merge outputs
+        queue = list(self.goto[0].values())
+        while queue:
+            next_queue = []
+            for state in queue:
+                for char, child in self.goto[state].items():
+                    fallback = self.fail[state]
+                    while fallback and char not in self.goto[fallback]:
+                        fallback = self.fail[fallback]
+                    target = self.goto[fallback].get(char, 0)
+                    self.fail[child] = target if target != child else 0
+                    inherited = self.best[self.fail[child]]
+                    if inherited is not None and (self.best[child] is None or inherited < self.best[child]):
+                        self.best[child] = inherited
+                    next_queue.append(child)
+            queue = next_queue
+
+    def first_match(self, text: str) -> Optional[str]:
+        goto, fail, best = self.goto, self.fail, self.best
+        state = 0
+        winner = None
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            priority = best[state]
+            if priority is not None and (winner is None or priority < winner):
+                winner = priority
+                if winner == 0:
+                    break
+        return self.services[winner] if winner is not None else None
+
+
+NAME_MATCHER = ServiceNameMatcher(SERVICE_MAPPINGS)
+
+
+@lru_cache(maxsize=8192)
+def detect_service(node_type: str, node_name: str) -> Optional[str]:
+    """Map a node type and lowercased node name to an integration name (or None)."""
+    service_name = None
+    
+    # Handle n8n-nodes-base nodes
+    if node_type.startswith('n8n-nodes-base.'):
+        raw_service = node_type.replace('n8n-nodes-base.', '').lower()
+        raw_service = raw_service.replace('trigger', '')
+        service_name = SERVICE_MAPPINGS.get(raw_service, raw_service.title() if raw_service else None)
+    
+    # Handle @n8n/ namespaced nodes
+    elif node_type.startswith('@n8n/'):
+        raw_service = node_type.split('.')[-1].lower() if '.' in node_type else node_type.lower()
+        raw_service = raw_service.replace('trigger', '')
+        service_name = SERVICE_MAPPINGS.get(raw_service, raw_service.title() if raw_service else None)
+    
+    # Handle custom nodes
+    elif '-' in node_type:
+        # Try to extract service name from custom node names like "n8n-nodes-youtube-transcription-kasha.youtubeTranscripter"
+        parts = node_type.lower().split('.')
+        for part in parts:
+            if 'youtube' in part:
+                service_name = 'YouTube'
+                break
+            elif 'telegram' in part:
+                service_name = 'Telegram'
+                break
+            elif 'discord' in part:
+                service_name = 'Discord'
+                break
+    
+    # Also check node names for service hints
+    name_hint = NAME_MATCHER.first_match(node_name)
+    if name_hint:
+        service_name = name_hint
+    
+    if service_name in ['None', None]:
+        return None
+    return service_name
+
+
+def analyze_node(node: Dict, trigger_type: str, integrations: set) -> str:
+    """Fold one node into the running trigger type and integration set; returns the new trigger type."""
+    node_type = node.get('type', '')
+    node_name = node.get('name', '').lower()
+    node_type_lower = node_type.lower()
+    
+    # Determine trigger type
+    if 'webhook' in node_type_lower or 'webhook' in node_name:
+        trigger_type = 'Webhook'
+    elif 'cron' in node_type_lower or 'schedule' in node_type_lower:
+        trigger_type = 'Scheduled'
+    elif 'trigger' in node_type_lower and trigger_type == 'Manual':
+        if 'manual' not in node_type_lower:
+            trigger_type = 'Webhook'
+    
+    # Add to integrations if valid service found
+    service_name = detect_service(node_type, node_name)
+    if service_name:
+        integrations.add(service_name)
+    
+    return trigger_type
+
+
+def analyze_nodes(nodes: List[Dict]) -> Tuple[str, set]:
+    """Analyze nodes to determine trigger type and integrations."""
+    trigger_type = 'Manual'
+    integrations = set()
+    
+    for node in nodes:
+        trigger_type = analyze_node(node, trigger_type, integrations)
+    
+    # Determine if complex based on node variety and count
+    if len(nodes) > 10 and len(integrations) > 3:
+        trigger_type = 'Complex'
+    
+    return trigger_type, integrations
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+In-process caches for the API.
+QueryCache: query results, LRU with a TTL, bounded by the approximate
+serialized size of the cached results, and cleared whenever the index
+generation changes.
+FileHashCache: values derived from a workflow file, keyed by its file_hash.
+"""
+
+import os
+import json
+import time
+import inspect
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 300.0
+
+# Per-workflow derived values (e.g. diagrams) kept by FileHashCache
+DEFAULT_FILE_CACHE_ENTRIES = 4096
+
+# Bookkeeping charged per entry on top of the serialized result
+ENTRY_OVERHEAD_BYTES = 256
+
+_signatures: Dict[Callable, inspect.Signature] = {}
+
+
+def call_key(fn: Callable, args: tuple, kwargs: Dict[str, Any]) -> Tuple:
+    """Cache key for fn(*args, **kwargs): every parameter by name, defaults filled in.
+
+    Runs of whitespace in a search query are collapsed; FTS tokenizes them the same way.
+    """
+    signature = _signatures.get(fn)
+    if signature is None:
+        signature = _signatures[fn] = inspect.signature(fn)
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = dict(bound.arguments)
+    if isinstance(arguments.get('query'), str):
+        arguments['query'] = ' '.join(arguments['query'].split())
+    return (fn.__name__,) + tuple(sorted(arguments.items()))
+
+
+def result_size(value: Any) -> int:
+    """Approximate memory charged for a cached result: its compact JSON size.
+
+    Serializing a large page takes milliseconds: call this off the event loop.
+    """
+    return len(json.dumps(value, default=str, separators=(',', ':'))) + ENTRY_OVERHEAD_BYTES
+
+
+class QueryCache:
+    """LRU + TTL result cache bounded by bytes and tied to one index generation."""
+
+    def __init__(self, max_bytes: Optional[int] = None, ttl: Optional[float] = None):
+        if max_bytes is None:
+            max_bytes = int(os.environ.get('WORKFLOW_QUERY_CACHE_BYTES', DEFAULT_MAX_BYTES))
+        if ttl is None:
+            ttl = float(os.environ.get('WORKFLOW_QUERY_CACHE_TTL', DEFAULT_TTL_SECONDS))
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._entries = OrderedDict()  # key -> (expires_at, size, value)
+        self._lock = threading.Lock()
+        self._generation = None
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def _sync_generation(self, generation: int) -> bool:
+        """Drop everything cached under an older index generation (lock held).
+
+        False for a generation older than the current one: a late caller must
+        neither see nor replace newer entries.
+        """
+        if self._generation is not None and generation < self._generation:
+            return False
+        if generation != self._generation:
+            if self._entries:
+                self.invalidations += 1
+            self._entries.clear()
+            self._bytes = 0
+            self._generation = generation
+        return True
+
+    def get(self, key: Tuple, generation: int) -> Optional[Any]:
+        """Cached result for key, or None. Results are shared: treat them as read-only."""
+        with self._lock:
+            entry = self._entries.get(key) if self._sync_generation(generation) else None
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[0] < time.monotonic():
+                del self._entries[key]
+                self._bytes -= entry[1]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def put(self, key: Tuple, generation: int, value: Any, size: Optional[int] = None):
+        """Store a result computed at `generation`, evicting least recently used entries.
+
+        `size` is result_size(value), computed here when not given.
+        """
+        if size is None:
+            size = result_size(value)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if not self._sync_generation(generation):
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (time.monotonic() + self.ttl, size, value)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'ttl_seconds': self.ttl,
+                'generation': self._generation,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+            }
+
+
+class FileHashCache:
+    """LRU of values derived from one workflow file, valid while its file_hash is unchanged.
+
+    One entry per key (filename): storing a value under a new hash replaces
+    the stale one, and a lookup with a different hash drops it.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None):
+        if max_entries is None:
+            max_entries = int(os.environ.get('WORKFLOW_FILE_CACHE_ENTRIES', DEFAULT_FILE_CACHE_ENTRIES))
+        self.max_entries = max(1, max_entries)
+        self._entries = OrderedDict()  # key -> (file_hash, value)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stale = 0
+
+    def get(self, key: str, file_hash: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] != file_hash:
+                del self._entries[key]
+                self.stale += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, file_hash: str, value: Any):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (file_hash, value)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'stale': self.stale,
+            }
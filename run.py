@@ -67,19 +67,23 @@ def setup_database(force_reindex: bool = False) -> str:
     stats = db.get_stats()
     if stats['total'] == 0 or force_reindex:
         print("📚 Indexing workflows...")
-        index_stats = db.index_all_workflows(force_reindex=True)
+        index_stats = db.index_all_workflows(force_reindex=True, bulk=True)
         print(f"✅ Indexed {index_stats['processed']} workflows")
         
         # Show final stats
         final_stats = db.get_stats()
         print(f"📊 Database contains {final_stats['total']} workflows")
+    elif db.needs_reindex():
+        print("🔄 Index schema or renderer changed. Reindexing workflows...")
+        index_stats = db.index_all_workflows()
+        print(f"✅ Reindexed {index_stats['processed']} workflows")
     else:
         print(f"✅ Database ready: {stats['total']} workflows")
     
     return db_path
 
 
-def start_server(host: str = "127.0.0.1", port: int = 8000, reload: bool = False):
+def start_server(host: str = "127.0.0.1", port: int = 8000, reload: bool = False, watch: bool = False):
     """Start the FastAPI server."""
     print(f"🌐 Starting server at http://{host}:{port}")
     print(f"📊 API Documentation: http://{host}:{port}/docs")
@@ -91,6 +95,10 @@ def start_server(host: str = "127.0.0.1", port: int = 8000, reload: bool = False
     # Configure database path
     os.environ['WORKFLOW_DB_PATH'] = "database/workflows.db"
     
+    # Reindex workflow files as they change
+    if watch:
+        os.environ['WORKFLOW_WATCH'] = "1"
+    
     # Start uvicorn with better configuration
     import uvicorn
     uvicorn.run(
@@ -115,6 +123,7 @@ Examples:
   python run.py --host 0.0.0.0     # Accept external connections
   python run.py --reindex          # Force database reindexing
   python run.py --dev              # Development mode with auto-reload
+  python run.py --watch            # Reindex workflow files as they change
         """
     )
     
@@ -139,6 +148,11 @@ Examples:
         action="store_true", 
         help="Development mode with auto-reload"
     )
+    parser.add_argument(
+        "--watch", 
+        action="store_true", 
+        help="Reindex workflow files as they change (Linux)"
+    )
     
     args = parser.parse_args()
     
@@ -163,7 +177,8 @@ Examples:
         start_server(
             host=args.host, 
             port=args.port, 
-            reload=args.dev
+            reload=args.dev,
+            watch=args.watch
         )
     except KeyboardInterrupt:
         print("\n👋 Server stopped!")
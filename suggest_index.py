@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Suggest Index
+In-memory prefix index behind /api/suggest: workflow names, integrations and
+node types, each ranked by how many workflows use it. Built from the database
+in one pass and replaced when the index generation changes.
+"""
+
+import re
+import heapq
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+# Result groups, in response order
+SUGGEST_KINDS = ('workflows', 'integrations', 'node_types')
+
+# Prefixes up to this length have their top completions precomputed (the first keystrokes are the widest)
+PRECOMPUTED_PREFIX_LENGTH = 2
+
+# Completions kept per precomputed prefix, i.e. the largest limit suggest() serves
+MAX_SUGGESTIONS = 20
+
+_WORD = re.compile(r"[^\W_]+")
+
+
+def prefix_keys(text: str) -> List[str]:
+    """Lowercased keys a value is found under: the whole text and every word in it."""
+    text = text.lower()
+    keys = {text}
+    keys.update(match.group() for match in _WORD.finditer(text))
+    return [key for key in keys if key]
+
+
+def node_type_keys(node_type: str) -> List[str]:
+    """Node types are found by their bare name too: n8n-nodes-base.slack -> slack."""
+    keys = set(prefix_keys(node_type))
+    keys.update(prefix_keys(node_type.rsplit('.', 1)[-1]))
+    return list(keys)
+
+
+class PrefixTable:
+    """Sorted (key, value) pairs for one kind, with the top completions of short prefixes precomputed."""
+
+    def __init__(self, values: List[Tuple[str, int]], key_fn=prefix_keys):
+        # Most used first, so value ids order results and ties break alphabetically
+        self.values = sorted(values, key=lambda item: (-item[1], item[0].lower()))
+        pairs = sorted((key, value_id) for value_id, (text, _) in enumerate(self.values) for key in key_fn(text))
+        self.keys = [key for key, _ in pairs]
+        self.ids = [value_id for _, value_id in pairs]
+
+        self.top = {}
+        for key, value_id in pairs:
+            for length in range(1, min(len(key), PRECOMPUTED_PREFIX_LENGTH) + 1):
+                self.top.setdefault(key[:length], set()).add(value_id)
+        self.top = {prefix: sorted(ids)[:MAX_SUGGESTIONS] for prefix, ids in self.top.items()}
+
+    def complete(self, prefix: str, limit: int) -> List[Dict]:
+        if len(prefix) <= PRECOMPUTED_PREFIX_LENGTH:
+            ids = self.top.get(prefix, [])[:limit]
+        else:
+            start = bisect_left(self.keys, prefix)
+            end = bisect_left(self.keys, prefix + '\U0010ffff', start)
+            ids = heapq.nsmallest(limit, set(self.ids[start:end]))
+        return [{'value': self.values[i][0], 'count': self.values[i][1]} for i in ids]
+
+
+class SuggestIndex:
+    """Top completions per kind for a typed prefix, as of one index generation."""
+
+    def __init__(self, generation: int, names: List[Tuple[str, int]],
+                 integrations: List[Tuple[str, int]], node_types: List[Tuple[str, int]]):
+        self.generation = generation
+        self.tables = {
+            'workflows': PrefixTable(names),
+            'integrations': PrefixTable(integrations),
+            'node_types': PrefixTable(node_types, node_type_keys),
+        }
+
+    @classmethod
+    def build(cls, conn, generation: int) -> 'SuggestIndex':
+        """Read names, integrations and node types with their workflow counts."""
+        names = conn.execute("SELECT name, COUNT(*) FROM workflows GROUP BY name").fetchall()
+        integrations = conn.execute("""
+            SELECT integration, SUM(workflows) FROM integration_stats
+            GROUP BY integration HAVING SUM(workflows) > 0
+        """).fetchall()
+        node_types = conn.execute(
+            "SELECT type, COUNT(DISTINCT workflow_rowid) FROM nodes GROUP BY type"
+        ).fetchall()
+        return cls(generation, [tuple(row) for row in names], [tuple(row) for row in integrations],
+                   [tuple(row) for row in node_types])
+
+    def complete(self, query: str, limit: int = 8) -> Dict[str, List[Dict]]:
+        """Up to `limit` completions of each kind for `query`, most used first."""
+        prefix = ' '.join(query.lower().split())
+        limit = max(0, min(limit, MAX_SUGGESTIONS))
+        if not prefix:
+            return {kind: [] for kind in SUGGEST_KINDS}
+        return {kind: self.tables[kind].complete(prefix, limit) for kind in SUGGEST_KINDS}
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Workflow Analysis
+Content-only analysis of workflow files shared by every builder, plus a
+persistent cache of results keyed by file content hash and analyzer version.
+"""
+
+import os
+import json
+import hashlib
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import integration_detection
+
+try:
+    import ijson  # Optional: streaming extraction for large workflow files
+    JSONStreamError = ijson.JSONError
+except ImportError:
+    ijson = None
+    JSONStreamError = json.JSONDecodeError
+
+# Bump whenever analyze_workflow_bytes (or anything it calls) changes its output;
+# cached results from other versions are then ignored and pruned.
+ANALYZER_VERSION = '2'
+
+DEFAULT_CACHE_PATH = os.path.join('database', 'analysis_cache.db')
+
+# Upper bound on the extracted FTS content per workflow (characters)
+MAX_CONTENT_CHARS = 256 * 1024
+
+# Files at least this large are parsed as an event stream instead of json.loads
+STREAMING_MIN_BYTES = 64 * 1024
+
+# Read size for hashing files that are streamed rather than read whole
+HASH_CHUNK_BYTES = 64 * 1024
+
+# Top-level workflow fields the builders read; everything else is skipped while streaming
+STREAMED_FIELDS = ('name', 'description', 'id', 'active', 'tags', 'createdAt', 'updatedAt', 'connections')
+
+# Errors that mean the file is not a readable workflow document
+ANALYSIS_ERRORS = (json.JSONDecodeError, UnicodeDecodeError, JSONStreamError)
+
+
+def read_workflow_file(file_path: str) -> Tuple[Optional[bytes], str]:
+    """Return (raw, md5 hex digest) for a workflow file.
+
+    Files of STREAMING_MIN_BYTES or more are hashed in chunks and raw is None:
+    analyze_workflow_path streams them from disk instead of holding them whole.
+    """
+    with open(file_path, 'rb') as f:
+        if ijson is None or os.fstat(f.fileno()).st_size < STREAMING_MIN_BYTES:
+            raw = f.read()
+            return raw, hashlib.md5(raw).hexdigest()
+        digest = hashlib.md5()
+        for chunk in iter(lambda: f.read(HASH_CHUNK_BYTES), b''):
+            digest.update(chunk)
+        return None, digest.hexdigest()
+
+
+def analyze_workflow_path(file_path: str) -> Dict[str, Any]:
+    """analyze_workflow_bytes for a file on disk, streaming large files from the open file."""
+    with open(file_path, 'rb') as f:
+        return _analyze_workflow_fields(iter_workflow_fields(f), os.fstat(f.fileno()).st_size)
+
+
+def analyze_workflow_bytes(raw: bytes) -> Dict[str, Any]:
+    """Analyze a workflow document and return everything derived from its content.
+
+    The result depends only on the bytes (never on the filename), so it can be
+    cached by content hash. It holds the raw top-level `fields`, `node_count`,
+    `trigger_type`, `integrations`, the searchable `content`, `file_size` and
+    the workflow graph as `nodes` and `edges` rows (see node_row / edge_rows).
+    Each node is analyzed and reduced to its searchable text as soon as it is
+    parsed, so the node array is never held in memory. Raises one of
+    ANALYSIS_ERRORS for unreadable documents.
+    """
+    return _analyze_workflow_fields(iter_workflow_fields(raw), len(raw))
+
+
+def _analyze_workflow_fields(workflow_fields: Iterable[Tuple[str, Any]], file_size: int) -> Dict[str, Any]:
+    fields = {}
+    nodes = []
+    edges = []
+    node_parts = []
+    node_parts_size = 0
+    node_count = 0
+    trigger_type = 'Manual'
+    integrations = set()
+    for key, value in workflow_fields:
+        if key == 'connections':
+            edges = edge_rows(value)
+            continue
+        if key != 'node':
+            fields[key] = value
+            continue
+        node_count += 1
+        nodes.append(node_row(value))
+        trigger_type = integration_detection.analyze_node(value, trigger_type, integrations)
+        if node_parts_size < MAX_CONTENT_CHARS:
+            for part in extract_node_content(value):
+                node_parts.append(part)
+                node_parts_size += len(part) + 1
+
+    # Assemble FTS content in the same order as extract_workflow_content
+    content_parts = []
+    if 'name' in fields:
+        content_parts.append(fields['name'])
+    if 'description' in fields:
+        content_parts.append(fields['description'])
+    content_parts.extend(node_parts)
+    if 'tags' in fields:
+        content_parts.extend(extract_tags_content(fields['tags']))
+    content = ' '.join(filter(None, content_parts))[:MAX_CONTENT_CHARS]
+
+    # Determine if complex based on node variety and count
+    if node_count > 10 and len(integrations) > 3:
+        trigger_type = 'Complex'
+
+    return {
+        'fields': fields,
+        'node_count': node_count,
+        'trigger_type': trigger_type,
+        'integrations': list(integrations),
+        'content': content,
+        'file_size': file_size,
+        'nodes': nodes,
+        'edges': edges,
+    }
+
+
+def node_row(node: Dict) -> List:
+    """[name, type, typeVersion, x, y] for one node."""
+    position = node.get('position')
+    if not isinstance(position, list) or len(position) < 2:
+        position = [None, None]
+    return [node.get('name'), node.get('type', ''), node.get('typeVersion'), position[0], position[1]]
+
+
+def edge_rows(connections: Dict) -> List[List]:
+    """[source, target, connection type, output index, target input index] for every connection.
+
+    n8n stores connections as {source: {type: [[{node, type, index}, ...], ...]}}
+    where the position in the outer list is the source output index.
+    """
+    edges = []
+    if not isinstance(connections, dict):
+        return edges
+    for source, outputs_by_type in connections.items():
+        if not isinstance(outputs_by_type, dict):
+            continue
+        for connection_type, outputs in outputs_by_type.items():
+            if not isinstance(outputs, list):
+                continue
+            for output_index, targets in enumerate(outputs):
+                for target in targets or []:
+                    if isinstance(target, dict) and target.get('node'):
+                        edges.append([source, target['node'], connection_type, output_index, target.get('index', 0)])
+    return edges
+
+
+def iter_workflow_fields(source):
+    """Yield (key, value) pairs for the top-level workflow fields used by the builders.
+
+    source is the document's bytes or a binary file open at its start. Nodes
+    are yielded one at a time as ('node', node). Documents larger than
+    STREAMING_MIN_BYTES are walked as an ijson event stream (read from the file
+    in pieces when given one) so only the wanted fields are ever materialized;
+    smaller ones (or all of them, when ijson is not installed) are parsed with
+    json.loads, which is faster.
+    """
+    is_bytes = isinstance(source, (bytes, bytearray))
+    size = len(source) if is_bytes else os.fstat(source.fileno()).st_size
+    if ijson is None or size < STREAMING_MIN_BYTES:
+        if ijson is None and size >= STREAMING_MIN_BYTES:
+            _warn_no_ijson()
+        raw = source if is_bytes else source.read()
+        data = json.loads(raw.decode('utf-8'))
+        nodes = data.pop('nodes', None) or []
+        for key in STREAMED_FIELDS:
+            if key in data:
+                yield key, data[key]
+        del data
+        # Release each node as soon as it has been consumed
+        nodes.reverse()
+        while nodes:
+            yield 'node', nodes.pop()
+        return
+
+    builder = None
+    builder_key = None
+    builder_prefix = None
+    for prefix, event, value in ijson.parse(source, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == builder_prefix and event in ('end_map', 'end_array'):
+                yield builder_key, builder.value
+                builder = None
+            continue
+
+        if prefix == 'nodes.item':
+            key = 'node'
+        elif prefix in STREAMED_FIELDS:
+            key = prefix
+        else:
+            continue
+
+        if event in ('start_map', 'start_array'):
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            builder_key = key
+            builder_prefix = prefix
+        elif event != 'map_key':
+            yield key, value
+
+
+_ijson_warned = False
+
+
+def _warn_no_ijson():
+    """Say once per process that large files are being parsed whole."""
+    global _ijson_warned
+    if not _ijson_warned:
+        _ijson_warned = True
+        print("Warning: ijson is not installed; large workflow files are parsed in memory "
+              "(pip install -r requirements.txt)")
+
+
+def extract_workflow_content(workflow_data: Dict) -> str:
+    """Extract all searchable content from workflow JSON including nodes, parameters, and sticky notes."""
+    content_parts = []
+
+    # Extract basic workflow info
+    if 'name' in workflow_data:
+        content_parts.append(workflow_data['name'])
+
+    if 'description' in workflow_data:
+        content_parts.append(workflow_data['description'])
+
+    # Extract content from nodes
+    if 'nodes' in workflow_data:
+        for node in workflow_data['nodes']:
+            content_parts.extend(extract_node_content(node))
+
+    # Extract tags and metadata
+    if 'tags' in workflow_data:
+        content_parts.extend(extract_tags_content(workflow_data['tags']))
+
+    # Join all content with spaces for better search
+    return ' '.join(filter(None, content_parts))
+
+
+def extract_node_content(node: Dict) -> List[str]:
+    """Extract the searchable text of one node: type, name, parameters, notes and code."""
+    content_parts = []
+
+    # Node type and name
+    if 'type' in node:
+        content_parts.append(node['type'])
+    if 'name' in node:
+        content_parts.append(node['name'])
+
+    # Node parameters and content
+    if 'parameters' in node:
+        content_parts.append(extract_parameters_content(node['parameters']))
+
+    # Sticky note content (very important for search)
+    if node.get('type') in ['n8n-nodes-base.stickyNote', 'n8n-nodes-base.stickyNote']:
+        if 'parameters' in node and 'content' in node['parameters']:
+            content_parts.append(node['parameters']['content'])
+
+    # Code node content
+    if node.get('type') in ['n8n-nodes-base.code', 'n8n-nodes-base.function']:
+        if 'parameters' in node and 'jsCode' in node['parameters']:
+            content_parts.append(node['parameters']['jsCode'])
+        if 'parameters' in node and 'functionCode' in node['parameters']:
+            content_parts.append(node['parameters']['functionCode'])
+
+    # HTTP Request content
+    if node.get('type') == 'n8n-nodes-base.httpRequest':
+        if 'parameters' in node:
+            params = node['parameters']
+            if 'url' in params:
+                content_parts.append(str(params['url']))
+            if 'method' in params:
+                content_parts.append(str(params['method']))
+            if 'body' in params:
+                content_parts.append(str(params['body']))
+
+    # Form trigger content
+    if node.get('type') == 'n8n-nodes-base.formTrigger':
+        if 'parameters' in node:
+            params = node['parameters']
+            if 'formTitle' in params:
+                content_parts.append(str(params['formTitle']))
+            if 'formFields' in params:
+                content_parts.append(str(params['formFields']))
+
+    return content_parts
+
+
+def extract_tags_content(tags: List) -> List[str]:
+    """Extract tag names for search."""
+    content_parts = []
+    for tag in tags:
+        if isinstance(tag, dict):
+            if 'name' in tag:
+                content_parts.append(tag['name'])
+        else:
+            content_parts.append(str(tag))
+    return content_parts
+
+
+def extract_parameters_content(parameters: Dict) -> str:
+    """Recursively extract text content from node parameters."""
+    content_parts = []
+
+    for key, value in parameters.items():
+        if isinstance(value, str):
+            content_parts.append(value)
+        elif isinstance(value, dict):
+            content_parts.append(extract_parameters_content(value))
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, str):
+                    content_parts.append(item)
+                elif isinstance(item, dict):
+                    content_parts.append(extract_parameters_content(item))
+        elif value is not None:
+            content_parts.append(str(value))
+
+    return ' '.join(filter(None, content_parts))
+
+
+class AnalysisCache:
+    """On-disk cache of analyze_workflow_bytes results.
+
+    Entries are keyed by (file content hash, ANALYZER_VERSION), so renamed or
+    copied files hit the same entry and an analyzer bump invalidates everything.
+    Shared by the SQLite indexer and the Vercel builder; any failure to open the
+    cache file (e.g. a read-only filesystem) just disables caching.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            path = os.environ.get('WORKFLOW_ANALYSIS_CACHE', DEFAULT_CACHE_PATH)
+        self.path = path
+        self.enabled = True
+        self._local = threading.local()
+        self._pruned = False
+
+    def __getstate__(self):
+        """Connections stay in the process that opened them."""
+        return {'path': self.path, 'enabled': self.enabled}
+
+    def __setstate__(self, state):
+        self.__init__(state['path'])
+        self.enabled = state['enabled']
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        if not self.enabled:
+            return None
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            return conn
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS analysis (
+                    file_hash TEXT NOT NULL,
+                    analyzer_version TEXT NOT NULL,
+                    data TEXT NOT NULL,
+                    PRIMARY KEY (file_hash, analyzer_version)
+                ) WITHOUT ROWID
+            """)
+            conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            print(f"Warning: analysis cache disabled ({self.path}: {e})")
+            self.enabled = False
+            return None
+        self._local.conn = conn
+        return conn
+
+    def get(self, file_hash: str) -> Optional[Dict[str, Any]]:
+        """Return the cached analysis for this content hash, or None."""
+        conn = self._connect()
+        if conn is None:
+            return None
+        row = conn.execute(
+            "SELECT data FROM analysis WHERE file_hash = ? AND analyzer_version = ?",
+            (file_hash, ANALYZER_VERSION)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_many(self, entries: Iterable[Tuple[str, Dict[str, Any]]]):
+        """Store (file_hash, analysis) pairs in one transaction."""
+        conn = self._connect()
+        if conn is None:
+            return
+        rows = [(file_hash, ANALYZER_VERSION, json.dumps(analysis)) for file_hash, analysis in entries]
+        if not rows:
+            return
+        try:
+            if not self._pruned:
+                # Results from other analyzer versions can never be read again
+                conn.execute("DELETE FROM analysis WHERE analyzer_version != ?", (ANALYZER_VERSION,))
+                self._pruned = True
+            conn.executemany("INSERT OR REPLACE INTO analysis (file_hash, analyzer_version, data) VALUES (?, ?, ?)", rows)
+            conn.commit()
+        except sqlite3.Error as e:
+            conn.rollback()
+            print(f"Warning: could not update analysis cache: {e}")
+
+    def put(self, file_hash: str, analysis: Dict[str, Any]):
+        self.put_many([(file_hash, analysis)])
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -7,21 +7,314 @@ SQLite-based workflow indexer and search engine for instant performance.
 import sqlite3
 import json
 import os
+import re
 import glob
 import datetime
 import hashlib
+import base64
+import secrets
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 
+import integration_detection
+import workflow_analysis
+import workflow_svg
+from workflow_analysis import AnalysisCache
+from suggest_index import SuggestIndex
+
+# Triggers that mirror every workflows write into workflows_fts
+FTS_SYNC_TRIGGERS = ('workflows_ai', 'workflows_ad', 'workflows_au')
+
+# workflows_fts columns in declaration order (bm25 weights follow this order)
+FTS_COLUMNS = ('filename', 'name', 'description', 'integrations', 'tags', 'content')
+FTS_DETAIL_LEVELS = ('full', 'column', 'none')
+
+# workflows_fts options used when the table is created. Pass fts_config to
+# WorkflowDatabase (or --fts-* on the command line) to rebuild with others.
+DEFAULT_FTS_CONFIG = {
+    'tokenize': 'unicode61',
+    'prefix': (),          # prefix index lengths, e.g. (2, 3); they roughly triple the index size
+    'detail': 'full',      # full, column or none; phrase queries need full
+    'columnsize': True,    # False saves space but bm25 then reads the content rows
+    'weights': {           # bm25 weight per column: a name hit beats a hit in the JSON body
+        'filename': 2.0, 'name': 10.0, 'description': 5.0,
+        'integrations': 4.0, 'tags': 3.0, 'content': 1.0,
+    },
+}
+
+# Rows per executemany batch / transaction during bulk loads
+BULK_BATCH_SIZE = 1000
+
+# Pragmas for the long-lived per-thread read connections
+READER_PRAGMAS = (
+    "PRAGMA query_only=ON",
+    "PRAGMA mmap_size=268435456",  # 256 MB memory-mapped reads
+    "PRAGMA cache_size=-32768",    # 32 MB page cache per connection
+    "PRAGMA temp_store=MEMORY",
+)
+
+# Prepared statements kept per connection (search builds a handful of SQL shapes)
+STATEMENT_CACHE_SIZE = 256
+
+# Every change to indexed rows bumps this counter (via triggers on workflows; load_categories
+# bumps once per changed load); cached totals are keyed by it
+GENERATION_BUMP_SQL = "UPDATE index_meta SET value = value + 1 WHERE key = 'generation'"
+GENERATION_TABLES = ('workflows',)
+
+# Aggregates behind get_stats(), kept current by triggers as rows come and go:
+# (stat, key) -> value for total / active / nodes, per trigger type, per complexity, per integration
+STATS_TRIGGERS = {
+    'workflows_stats_ai': ("AFTER INSERT ON workflows", ("new", 1)),
+    'workflows_stats_ad': ("AFTER DELETE ON workflows", ("old", -1)),
+    'workflows_stats_au': ("AFTER UPDATE OF active, trigger_type, complexity, node_count ON workflows",
+                           ("old", -1), ("new", 1)),
+    'workflow_integrations_stats_ai': ("AFTER INSERT ON workflow_integrations", ("new", 1)),
+    'workflow_integrations_stats_ad': ("AFTER DELETE ON workflow_integrations", ("old", -1)),
+}
+
+STATS_UPSERT_SQL = """
+    INSERT INTO workflow_stats (stat, key, value) VALUES ({stat}, {key}, {value})
+    ON CONFLICT (stat, key) DO UPDATE SET value = value + excluded.value;
+"""
+
+# Per-integration trigger mix behind get_integrations(). Junction rows are only ever
+# removed along with their workflow, so the workflow side takes them out of the counts.
+INTEGRATION_STATS_TRIGGERS = {
+    'workflow_integrations_mix_ai': """
+        AFTER INSERT ON workflow_integrations BEGIN
+            INSERT INTO integration_stats (integration, trigger_type, workflows)
+            SELECT new.integration, COALESCE(w.trigger_type, ''), 1 FROM workflows w WHERE w.id = new.workflow_rowid
+            ON CONFLICT (integration, trigger_type) DO UPDATE SET workflows = workflows + 1;
+        END
+    """,
+    'workflows_mix_bd': """
+        BEFORE DELETE ON workflows BEGIN
+            UPDATE integration_stats SET workflows = workflows - 1
+            WHERE trigger_type = COALESCE(old.trigger_type, '')
+              AND integration IN (SELECT integration FROM workflow_integrations WHERE workflow_rowid = old.id);
+        END
+    """,
+    'workflows_mix_au': """
+        AFTER UPDATE OF trigger_type ON workflows
+        WHEN COALESCE(old.trigger_type, '') != COALESCE(new.trigger_type, '') BEGIN
+            UPDATE integration_stats SET workflows = workflows - 1
+            WHERE trigger_type = COALESCE(old.trigger_type, '')
+              AND integration IN (SELECT integration FROM workflow_integrations WHERE workflow_rowid = old.id);
+            INSERT INTO integration_stats (integration, trigger_type, workflows)
+            SELECT integration, COALESCE(new.trigger_type, ''), 1 FROM workflow_integrations WHERE workflow_rowid = new.id
+            ON CONFLICT (integration, trigger_type) DO UPDATE SET workflows = workflows + 1;
+        END
+    """,
+}
+
+# Sort orders accepted by get_integrations()
+INTEGRATION_SORTS = {
+    'count': "workflows DESC, integration COLLATE NOCASE",
+    'name': "integration COLLATE NOCASE, workflows DESC",
+}
+
+# Facet counts over the rows matching a search, one UNION ALL member each; `m` holds the matches
+FACET_SQL = {
+    'trigger': "SELECT 'trigger', m.trigger_type, COUNT(*) FROM m GROUP BY m.trigger_type",
+    'complexity': "SELECT 'complexity', m.complexity, COUNT(*) FROM m GROUP BY m.complexity",
+    'category': """
+        SELECT 'category', COALESCE(c.category, 'Uncategorized'), COUNT(*)
+        FROM m LEFT JOIN workflow_categories c ON c.filename = m.filename GROUP BY 2
+    """,
+    'integration': """
+        SELECT 'integration', wi.integration, COUNT(*)
+        FROM m JOIN workflow_integrations wi ON wi.workflow_rowid = m.id
+        GROUP BY wi.integration COLLATE BINARY
+    """,
+}
+
+# Integration facet values returned (most frequent first)
+FACET_INTEGRATION_LIMIT = 20
+
+# How search_workflows_page() may produce its total
+COUNT_MODES = ('exact', 'estimate', 'none')
+
+# Filenames bound per get_many() statement (below SQLite's host parameter limit)
+LOOKUP_BATCH_SIZE = 500
+
+# Exact totals remembered per (generation, query shape, parameters)
+COUNT_CACHE_SIZE = 1024
+
+# Rowids counted for count='estimate', split into evenly spaced strata, before scaling up
+ESTIMATE_SAMPLE_ROWS = 5000
+ESTIMATE_STRATA = 16
+
+WORKFLOW_UPSERT_SQL = """
+    INSERT OR REPLACE INTO workflows (
+        filename, name, workflow_id, active, description, trigger_type,
+        complexity, node_count, integrations, tags, created_at, updated_at,
+        file_hash, file_size, content, analyzed_at
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+
+MANIFEST_UPSERT_SQL = """
+    INSERT OR REPLACE INTO file_manifest (path, filename, size, mtime_ns, inode, file_hash)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+# Graph rows are attached to their workflow by filename (UNIQUE, so an index lookup)
+NODE_INSERT_SQL = """
+    INSERT INTO nodes (workflow_rowid, node_index, name, type, type_version, position_x, position_y)
+    VALUES ((SELECT id FROM workflows WHERE filename = ?), ?, ?, ?, ?, ?, ?)
+"""
+
+EDGE_INSERT_SQL = """
+    INSERT INTO edges (workflow_rowid, source_node, target_node, connection_type, output_index, target_index)
+    VALUES ((SELECT id FROM workflows WHERE filename = ?), ?, ?, ?, ?, ?)
+"""
+
+INTEGRATION_INSERT_SQL = """
+    INSERT OR IGNORE INTO workflow_integrations (workflow_rowid, integration)
+    VALUES ((SELECT id FROM workflows WHERE filename = ?), ?)
+"""
+
+TAG_INSERT_SQL = """
+    INSERT OR IGNORE INTO workflow_tags (workflow_rowid, tag)
+    VALUES ((SELECT id FROM workflows WHERE filename = ?), ?)
+"""
+
+DIAGRAM_INSERT_SQL = """
+    INSERT OR REPLACE INTO workflow_diagrams (workflow_rowid, svg, thumbnail)
+    VALUES ((SELECT id FROM workflows WHERE filename = ?), ?, ?)
+"""
+
+# Per-workflow child rows, in the order _child_rows returns them
+CHILD_INSERT_SQL = (NODE_INSERT_SQL, EDGE_INSERT_SQL, INTEGRATION_INSERT_SQL, TAG_INSERT_SQL, DIAGRAM_INSERT_SQL)
+
+# Workflow row columns returned by searches and lookups: everything but the content blob
+# (up to 256 KB each, used only for full-text matching), so cached results stay small
+WORKFLOW_COLUMNS_SQL = ", ".join(f"w.{column}" for column in (
+    'id', 'filename', 'name', 'workflow_id', 'active', 'description', 'trigger_type', 'complexity',
+    'node_count', 'integrations', 'tags', 'created_at', 'updated_at', 'file_hash', 'file_size', 'analyzed_at'
+))
+
+# Result column giving each workflow's category (see workflow_categories)
+CATEGORY_COLUMN_SQL = "COALESCE((SELECT c.category FROM workflow_categories c WHERE c.filename = w.filename), 'Uncategorized') AS category"
+
+# Tables filled from each workflow's analysis alongside its row
+CHILD_TABLES = ('nodes', 'edges', 'workflow_integrations', 'workflow_tags', 'workflow_diagrams')
+
+
+def encode_cursor(workflow: Dict[str, Any], ranked: bool) -> str:
+    """Opaque keyset cursor for the row after `workflow` in search_workflows order."""
+    key = ['r', workflow['rank'], workflow['id']] if ranked else ['t', workflow['id']]
+    raw = json.dumps(key, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str, ranked: bool) -> List[Any]:
+    """Seek parameters from a cursor; ValueError if it is malformed or from another ordering."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        kind, *key = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if kind != ('r' if ranked else 't') or len(key) != (2 if ranked else 1) or not isinstance(key[-1], int):
+        raise ValueError("Cursor does not belong to this search")
+    return key
+
+
+def resolve_fts_config(overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """DEFAULT_FTS_CONFIG with `overrides` applied and checked; weights merge per column."""
+    config = dict(DEFAULT_FTS_CONFIG)
+    overrides = dict(overrides or {})
+    weights = dict(DEFAULT_FTS_CONFIG['weights'])
+    weights.update(overrides.pop('weights', None) or {})
+    unknown = set(overrides) - set(config)
+    if unknown:
+        raise ValueError(f"Unknown FTS options: {', '.join(sorted(unknown))}")
+    config.update(overrides)
+    config['weights'] = weights
+    
+    if not re.fullmatch(r"\w+( \w+)*", str(config['tokenize'])):
+        raise ValueError(f"Invalid FTS tokenizer: {config['tokenize']!r}")
+    prefix = config['prefix']
+    if isinstance(prefix, str):
+        prefix = prefix.replace(',', ' ').split()
+    try:
+        config['prefix'] = tuple(sorted({int(length) for length in (prefix or ())}))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid FTS prefix lengths: {config['prefix']!r}") from e
+    if any(length < 1 or length > 999 for length in config['prefix']):
+        raise ValueError("FTS prefix lengths must be between 1 and 999")
+    if config['detail'] not in FTS_DETAIL_LEVELS:
+        raise ValueError(f"FTS detail must be one of {', '.join(FTS_DETAIL_LEVELS)}")
+    config['columnsize'] = bool(config['columnsize'])
+    unknown = set(weights) - set(FTS_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown FTS columns in weights: {', '.join(sorted(unknown))}")
+    config['weights'] = {column: float(weights[column]) for column in FTS_COLUMNS}
+    return config
+
+
+def fts_table_sql(config: Dict[str, Any]) -> str:
+    """CREATE VIRTUAL TABLE statement for workflows_fts with the options in `config`."""
+    options = [
+        "content=workflows",
+        "content_rowid=id",
+        f"tokenize='{config['tokenize']}'",
+        f"detail={config['detail']}",
+        f"columnsize={int(config['columnsize'])}",
+    ]
+    if config['prefix']:
+        options.append(f"prefix='{' '.join(str(length) for length in config['prefix'])}'")
+    return f"CREATE VIRTUAL TABLE workflows_fts USING fts5({', '.join(FTS_COLUMNS + tuple(options))})"
+
+
+def fts_rank_function(weights: Dict[str, float]) -> str:
+    """The bm25() call workflows_fts uses as its rank, weights in column order."""
+    return f"bm25({', '.join(repr(weights[column]) for column in FTS_COLUMNS)})"
+
+
+def tag_names(raw_tags: List) -> List[str]:
+    """Display names for stored tags; n8n tags may be plain strings or {id, name} objects."""
+    clean_tags = []
+    for tag in raw_tags:
+        if isinstance(tag, dict):
+            # Extract name from tag dict if available
+            clean_tags.append(tag.get('name', str(tag.get('id', 'tag'))))
+        else:
+            clean_tags.append(str(tag))
+    return clean_tags
+
+
 class WorkflowDatabase:
     """High-performance SQLite database for workflow metadata and search."""
     
-    def __init__(self, db_path: str = None):
+    def __init__(self, db_path: str = None, analysis_cache: Optional[AnalysisCache] = None,
+                 use_analysis_cache: bool = True, fts_config: Optional[Dict[str, Any]] = None):
         # Use environment variable if no path provided
         if db_path is None:
             db_path = os.environ.get('WORKFLOW_DB_PATH', 'workflows.db')
         self.db_path = db_path
+        # workflows_fts options (see DEFAULT_FTS_CONFIG); given explicitly, they replace an existing table's
+        self._explicit_fts_config = fts_config is not None
+        self.fts_config = resolve_fts_config(fts_config)
         self.workflows_dir = "workflows"
+        self.categories_file = os.path.join("context", "search_categories.json")
+        # Content-hash keyed analysis results, shared with build_vercel_data.py
+        if analysis_cache is None and use_analysis_cache:
+            analysis_cache = AnalysisCache()
+        self.analysis_cache = analysis_cache
+        # Readers: one persistent connection per thread. Writer: one connection, one thread at a time.
+        self._local = threading.local()
+        self._readers = []
+        self._readers_lock = threading.Lock()
+        self._writer_conn = None
+        self._write_lock = threading.RLock()
+        self._count_cache = OrderedDict()
+        self._count_cache_lock = threading.Lock()
+        self._suggest_index = None
+        self._suggest_lock = threading.Lock()
         self.init_database()
     
     def init_database(self):
@@ -55,20 +348,6 @@ class WorkflowDatabase:
             )
         """)
         
-        # Create FTS5 table for full-text search
-        conn.execute("""
-            CREATE VIRTUAL TABLE IF NOT EXISTS workflows_fts USING fts5(
-                filename,
-                name,
-                description,
-                integrations,
-                tags,
-                content,
-                content=workflows,
-                content_rowid=id
-            )
-        """)
-        
         # Create indexes for fast filtering
         conn.execute("CREATE INDEX IF NOT EXISTS idx_trigger_type ON workflows(trigger_type)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_complexity ON workflows(complexity)")
@@ -76,7 +355,198 @@ class WorkflowDatabase:
         conn.execute("CREATE INDEX IF NOT EXISTS idx_node_count ON workflows(node_count)")
         conn.execute("CREATE INDEX IF NOT EXISTS idx_filename ON workflows(filename)")
         
+        # Stat manifest: lets incremental indexing skip unchanged files without reading them
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS file_manifest (
+                path TEXT PRIMARY KEY,
+                filename TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                inode INTEGER NOT NULL,
+                file_hash TEXT NOT NULL
+            )
+        """)
+        
+        existing_tables = {
+            row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        
+        # Workflow graph: one row per node and per connection
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS nodes (
+                workflow_rowid INTEGER NOT NULL,  -- workflows.id
+                node_index INTEGER NOT NULL,
+                name TEXT,
+                type TEXT NOT NULL,
+                type_version NUMERIC,
+                position_x REAL,
+                position_y REAL,
+                PRIMARY KEY (workflow_rowid, node_index)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS edges (
+                workflow_rowid INTEGER NOT NULL,  -- workflows.id
+                source_node TEXT NOT NULL,
+                target_node TEXT NOT NULL,
+                connection_type TEXT NOT NULL,
+                output_index INTEGER NOT NULL,
+                target_index INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_nodes_type ON nodes(type, workflow_rowid)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_edges_workflow ON edges(workflow_rowid)")
+        
+        # Junction tables so integration / tag filters are index lookups, not JSON LIKE scans
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS workflow_integrations (
+                workflow_rowid INTEGER NOT NULL,  -- workflows.id
+                integration TEXT NOT NULL COLLATE NOCASE,
+                PRIMARY KEY (integration, workflow_rowid)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS workflow_tags (
+                workflow_rowid INTEGER NOT NULL,  -- workflows.id
+                tag TEXT NOT NULL COLLATE NOCASE,
+                PRIMARY KEY (tag, workflow_rowid)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_workflow_integrations_workflow ON workflow_integrations(workflow_rowid)")
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_workflow_tags_workflow ON workflow_tags(workflow_rowid)")
+        
+        # Pre-rendered SVG diagram and card thumbnail per workflow (see workflow_svg.py)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS workflow_diagrams (
+                workflow_rowid INTEGER PRIMARY KEY,  -- workflows.id
+                svg TEXT NOT NULL,
+                thumbnail TEXT NOT NULL
+            )
+        """)
+        
+        # Replaced or deleted workflows take their child rows with them
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS workflows_graph_ad AFTER DELETE ON workflows BEGIN
+                DELETE FROM nodes WHERE workflow_rowid = old.id;
+                DELETE FROM edges WHERE workflow_rowid = old.id;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS workflows_diagrams_ad AFTER DELETE ON workflows BEGIN
+                DELETE FROM workflow_diagrams WHERE workflow_rowid = old.id;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS workflows_junction_ad AFTER DELETE ON workflows BEGIN
+                DELETE FROM workflow_integrations WHERE workflow_rowid = old.id;
+                DELETE FROM workflow_tags WHERE workflow_rowid = old.id;
+            END
+        """)
+        
+        # Filename -> category from context/search_categories.json (generated by create_categories.py).
+        # Workflows without a row here are "Uncategorized".
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS workflow_categories (
+                filename TEXT PRIMARY KEY,
+                category TEXT NOT NULL
+            ) WITHOUT ROWID
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_workflow_categories_category ON workflow_categories(category)")
+        
+        # Index generation: bumped on every write to the searchable tables
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS index_meta (
+                key TEXT PRIMARY KEY,
+                value INTEGER NOT NULL
+            ) WITHOUT ROWID
+        """)
+        conn.execute("INSERT OR IGNORE INTO index_meta (key, value) VALUES ('generation', 0)")
+        # Random per-database id: a recreated database restarts its generation, so versions carry both
+        conn.execute("INSERT OR IGNORE INTO index_meta (key, value) VALUES ('database_id', ?)",
+                     (secrets.randbits(62),))
+        stored_render = conn.execute("SELECT value FROM index_meta WHERE key = 'render_version'").fetchone()
+        for table in GENERATION_TABLES:
+            for event in ('INSERT', 'UPDATE', 'DELETE'):
+                conn.execute(f"""
+                    CREATE TRIGGER IF NOT EXISTS {table}_generation_{event.lower()}
+                    AFTER {event} ON {table} BEGIN {GENERATION_BUMP_SQL}; END
+                """)
+        # Per-row category triggers bumped thousands of times per load (older databases)
+        for event in ('insert', 'update', 'delete'):
+            conn.execute(f"DROP TRIGGER IF EXISTS workflow_categories_generation_{event}")
+        
+        # FTS5 table for full-text search
+        self.configure_fts(conn)
+        
+        self.load_categories(conn)
+        
+        # Materialized get_stats() aggregates
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS workflow_stats (
+                stat TEXT NOT NULL,
+                key TEXT NOT NULL DEFAULT '',
+                value INTEGER NOT NULL,
+                PRIMARY KEY (stat, key)
+            ) WITHOUT ROWID
+        """)
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS integration_stats (
+                integration TEXT NOT NULL,
+                trigger_type TEXT NOT NULL,
+                workflows INTEGER NOT NULL,
+                PRIMARY KEY (integration, trigger_type)
+            ) WITHOUT ROWID
+        """)
+        self.create_stats_triggers(conn)
+        if not {'workflow_stats', 'integration_stats'} <= existing_tables:
+            self.rebuild_stats(conn)
+        
+        if (not set(CHILD_TABLES) <= existing_tables
+                or (stored_render is not None and stored_render[0] != workflow_svg.RENDER_VERSION)):
+            # Rows indexed before these tables existed (or drawn by an older renderer) need
+            # new child rows; forget their hashes so the next index run re-reads them, and
+            # record that one is needed since startup only indexes an empty database
+            conn.execute("DELETE FROM file_manifest")
+            conn.execute("UPDATE workflows SET file_hash = NULL")
+            conn.execute("INSERT OR REPLACE INTO index_meta (key, value) VALUES ('needs_reindex', 1)")
+        conn.execute("INSERT OR REPLACE INTO index_meta (key, value) VALUES ('render_version', ?)",
+                     (workflow_svg.RENDER_VERSION,))
+        
         # Create triggers to keep FTS table in sync
+        self.create_fts_triggers(conn)
+        
+        conn.commit()
+        conn.close()
+    
+    def configure_fts(self, conn):
+        """Create workflows_fts, or rebuild it when fts_config asks for different options.
+        
+        Without an explicit fts_config an existing table keeps its options and
+        weights. The bm25 column weights are stored as the table's rank
+        function, so every `ORDER BY rank` query uses them; a table without
+        one (e.g. created before weights existed) gets the configured weights.
+        """
+        existing = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = 'workflows_fts'"
+        ).fetchone()
+        table_sql = fts_table_sql(self.fts_config)
+        if existing is None:
+            conn.execute(table_sql)
+        elif self._explicit_fts_config and existing[0] != table_sql:
+            print("Rebuilding full-text index with new FTS options...")
+            conn.execute("DROP TABLE workflows_fts")
+            conn.execute(table_sql)
+            conn.execute("INSERT INTO workflows_fts(workflows_fts) VALUES('rebuild')")
+            conn.execute("INSERT INTO workflows_fts(workflows_fts) VALUES('optimize')")
+            conn.execute(GENERATION_BUMP_SQL)
+        rank = fts_rank_function(self.fts_config['weights'])
+        current = conn.execute("SELECT v FROM workflows_fts_config WHERE k = 'rank'").fetchone()
+        if current is None or (self._explicit_fts_config and current[0] != rank):
+            conn.execute("INSERT INTO workflows_fts(workflows_fts, rank) VALUES('rank', ?)", (rank,))
+            conn.execute(GENERATION_BUMP_SQL)  # same matches, new order
+    
+    def create_fts_triggers(self, conn):
+        """Create the triggers that keep workflows_fts in sync with workflows."""
         conn.execute("""
             CREATE TRIGGER IF NOT EXISTS workflows_ai AFTER INSERT ON workflows BEGIN
                 INSERT INTO workflows_fts(rowid, filename, name, description, integrations, tags, content)
@@ -99,9 +569,81 @@ class WorkflowDatabase:
                 VALUES (new.id, new.filename, new.name, new.description, new.integrations, new.tags, new.content);
             END
         """)
+    
+    def create_stats_triggers(self, conn):
+        """Create the triggers that apply every workflows / workflow_integrations change to workflow_stats."""
+        for name, (event, *changes) in STATS_TRIGGERS.items():
+            statements = []
+            for row, sign in changes:
+                if event.endswith('workflow_integrations'):
+                    updates = [("'integration'", f"{row}.integration", sign)]
+                else:
+                    updates = [
+                        ("'total'", "''", sign),
+                        ("'active'", "''", f"{sign} * {row}.active"),
+                        ("'nodes'", "''", f"{sign} * COALESCE({row}.node_count, 0)"),
+                        ("'trigger'", f"COALESCE({row}.trigger_type, '')", sign),
+                        ("'complexity'", f"COALESCE({row}.complexity, '')", sign),
+                    ]
+                statements += [STATS_UPSERT_SQL.format(stat=stat, key=key, value=value)
+                               for stat, key, value in updates]
+            conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {event} BEGIN {''.join(statements)} END")
+        for name, body in INTEGRATION_STATS_TRIGGERS.items():
+            conn.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+    
+    def rebuild_stats(self, conn):
+        """Recompute workflow_stats and integration_stats from scratch (new databases and upgrades)."""
+        conn.execute("DELETE FROM workflow_stats")
+        conn.execute("""
+            INSERT INTO workflow_stats (stat, key, value)
+            SELECT 'total', '', COUNT(*) FROM workflows
+            UNION ALL SELECT 'active', '', COALESCE(SUM(active), 0) FROM workflows
+            UNION ALL SELECT 'nodes', '', COALESCE(SUM(node_count), 0) FROM workflows
+            UNION ALL SELECT 'trigger', COALESCE(trigger_type, ''), COUNT(*) FROM workflows GROUP BY 2
+            UNION ALL SELECT 'complexity', COALESCE(complexity, ''), COUNT(*) FROM workflows GROUP BY 2
+            UNION ALL SELECT 'integration', integration, COUNT(*) FROM workflow_integrations
+                GROUP BY integration COLLATE BINARY  -- spellings stay apart, as in the triggers
+        """)
+        conn.execute("DELETE FROM integration_stats")
+        conn.execute("""
+            INSERT INTO integration_stats (integration, trigger_type, workflows)
+            SELECT wi.integration, COALESCE(w.trigger_type, ''), COUNT(*)
+            FROM workflow_integrations wi JOIN workflows w ON w.id = wi.workflow_rowid
+            GROUP BY wi.integration COLLATE BINARY, COALESCE(w.trigger_type, '')
+        """)
+    
+    def load_categories(self, conn) -> bool:
+        """Bring workflow_categories in line with the categories file; True if any row changed.
         
-        conn.commit()
-        conn.close()
+        Only differing rows are written, so an unchanged file costs no writes
+        (and leaves the index generation and every cache keyed by it alone).
+        """
+        if not os.path.exists(self.categories_file):
+            return False
+        try:
+            with open(self.categories_file, 'r', encoding='utf-8') as f:
+                items = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Warning: Could not load categories from {self.categories_file}: {e}")
+            return False
+        categories = {
+            item['filename']: item['category'] for item in items
+            if item.get('filename') and item.get('category') and item['category'] != 'Uncategorized'
+        }
+        current = {row[0]: row[1] for row in conn.execute("SELECT filename, category FROM workflow_categories")}
+        removed = [(filename,) for filename in current if filename not in categories]
+        changed = [(filename, category) for filename, category in categories.items()
+                   if current.get(filename) != category]
+        conn.executemany("DELETE FROM workflow_categories WHERE filename = ?", removed)
+        conn.executemany("INSERT OR REPLACE INTO workflow_categories (filename, category) VALUES (?, ?)", changed)
+        if removed or changed:
+            conn.execute(GENERATION_BUMP_SQL)
+        return bool(removed or changed)
+    
+    def drop_fts_triggers(self, conn):
+        """Drop the FTS sync triggers (bulk loads rebuild the FTS index once instead)."""
+        for trigger in FTS_SYNC_TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {trigger}")
     
     def get_file_hash(self, file_path: str) -> str:
         """Get MD5 hash of file for change detection."""
@@ -149,46 +691,63 @@ class WorkflowDatabase:
         
         return ' '.join(readable_parts)
     
-    def analyze_workflow_file(self, file_path: str) -> Optional[Dict[str, Any]]:
-        """Analyze a single workflow file and extract metadata."""
+    def analyze_workflow_file(self, file_path: str, raw: Optional[bytes] = None,
+                              file_hash: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """Analyze a single workflow file and extract metadata.
+
+        Callers that already read (and hashed) the file can pass its bytes to
+        avoid reading it again.
+        """
+        if raw is None and file_hash is None:
+            raw, file_hash = workflow_analysis.read_workflow_file(file_path)
+        analysis = self.analyze_workflow_content(file_path, raw)
+        if analysis is None:
+            return None
+        if file_hash is None:
+            file_hash = hashlib.md5(raw).hexdigest()
+        return self.build_workflow_record(os.path.basename(file_path), analysis, file_hash)
+    
+    def analyze_workflow_content(self, file_path: str, raw: Optional[bytes] = None) -> Optional[Dict[str, Any]]:
+        """Run the shared, content-only analysis (the part stored in the analysis cache).
+
+        Without raw, the file is streamed from disk (see read_workflow_file).
+        """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            if raw is None:
+                return workflow_analysis.analyze_workflow_path(file_path)
+            return workflow_analysis.analyze_workflow_bytes(raw)
+        except workflow_analysis.ANALYSIS_ERRORS as e:
             print(f"Error reading {file_path}: {str(e)}")
             return None
-        
-        filename = os.path.basename(file_path)
-        file_size = os.path.getsize(file_path)
-        file_hash = self.get_file_hash(file_path)
-        
-        # Extract comprehensive content for FTS
-        content = self.extract_workflow_content(data)
+    
+    def build_workflow_record(self, filename: str, analysis: Dict[str, Any], file_hash: str) -> Dict[str, Any]:
+        """Combine a content analysis with the filename-dependent metadata the index stores."""
+        fields = analysis['fields']
+        node_count = analysis['node_count']
+        trigger_type = analysis['trigger_type']
+        integrations = analysis['integrations']
         
         # Extract basic metadata
         workflow = {
             'filename': filename,
             'name': self.format_workflow_name(filename),
-            'workflow_id': data.get('id', ''),
-            'active': data.get('active', False),
-            'nodes': data.get('nodes', []),
-            'connections': data.get('connections', {}),
-            'tags': data.get('tags', []),
-            'created_at': data.get('createdAt', ''),
-            'updated_at': data.get('updatedAt', ''),
+            'workflow_id': fields.get('id', ''),
+            'active': fields.get('active', False),
+            'tags': fields.get('tags', []),
+            'created_at': fields.get('createdAt', ''),
+            'updated_at': fields.get('updatedAt', ''),
             'file_hash': file_hash,
-            'file_size': file_size,
-            'content': content # Add content to the workflow dictionary
+            'file_size': analysis['file_size'],
+            'content': analysis['content'] # Add content to the workflow dictionary
         }
         
         # Use JSON name if available and meaningful, otherwise use formatted filename
-        json_name = data.get('name', '').strip()
+        json_name = fields.get('name', '').strip()
         if json_name and json_name != filename.replace('.json', '') and not json_name.startswith('My workflow'):
             workflow['name'] = json_name
         # If no meaningful JSON name, use formatted filename (already set above)
         
         # Analyze nodes
-        node_count = len(workflow['nodes'])
         workflow['node_count'] = node_count
         
         # Determine complexity
@@ -200,282 +759,44 @@ class WorkflowDatabase:
             complexity = 'high'
         workflow['complexity'] = complexity
         
-        # Find trigger type and integrations
-        trigger_type, integrations = self.analyze_nodes(workflow['nodes'])
         workflow['trigger_type'] = trigger_type
         workflow['integrations'] = list(integrations)
+        workflow['nodes'] = analysis['nodes']
+        workflow['edges'] = analysis['edges']
+        workflow['svg'], workflow['thumbnail_svg'] = workflow_svg.render_svgs(analysis['nodes'], analysis['edges'])
         
         # Generate description
         workflow['description'] = self.generate_description(workflow, trigger_type, integrations)
         
         return workflow
     
+    def iter_workflow_fields(self, source):
+        """Yield (key, value) pairs for the top-level workflow fields used by the indexer."""
+        return workflow_analysis.iter_workflow_fields(source)
+    
     def extract_workflow_content(self, workflow_data: Dict) -> str:
         """Extract all searchable content from workflow JSON including nodes, parameters, and sticky notes."""
-        content_parts = []
-        
-        # Extract basic workflow info
-        if 'name' in workflow_data:
-            content_parts.append(workflow_data['name'])
-        
-        if 'description' in workflow_data:
-            content_parts.append(workflow_data['description'])
-        
-        # Extract content from nodes
-        if 'nodes' in workflow_data:
-            for node in workflow_data['nodes']:
-                # Node type and name
-                if 'type' in node:
-                    content_parts.append(node['type'])
-                if 'name' in node:
-                    content_parts.append(node['name'])
-                
-                # Node parameters and content
-                if 'parameters' in node:
-                    content_parts.append(self.extract_parameters_content(node['parameters']))
-                
-                # Sticky note content (very important for search)
-                if node.get('type') in ['n8n-nodes-base.stickyNote', 'n8n-nodes-base.stickyNote']:
-                    if 'parameters' in node and 'content' in node['parameters']:
-                        content_parts.append(node['parameters']['content'])
-                
-                # Code node content
-                if node.get('type') in ['n8n-nodes-base.code', 'n8n-nodes-base.function']:
-                    if 'parameters' in node and 'jsCode' in node['parameters']:
-                        content_parts.append(node['parameters']['jsCode'])
-                    if 'parameters' in node and 'functionCode' in node['parameters']:
-                        content_parts.append(node['parameters']['functionCode'])
-                
-                # HTTP Request content
-                if node.get('type') == 'n8n-nodes-base.httpRequest':
-                    if 'parameters' in node:
-                        params = node['parameters']
-                        if 'url' in params:
-                            content_parts.append(str(params['url']))
-                        if 'method' in params:
-                            content_parts.append(str(params['method']))
-                        if 'body' in params:
-                            content_parts.append(str(params['body']))
-                
-                # Form trigger content
-                if node.get('type') == 'n8n-nodes-base.formTrigger':
-                    if 'parameters' in node:
-                        params = node['parameters']
-                        if 'formTitle' in params:
-                            content_parts.append(str(params['formTitle']))
-                        if 'formFields' in params:
-                            content_parts.append(str(params['formFields']))
-        
-        # Extract tags and metadata
-        if 'tags' in workflow_data:
-            for tag in workflow_data['tags']:
-                if isinstance(tag, dict):
-                    if 'name' in tag:
-                        content_parts.append(tag['name'])
-                else:
-                    content_parts.append(str(tag))
-        
-        # Join all content with spaces for better search
-        return ' '.join(filter(None, content_parts))
+        return workflow_analysis.extract_workflow_content(workflow_data)
+    
+    def extract_node_content(self, node: Dict) -> List[str]:
+        """Extract the searchable text of one node: type, name, parameters, notes and code."""
+        return workflow_analysis.extract_node_content(node)
+    
+    def extract_tags_content(self, tags: List) -> List[str]:
+        """Extract tag names for search."""
+        return workflow_analysis.extract_tags_content(tags)
     
     def extract_parameters_content(self, parameters: Dict) -> str:
         """Recursively extract text content from node parameters."""
-        content_parts = []
-        
-        for key, value in parameters.items():
-            if isinstance(value, str):
-                content_parts.append(value)
-            elif isinstance(value, dict):
-                content_parts.append(self.extract_parameters_content(value))
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, str):
-                        content_parts.append(item)
-                    elif isinstance(item, dict):
-                        content_parts.append(self.extract_parameters_content(item))
-            elif value is not None:
-                content_parts.append(str(value))
-        
-        return ' '.join(filter(None, content_parts))
+        return workflow_analysis.extract_parameters_content(parameters)
     
     def analyze_nodes(self, nodes: List[Dict]) -> Tuple[str, set]:
         """Analyze nodes to determine trigger type and integrations."""
-        trigger_type = 'Manual'
-        integrations = set()
-        
-        # Enhanced service mapping for better recognition
-        service_mappings = {
-            # Messaging & Communication
-            'telegram': 'Telegram',
-            'telegramTrigger': 'Telegram',
-            'discord': 'Discord',
-            'slack': 'Slack', 
-            'whatsapp': 'WhatsApp',
-            'mattermost': 'Mattermost',
-            'teams': 'Microsoft Teams',
-            'rocketchat': 'Rocket.Chat',
-            
-            # Email
-            'gmail': 'Gmail',
-            'mailjet': 'Mailjet',
-            'emailreadimap': 'Email (IMAP)',
-            'emailsendsmt': 'Email (SMTP)',
-            'outlook': 'Outlook',
-            
-            # Cloud Storage
-            'googledrive': 'Google Drive',
-            'googledocs': 'Google Docs',
-            'googlesheets': 'Google Sheets',
-            'dropbox': 'Dropbox',
-            'onedrive': 'OneDrive',
-            'box': 'Box',
-            
-            # Databases
-            'postgres': 'PostgreSQL',
-            'mysql': 'MySQL',
-            'mongodb': 'MongoDB',
-            'redis': 'Redis',
-            'airtable': 'Airtable',
-            'notion': 'Notion',
-            
-            # Project Management
-            'jira': 'Jira',
-            'github': 'GitHub',
-            'gitlab': 'GitLab',
-            'trello': 'Trello',
-            'asana': 'Asana',
-            'mondaycom': 'Monday.com',
-            
-            # AI/ML Services
-            'openai': 'OpenAI',
-            'anthropic': 'Anthropic',
-            'huggingface': 'Hugging Face',
-            
-            # Social Media
-            'linkedin': 'LinkedIn',
-            'twitter': 'Twitter/X',
-            'facebook': 'Facebook',
-            'instagram': 'Instagram',
-            
-            # E-commerce
-            'shopify': 'Shopify',
-            'stripe': 'Stripe',
-            'paypal': 'PayPal',
-            
-            # Analytics
-            'googleanalytics': 'Google Analytics',
-            'mixpanel': 'Mixpanel',
-            
-            # Calendar & Tasks
-            'googlecalendar': 'Google Calendar', 
-            'googletasks': 'Google Tasks',
-            'cal': 'Cal.com',
-            'calendly': 'Calendly',
-            
-            # Forms & Surveys
-            'typeform': 'Typeform',
-            'googleforms': 'Google Forms',
-            'form': 'Form Trigger',
-            
-            # Development Tools
-            'webhook': 'Webhook',
-            'httpRequest': 'HTTP Request',
-            'graphql': 'GraphQL',
-            'sse': 'Server-Sent Events',
-            
-            # Utility nodes (exclude from integrations)
-            'set': None,
-            'function': None,
-            'code': None,
-            'if': None,
-            'switch': None,
-            'merge': None,
-            'split': None,
-            'stickynote': None,
-            'stickyNote': None,
-            'wait': None,
-            'schedule': None,
-            'cron': None,
-            'manual': None,
-            'stopanderror': None,
-            'noop': None,
-            'noOp': None,
-            'error': None,
-            'limit': None,
-            'aggregate': None,
-            'summarize': None,
-            'filter': None,
-            'sort': None,
-            'removeDuplicates': None,
-            'dateTime': None,
-            'extractFromFile': None,
-            'convertToFile': None,
-            'readBinaryFile': None,
-            'readBinaryFiles': None,
-            'executionData': None,
-            'executeWorkflow': None,
-            'executeCommand': None,
-            'respondToWebhook': None,
-        }
-        
-        for node in nodes:
-            node_type = node.get('type', '')
-            node_name = node.get('name', '').lower()
-            
-            # Determine trigger type
-            if 'webhook' in node_type.lower() or 'webhook' in node_name:
-                trigger_type = 'Webhook'
-            elif 'cron' in node_type.lower() or 'schedule' in node_type.lower():
-                trigger_type = 'Scheduled'
-            elif 'trigger' in node_type.lower() and trigger_type == 'Manual':
-                if 'manual' not in node_type.lower():
-                    trigger_type = 'Webhook'
-            
-            # Extract integrations with enhanced mapping
-            service_name = None
-            
-            # Handle n8n-nodes-base nodes
-            if node_type.startswith('n8n-nodes-base.'):
-                raw_service = node_type.replace('n8n-nodes-base.', '').lower()
-                raw_service = raw_service.replace('trigger', '')
-                service_name = service_mappings.get(raw_service, raw_service.title() if raw_service else None)
-            
-            # Handle @n8n/ namespaced nodes
-            elif node_type.startswith('@n8n/'):
-                raw_service = node_type.split('.')[-1].lower() if '.' in node_type else node_type.lower()
-                raw_service = raw_service.replace('trigger', '')
-                service_name = service_mappings.get(raw_service, raw_service.title() if raw_service else None)
-            
-            # Handle custom nodes
-            elif '-' in node_type:
-                # Try to extract service name from custom node names like "n8n-nodes-youtube-transcription-kasha.youtubeTranscripter"
-                parts = node_type.lower().split('.')
-                for part in parts:
-                    if 'youtube' in part:
-                        service_name = 'YouTube'
-                        break
-                    elif 'telegram' in part:
-                        service_name = 'Telegram'
-                        break
-                    elif 'discord' in part:
-                        service_name = 'Discord'
-                        break
-            
-            # Also check node names for service hints
-            for service_key, service_value in service_mappings.items():
-                if service_key in node_name and service_value:
-                    service_name = service_value
-                    break
-            
-            # Add to integrations if valid service found
-            if service_name and service_name not in ['None', None]:
-                integrations.add(service_name)
-        
-        # Determine if complex based on node variety and count
-        if len(nodes) > 10 and len(integrations) > 3:
-            trigger_type = 'Complex'
-        
-        return trigger_type, integrations
+        return integration_detection.analyze_nodes(nodes)
+    
+    def analyze_node(self, node: Dict, trigger_type: str, integrations: set) -> str:
+        """Fold one node into the running trigger type and integration set; returns the new trigger type."""
+        return integration_detection.analyze_node(node, trigger_type, integrations)
     
     def generate_description(self, workflow: Dict, trigger_type: str, integrations: set) -> str:
         """Generate a descriptive summary of the workflow."""
@@ -523,90 +844,393 @@ class WorkflowDatabase:
         
         return desc + "."
     
-    def index_all_workflows(self, force_reindex: bool = False) -> Dict[str, int]:
-        """Index all workflow files. Only reprocesses changed files unless force_reindex=True."""
+    def __getstate__(self):
+        """Only configuration is sent to index worker processes."""
+        return {'db_path': self.db_path, 'workflows_dir': self.workflows_dir,
+                'analysis_cache': self.analysis_cache}
+
+    def _index_job(self, file_path: str, known_hash: Optional[str]) -> Tuple[str, Any, Optional[str], Optional[Dict]]:
+        """Hash-check and analyze one file. Runs inline or inside a worker process.
+
+        The file is hashed first (large files in chunks, then streamed to the
+        analyzer rather than held whole) and only analyzed when the analysis
+        cache has no entry for its content. Returns a (status, payload,
+        file_hash, new_analysis) tuple where status is 'skipped', 'error',
+        'failed' (payload is the message) or 'ok' (payload is the workflow data).
+        new_analysis is set when a fresh analysis should be added to the cache.
+        """
+        try:
+            raw, file_hash = workflow_analysis.read_workflow_file(file_path)
+            if known_hash is not None and file_hash == known_hash:
+                return 'skipped', None, file_hash, None
+
+            analysis = self.analysis_cache.get(file_hash) if self.analysis_cache else None
+            new_analysis = None
+            if analysis is None:
+                analysis = new_analysis = self.analyze_workflow_content(file_path, raw)
+                if analysis is None:
+                    return 'error', None, None, None
+
+            workflow_data = self.build_workflow_record(os.path.basename(file_path), analysis, file_hash)
+            return 'ok', workflow_data, file_hash, new_analysis
+        except Exception as e:
+            return 'failed', str(e), None, None
+
+    def scan_workflow_files(self) -> Dict[str, os.stat_result]:
+        """Walk the workflows directory and stat every JSON file, sorted by path."""
+        found = {}
+        for dirpath, _, filenames in os.walk(self.workflows_dir):
+            for name in filenames:
+                if name.endswith('.json'):
+                    path = os.path.join(dirpath, name)
+                    found[path] = os.stat(path)
+        return dict(sorted(found.items()))
+
+    def index_all_workflows(self, force_reindex: bool = False, jobs: int = 1,
+                            bulk: bool = False) -> Dict[str, int]:
+        """Index all workflow files. Only reprocesses changed files unless force_reindex=True.
+
+        Files whose (size, mtime_ns, inode) match the stored manifest are skipped
+        without being read. Changed files are hashed once, and rows for files that
+        no longer exist are deleted in the same transaction.
+
+        With jobs > 1, file analysis is spread across a process pool while this
+        process remains the single database writer. Results are written in the
+        same order as the serial path, so both produce identical rows.
+
+        With bulk=True (meant for full rebuilds), the FTS sync triggers are
+        dropped, rows are written with executemany in large transactions and
+        workflows_fts is rebuilt and optimized once at the end. Durability
+        pragmas are relaxed only while the load runs.
+        """
+        empty_stats = {'processed': 0, 'skipped': 0, 'errors': 0, 'removed': 0}
         if not os.path.exists(self.workflows_dir):
             print(f"Warning: Workflows directory '{self.workflows_dir}' not found.")
-            return {'processed': 0, 'skipped': 0, 'errors': 0}
-        
-        workflows_path = Path(self.workflows_dir)
-        json_files = [str(p) for p in workflows_path.rglob("*.json")]
-        
-        if not json_files:
+            return empty_stats
+
+        file_stats = self.scan_workflow_files()
+
+        if not file_stats:
             print(f"Warning: No JSON files found in '{self.workflows_dir}' directory.")
-            return {'processed': 0, 'skipped': 0, 'errors': 0}
-        
-        print(f"Indexing {len(json_files)} workflow files...")
-        
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        
-        stats = {'processed': 0, 'skipped': 0, 'errors': 0}
-        
-        for file_path in json_files:
-            filename = os.path.basename(file_path)
-            
+            return empty_stats
+
+        with self._writer() as conn:
+            stats = dict(empty_stats)
+
+            manifest = {
+                row['path']: row for row in
+                conn.execute("SELECT path, size, mtime_ns, inode, file_hash FROM file_manifest")
+            }
+            stored_hashes = {
+                row['filename']: row['file_hash'] for row in
+                conn.execute("SELECT filename, file_hash FROM workflows")
+            }
+
+            # Stat comparison decides which files need to be read at all
+            pending = []
+            for path, st in file_stats.items():
+                entry = manifest.get(path)
+                if (not force_reindex and entry is not None
+                        and os.path.basename(path) in stored_hashes
+                        and entry['size'] == st.st_size
+                        and entry['mtime_ns'] == st.st_mtime_ns
+                        and entry['inode'] == st.st_ino):
+                    stats['skipped'] += 1
+                    continue
+                pending.append(path)
+
+            if pending:
+                print(f"Indexing {len(pending)} of {len(file_stats)} workflow files...")
+
+            known_hashes = [
+                None if force_reindex else stored_hashes.get(os.path.basename(p))
+                for p in pending
+            ]
+
+            executor = None
+            if jobs > 1 and len(pending) > 1:
+                executor = ProcessPoolExecutor(max_workers=jobs)
+                chunksize = max(1, len(pending) // (jobs * 8))
+                results = executor.map(self._index_job, pending, known_hashes, chunksize=chunksize)
+            else:
+                results = map(self._index_job, pending, known_hashes)
+
+            if bulk:
+                self._begin_bulk_load(conn)
             try:
-                # Check if file needs to be reprocessed
-                if not force_reindex:
-                    current_hash = self.get_file_hash(file_path)
-                    cursor = conn.execute(
-                        "SELECT file_hash FROM workflows WHERE filename = ?", 
-                        (filename,)
-                    )
-                    row = cursor.fetchone()
-                    if row and row['file_hash'] == current_hash:
-                        stats['skipped'] += 1
+                self._write_index_results(
+                    conn, zip(pending, results), stats, file_stats,
+                    batch_size=BULK_BATCH_SIZE if bulk else 1,
+                    commit_batches=bulk
+                )
+
+                # Prune rows and manifest entries for files that are gone
+                current_filenames = {os.path.basename(p) for p in file_stats}
+                removed = [(name,) for name in stored_hashes if name not in current_filenames]
+                conn.executemany("DELETE FROM workflows WHERE filename = ?", removed)
+                conn.executemany(
+                    "DELETE FROM file_manifest WHERE path = ?",
+                    [(path,) for path in manifest if path not in file_stats]
+                )
+                stats['removed'] = len(removed)
+
+                self.load_categories(conn)
+                # Every file has now been read or matched its manifest entry
+                conn.execute("DELETE FROM index_meta WHERE key = 'needs_reindex'")
+                conn.commit()
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+                if bulk:
+                    self._end_bulk_load(conn, changed=stats['processed'] > 0 or stats['removed'] > 0)
+
+            # Migrate existing databases to add content column if it doesn't exist
+            self.migrate_database(conn)
+
+        print(f"✅ Indexing complete: {stats['processed']} processed, {stats['skipped']} skipped, "
+              f"{stats['errors']} errors, {stats['removed']} removed")
+        return stats
+
+    def index_paths(self, paths) -> Dict[str, int]:
+        """Reindex specific files or directories without scanning the whole tree.
+
+        Existing JSON files are re-analyzed if their content changed; paths that
+        no longer exist (deleted files, or directories moved away) have their
+        rows and manifest entries removed. Used by the inotify watcher.
+        """
+        stats = {'processed': 0, 'skipped': 0, 'errors': 0, 'removed': 0}
+        file_stats = {}
+        gone = []
+        for path in sorted(set(paths)):
+            try:
+                st = os.stat(path)
+            except FileNotFoundError:
+                gone.append(path)
+                continue
+            if os.path.isdir(path):
+                for dirpath, _, filenames in os.walk(path):
+                    for name in filenames:
+                        if name.endswith('.json'):
+                            child = os.path.join(dirpath, name)
+                            file_stats[child] = os.stat(child)
+            elif path.endswith('.json'):
+                file_stats[path] = st
+
+        with self._writer() as conn:
+            pending = list(file_stats)
+            known_hashes = []
+            for path in pending:
+                row = conn.execute(
+                    "SELECT file_hash FROM workflows WHERE filename = ?",
+                    (os.path.basename(path),)
+                ).fetchone()
+                known_hashes.append(row['file_hash'] if row else None)
+
+            results = map(self._index_job, pending, known_hashes)
+            self._write_index_results(conn, zip(pending, results), stats, file_stats)
+
+            for path in gone:
+                # Matches the file itself or anything that lived below it
+                prefix = path.rstrip(os.sep) + os.sep
+                rows = conn.execute(
+                    "SELECT path, filename FROM file_manifest WHERE path = ? OR substr(path, 1, ?) = ?",
+                    (path, len(prefix), prefix)
+                ).fetchall()
+                filenames = {row['filename'] for row in rows}
+                if not rows and path.endswith('.json'):
+                    filenames.add(os.path.basename(path))
+                conn.executemany("DELETE FROM file_manifest WHERE path = ?", [(row['path'],) for row in rows])
+                for filename in filenames:
+                    # A file moved between directories keeps its row under the new path
+                    if conn.execute("SELECT 1 FROM file_manifest WHERE filename = ?", (filename,)).fetchone():
                         continue
-                
-                # Analyze workflow
-                workflow_data = self.analyze_workflow_file(file_path)
-                if not workflow_data:
-                    stats['errors'] += 1
-                    continue
-                
-                # Insert or update in database
-                conn.execute("""
-                    INSERT OR REPLACE INTO workflows (
-                        filename, name, workflow_id, active, description, trigger_type,
-                        complexity, node_count, integrations, tags, created_at, updated_at,
-                        file_hash, file_size, content, analyzed_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                """, (
-                    workflow_data['filename'],
-                    workflow_data['name'],
-                    workflow_data['workflow_id'],
-                    workflow_data['active'],
-                    workflow_data['description'],
-                    workflow_data['trigger_type'],
-                    workflow_data['complexity'],
-                    workflow_data['node_count'],
-                    json.dumps(workflow_data['integrations']),
-                    json.dumps(workflow_data['tags']),
-                    workflow_data['created_at'],
-                    workflow_data['updated_at'],
-                    workflow_data['file_hash'],
-                    workflow_data['file_size'],
-                    workflow_data['content']
-                ))
-                
-                stats['processed'] += 1
-                
+                    cursor = conn.execute("DELETE FROM workflows WHERE filename = ?", (filename,))
+                    stats['removed'] += cursor.rowcount
+
+            conn.commit()
+
+        print(f"🔄 Reindexed changes: {stats['processed']} processed, {stats['skipped']} unchanged, "
+              f"{stats['errors']} errors, {stats['removed']} removed")
+        return stats
+
+    def _connect_writer(self):
+        """Open a connection for index writes."""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row
+        # INSERT OR REPLACE only fires the FTS delete trigger with recursive triggers on
+        conn.execute("PRAGMA recursive_triggers=ON")
+        return conn
+
+    @contextmanager
+    def _writer(self):
+        """The dedicated writer connection, held exclusively for the length of the block."""
+        with self._write_lock:
+            if self._writer_conn is None:
+                self._writer_conn = self._connect_writer()
+            try:
+                yield self._writer_conn
+            except BaseException:
+                self._writer_conn.rollback()
+                raise
+
+    def _reader(self):
+        """This thread's read-only connection, opened once and reused for every query."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                                   cached_statements=STATEMENT_CACHE_SIZE)
+            conn.row_factory = sqlite3.Row
+            for pragma in READER_PRAGMAS:
+                conn.execute(pragma)
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    def close(self):
+        """Close the writer and every thread's read connection."""
+        with self._write_lock:
+            if self._writer_conn is not None:
+                self._writer_conn.close()
+                self._writer_conn = None
+        with self._readers_lock:
+            for conn in self._readers:
+                conn.close()
+            self._readers = []
+        self._local = threading.local()
+
+    def _begin_bulk_load(self, conn):
+        """Relax durability and detach FTS maintenance for the length of a bulk load."""
+        conn.commit()
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA cache_size=-262144")  # 256 MB
+        self.drop_fts_triggers(conn)
+        conn.commit()
+
+    def _end_bulk_load(self, conn, changed: bool = True):
+        """Rebuild workflows_fts in one pass (if any rows were written), restore triggers and normal pragmas."""
+        conn.commit()
+        if changed:
+            print("Rebuilding full-text index...")
+            conn.execute("INSERT INTO workflows_fts(workflows_fts) VALUES('rebuild')")
+            conn.execute("INSERT INTO workflows_fts(workflows_fts) VALUES('optimize')")
+        self.create_fts_triggers(conn)
+        if changed:
+            conn.execute(GENERATION_BUMP_SQL)  # FTS results changed without a workflows write
+        conn.commit()
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA cache_size=10000")
+
+    def _write_index_results(self, conn, results, stats: Dict[str, int],
+                             file_stats: Dict[str, os.stat_result],
+                             batch_size: int = 1, commit_batches: bool = False):
+        """Single writer: store analyzed workflows in arrival order and record their stat manifest."""
+        batch = []
+        new_analyses = []
+        for file_path, (status, workflow_data, file_hash, new_analysis) in results:
+            if status == 'error':
+                stats['errors'] += 1
+                continue
+            if status == 'failed':
+                print(f"Error processing {file_path}: {workflow_data}")
+                stats['errors'] += 1
+                continue
+
+            if new_analysis is not None:
+                new_analyses.append((file_hash, new_analysis))
+            manifest_row = self._manifest_row(file_path, file_stats[file_path], file_hash)
+            if status == 'skipped':
+                # Touched but byte-identical: refresh the manifest only
+                conn.execute(MANIFEST_UPSERT_SQL, manifest_row)
+                stats['skipped'] += 1
+                continue
+
+            try:
+                batch.append((file_path, self._workflow_row(workflow_data), manifest_row,
+                              self._child_rows(workflow_data)))
             except Exception as e:
                 print(f"Error processing {file_path}: {str(e)}")
                 stats['errors'] += 1
                 continue
-        
-        conn.commit()
-        
-        # Migrate existing databases to add content column if it doesn't exist
-        self.migrate_database(conn)
-        
-        conn.close()
-        
-        print(f"✅ Indexing complete: {stats['processed']} processed, {stats['skipped']} skipped, {stats['errors']} errors")
-        return stats
-    
+
+            if len(batch) >= batch_size:
+                self._flush_index_batch(conn, batch, stats, commit_batches)
+                batch = []
+
+        if batch:
+            self._flush_index_batch(conn, batch, stats, commit_batches)
+        if new_analyses and self.analysis_cache:
+            self.analysis_cache.put_many(new_analyses)
+
+    def _flush_index_batch(self, conn, batch: List[Tuple[str, tuple, tuple, Tuple[list, ...]]],
+                           stats: Dict[str, int], commit: bool):
+        """Write a batch of (file_path, workflow_row, manifest_row, child_rows) entries."""
+        if not conn.in_transaction:
+            conn.execute("BEGIN")  # keeps the savepoints below from committing on release
+        try:
+            conn.execute("SAVEPOINT index_batch")
+            conn.executemany(WORKFLOW_UPSERT_SQL, [entry[1] for entry in batch])
+            conn.executemany(MANIFEST_UPSERT_SQL, [entry[2] for entry in batch])
+            for i, sql in enumerate(CHILD_INSERT_SQL):
+                conn.executemany(sql, [row for entry in batch for row in entry[3][i]])
+            conn.execute("RELEASE index_batch")
+            stats['processed'] += len(batch)
+        except Exception:
+            conn.execute("ROLLBACK TO index_batch")
+            conn.execute("RELEASE index_batch")
+            # Retry row by row so one bad record doesn't take the whole batch down
+            for file_path, workflow_row, manifest_row, child_rows in batch:
+                try:
+                    conn.execute("SAVEPOINT index_row")
+                    conn.execute(WORKFLOW_UPSERT_SQL, workflow_row)
+                    conn.execute(MANIFEST_UPSERT_SQL, manifest_row)
+                    for sql, rows in zip(CHILD_INSERT_SQL, child_rows):
+                        conn.executemany(sql, rows)
+                    conn.execute("RELEASE index_row")
+                    stats['processed'] += 1
+                except Exception as e:
+                    conn.execute("ROLLBACK TO index_row")
+                    conn.execute("RELEASE index_row")
+                    print(f"Error processing {file_path}: {str(e)}")
+                    stats['errors'] += 1
+        if commit:
+            conn.commit()
+
+    def _workflow_row(self, workflow_data: Dict[str, Any]) -> tuple:
+        """Parameters for WORKFLOW_UPSERT_SQL."""
+        return (
+            workflow_data['filename'],
+            workflow_data['name'],
+            workflow_data['workflow_id'],
+            workflow_data['active'],
+            workflow_data['description'],
+            workflow_data['trigger_type'],
+            workflow_data['complexity'],
+            workflow_data['node_count'],
+            json.dumps(workflow_data['integrations']),
+            json.dumps(workflow_data['tags']),
+            workflow_data['created_at'],
+            workflow_data['updated_at'],
+            workflow_data['file_hash'],
+            workflow_data['file_size'],
+            workflow_data['content']
+        )
+
+    def _child_rows(self, workflow_data: Dict[str, Any]) -> Tuple[list, list, list, list, list]:
+        """Parameters for each statement in CHILD_INSERT_SQL."""
+        filename = workflow_data['filename']
+        node_rows = [(filename, index, *node) for index, node in enumerate(workflow_data['nodes'])]
+        edge_rows = [(filename, *edge) for edge in workflow_data['edges']]
+        integration_rows = [(filename, integration) for integration in workflow_data['integrations']]
+        tag_rows = [(filename, tag) for tag in tag_names(workflow_data['tags'])]
+        diagram_rows = [(filename, workflow_data['svg'], workflow_data['thumbnail_svg'])]
+        return node_rows, edge_rows, integration_rows, tag_rows, diagram_rows
+
+    def _manifest_row(self, file_path: str, st: os.stat_result, file_hash: str) -> tuple:
+        """Parameters for MANIFEST_UPSERT_SQL: the stat signature a file had when indexed."""
+        return (file_path, os.path.basename(file_path), st.st_size, st.st_mtime_ns, st.st_ino, file_hash)
+
     def migrate_database(self, conn):
         """Migrate existing database schema to add new columns."""
         try:
@@ -648,10 +1272,57 @@ class WorkflowDatabase:
     
     def search_workflows(self, query: str = "", trigger_filter: str = "all", 
                         complexity_filter: str = "all", active_only: bool = False,
-                        limit: int = 50, offset: int = 0) -> Tuple[List[Dict], int]:
-        """Fast search with filters and pagination."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+                        limit: int = 50, offset: int = 0, node_type: str = "",
+                        integration: str = "", tag: str = "", category: str = "all",
+                        cursor: Optional[str] = None) -> Tuple[List[Dict], int]:
+        """Fast search with filters and pagination; returns (workflows, exact total).
+
+        See search_workflows_page() for the filters, ordering and cursors.
+        """
+        page = self.search_workflows_page(
+            query, trigger_filter, complexity_filter, active_only, limit, offset,
+            node_type, integration, tag, category, cursor, count='exact'
+        )
+        return page['workflows'], page['total']
+    
+    def search_workflows_page(self, query: str = "", trigger_filter: str = "all",
+                              complexity_filter: str = "all", active_only: bool = False,
+                              limit: int = 50, offset: int = 0, node_type: str = "",
+                              integration: str = "", tag: str = "", category: str = "all",
+                              cursor: Optional[str] = None, count: str = "exact",
+                              facets: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        """One page of search results with has_more and a total produced by `count`.
+
+        node_type restricts results to workflows containing a node of exactly
+        that type (e.g. "@n8n/n8n-nodes-langchain.agent"), answered from idx_nodes_type.
+        integration and tag are exact matches answered from the junction tables,
+        category from workflow_categories; all filters can be combined.
+
+        Results are ordered by FTS rank (then id) when there is a query and
+        newest first otherwise. Pass a cursor from encode_cursor() instead of an
+        offset to seek straight past the previous page; deep pages then cost the
+        same as the first one.
+
+        count is 'exact' (COUNT(*), cached per index generation), 'estimate'
+        (full-text totals scaled from a rowid sample unless an exact total is
+        cached; filter-only totals stay exact) or 'none' (still exact when
+        facets were counted).
+        total_mode in the result says what produced total: exact, cached,
+        estimate or none. has_more always comes from fetching one extra row.
+
+        facets names any of trigger, complexity, category and integration;
+        the result then carries value -> count maps over all matching rows
+        (not just this page). They come from one grouped pass over the
+        matches, which also supplies the total, or straight from the
+        materialized stats when there is no query and no filter; either way
+        they are kept alongside the cached totals until the index changes.
+        """
+        if count not in COUNT_MODES:
+            raise ValueError(f"count must be one of {', '.join(COUNT_MODES)}")
+        unknown = [facet for facet in facets if facet not in FACET_SQL]
+        if unknown:
+            raise ValueError(f"Unknown facets: {', '.join(unknown)} (choose from {', '.join(FACET_SQL)})")
+        conn = self._reader()
         
         # Build WHERE clause
         where_conditions = []
@@ -668,11 +1339,32 @@ class WorkflowDatabase:
             where_conditions.append("w.complexity = ?")
             params.append(complexity_filter)
         
+        if node_type:
+            where_conditions.append("w.id IN (SELECT workflow_rowid FROM nodes WHERE type = ?)")
+            params.append(node_type)
+        
+        if integration:
+            where_conditions.append("w.id IN (SELECT workflow_rowid FROM workflow_integrations WHERE integration = ?)")
+            params.append(integration)
+        
+        if tag:
+            where_conditions.append("w.id IN (SELECT workflow_rowid FROM workflow_tags WHERE tag = ?)")
+            params.append(tag)
+        
+        if category == "Uncategorized":
+            where_conditions.append("w.filename NOT IN (SELECT filename FROM workflow_categories)")
+        elif category and category != "all":
+            where_conditions.append("w.filename IN (SELECT filename FROM workflow_categories WHERE category = ?)")
+            params.append(category)
+        
+        ranked = bool(query.strip())
+        seek_key = decode_cursor(cursor, ranked) if cursor else None
+        
         # Use FTS search if query provided
-        if query.strip():
+        if ranked:
             # FTS search with ranking
-            base_query = """
-                SELECT w.*, rank
+            select_columns = f"{WORKFLOW_COLUMNS_SQL}, {CATEGORY_COLUMN_SQL}, rank"
+            matches_sql = """
                 FROM workflows_fts fts
                 JOIN workflows w ON w.id = fts.rowid
                 WHERE workflows_fts MATCH ?
@@ -680,30 +1372,39 @@ class WorkflowDatabase:
             params.insert(0, query)
         else:
             # Regular query without FTS
-            base_query = """
-                SELECT w.*, 0 as rank
+            select_columns = f"{WORKFLOW_COLUMNS_SQL}, {CATEGORY_COLUMN_SQL}, 0 as rank"
+            matches_sql = """
                 FROM workflows w
                 WHERE 1=1
             """
         
         if where_conditions:
-            base_query += " AND " + " AND ".join(where_conditions)
-        
-        # Count total results
-        count_query = f"SELECT COUNT(*) as total FROM ({base_query}) t"
-        cursor = conn.execute(count_query, params)
-        total = cursor.fetchone()['total']
+            matches_sql += " AND " + " AND ".join(where_conditions)
+        base_query = f"SELECT {select_columns} {matches_sql}"
+        
+        # Get paginated results (one extra row answers has_more), seeking past the cursor
+        page_query = base_query
+        page_params = list(params)
+        if seek_key is not None:
+            if ranked:
+                page_query += " AND (rank, w.id) > (?, ?)"
+            else:
+                page_query += " AND w.id < ?"
+            page_params.extend(seek_key)
+            offset = 0
         
-        # Get paginated results
-        if query.strip():
-            base_query += " ORDER BY rank"
+        if ranked:
+            page_query += " ORDER BY rank, w.id"
         else:
-            base_query += " ORDER BY w.analyzed_at DESC"
+            # REPLACE gives every (re)analyzed row a rowid above all others, so
+            # id order is analyzed_at order with ties broken, and seekable
+            page_query += " ORDER BY w.id DESC"
         
-        base_query += f" LIMIT {limit} OFFSET {offset}"
+        page_query += f" LIMIT {limit + 1} OFFSET {offset}"
         
-        cursor = conn.execute(base_query, params)
-        rows = cursor.fetchall()
+        rows = conn.execute(page_query, page_params).fetchall()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
         
         # Convert to dictionaries and parse JSON fields
         results = []
@@ -712,73 +1413,293 @@ class WorkflowDatabase:
             workflow['integrations'] = json.loads(workflow['integrations'] or '[]')
             
             # Parse tags and convert dict tags to strings
-            raw_tags = json.loads(workflow['tags'] or '[]')
-            clean_tags = []
-            for tag in raw_tags:
-                if isinstance(tag, dict):
-                    # Extract name from tag dict if available
-                    clean_tags.append(tag.get('name', str(tag.get('id', 'tag'))))
-                else:
-                    clean_tags.append(str(tag))
-            workflow['tags'] = clean_tags
+            workflow['tags'] = tag_names(json.loads(workflow['tags'] or '[]'))
             
             results.append(workflow)
         
-        conn.close()
-        return results, total
+        facet_counts, facet_total = None, None
+        if facets:
+            facet_key = (self.index_generation(), 'facets', matches_sql, tuple(params), facets)
+            with self._count_cache_lock:
+                cached = self._count_cache.get(facet_key)
+                if cached is not None:
+                    self._count_cache.move_to_end(facet_key)
+            if cached is not None:
+                facet_counts, facet_total = cached
+            else:
+                if ranked or where_conditions:
+                    facet_counts, facet_total = self._facet_counts(conn, matches_sql, params, facets)
+                else:
+                    facet_counts, facet_total = self._stored_facet_counts(conn, facets)
+                with self._count_cache_lock:
+                    self._count_cache[facet_key] = (facet_counts, facet_total)
+                    if len(self._count_cache) > COUNT_CACHE_SIZE:
+                        self._count_cache.popitem(last=False)
+        
+        # Total results
+        if not has_more and cursor is None and (rows or offset == 0):
+            # The last page from an offset: the total is already known
+            total, total_mode = offset + len(rows), 'exact'
+        elif facet_total is not None:
+            # Counted for the facets anyway, so exact even when count='none'
+            total, total_mode = facet_total, 'exact'
+        elif count == 'none':
+            total, total_mode = None, 'none'
+        else:
+            count_key = (self.index_generation(), base_query, tuple(params))
+            with self._count_cache_lock:
+                total = self._count_cache.get(count_key)
+                if total is not None:
+                    self._count_cache.move_to_end(count_key)
+            if total is not None:
+                total_mode = 'cached'
+            elif count == 'estimate' and ranked:
+                # Filter-only counts are index lookups and already cheap; FTS counts are not
+                total, total_mode = self._estimate_count(conn, base_query, params)
+            else:
+                total = conn.execute(f"SELECT COUNT(*) FROM ({base_query}) t", params).fetchone()[0]
+                total_mode = 'exact'
+                with self._count_cache_lock:
+                    self._count_cache[count_key] = total
+                    if len(self._count_cache) > COUNT_CACHE_SIZE:
+                        self._count_cache.popitem(last=False)
+        
+        page = {'workflows': results, 'total': total, 'total_mode': total_mode, 'has_more': has_more}
+        if facets:
+            page['facets'] = facet_counts
+        return page
     
-    def get_stats(self) -> Dict[str, Any]:
-        """Get database statistics."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        
-        # Basic counts
-        cursor = conn.execute("SELECT COUNT(*) as total FROM workflows")
-        total = cursor.fetchone()['total']
-        
-        cursor = conn.execute("SELECT COUNT(*) as active FROM workflows WHERE active = 1")
-        active = cursor.fetchone()['active']
-        
-        # Trigger type breakdown
-        cursor = conn.execute("""
-            SELECT trigger_type, COUNT(*) as count 
-            FROM workflows 
-            GROUP BY trigger_type
-        """)
-        triggers = {row['trigger_type']: row['count'] for row in cursor.fetchall()}
-        
-        # Complexity breakdown
-        cursor = conn.execute("""
-            SELECT complexity, COUNT(*) as count 
-            FROM workflows 
-            GROUP BY complexity
-        """)
-        complexity = {row['complexity']: row['count'] for row in cursor.fetchall()}
-        
-        # Node stats
-        cursor = conn.execute("SELECT SUM(node_count) as total_nodes FROM workflows")
-        total_nodes = cursor.fetchone()['total_nodes'] or 0
+    def _facet_counts(self, conn, matches_sql: str, params: List,
+                      facets: Tuple[str, ...]) -> Tuple[Dict[str, Dict[str, int]], int]:
+        """Facet counts and the total over the matching rows, in a single statement."""
+        members = ["SELECT 'total', '', COUNT(*) FROM m"] + [FACET_SQL[facet] for facet in facets]
+        sql = (f"WITH m AS (SELECT w.id, w.filename, w.trigger_type, w.complexity {matches_sql}) "
+               + " UNION ALL ".join(members))
+        counts = {facet: {} for facet in facets}
+        total = 0
+        for facet, value, n in conn.execute(sql, params):
+            if facet == 'total':
+                total = n
+            else:
+                counts[facet][value] = n
+        return self._order_facets(counts), total
+    
+    def _stored_facet_counts(self, conn, facets: Tuple[str, ...]) -> Tuple[Dict[str, Dict[str, int]], int]:
+        """Facet counts for the whole index, read from the materialized stats tables."""
+        counts = {}
+        stored = {'trigger': {}, 'complexity': {}}
+        for stat, key, value in conn.execute(
+            "SELECT stat, key, value FROM workflow_stats WHERE stat IN ('trigger', 'complexity') AND value > 0"
+        ):
+            stored[stat][key] = value
+        for facet in facets:
+            if facet in stored:
+                counts[facet] = stored[facet]
+            elif facet == 'category':
+                counts[facet] = self.get_category_counts()
+            elif facet == 'integration':
+                counts[facet] = dict(conn.execute("""
+                    SELECT integration, SUM(workflows) FROM integration_stats
+                    GROUP BY integration HAVING SUM(workflows) > 0
+                """).fetchall())
+        total = conn.execute("SELECT value FROM workflow_stats WHERE stat = 'total' AND key = ''").fetchone()
+        return self._order_facets(counts), total[0] if total else 0
+    
+    def _order_facets(self, counts: Dict[str, Dict[str, int]]) -> Dict[str, Dict[str, int]]:
+        """Most frequent values first; only the top FACET_INTEGRATION_LIMIT integrations."""
+        ordered = {}
+        for facet, values in counts.items():
+            items = sorted(values.items(), key=lambda item: (-item[1], str(item[0])))
+            if facet == 'integration':
+                items = items[:FACET_INTEGRATION_LIMIT]
+            ordered[facet] = dict(items)
+        return ordered
+    
+    def _estimate_count(self, conn, base_query: str, params: List) -> Tuple[int, str]:
+        """Count full-text matches in ESTIMATE_STRATA rowid ranges spread over the table and scale up.
+
+        Rowids follow indexing order, which clusters workflows by directory, so
+        the sample is spread over the whole range rather than taken from one end.
+        """
+        low, high = conn.execute("SELECT MIN(id), MAX(id) FROM workflows").fetchone()
+        if low is None:
+            return 0, 'exact'
+        span = high - low + 1
+        if span <= ESTIMATE_SAMPLE_ROWS:
+            return conn.execute(f"SELECT COUNT(*) FROM ({base_query}) t", params).fetchone()[0], 'exact'
+        # Bound the FTS rowid directly so each doclist scan only visits its stratum
+        width = ESTIMATE_SAMPLE_ROWS // ESTIMATE_STRATA
+        stride = span / ESTIMATE_STRATA
+        stratum_sql = f"SELECT COUNT(*) AS n FROM ({base_query} AND fts.rowid >= ? AND fts.rowid < ?) t"
+        sample_params = []
+        for i in range(ESTIMATE_STRATA):
+            start = low + int(i * stride)
+            sample_params.extend(params + [start, start + width])
+        sampled = conn.execute(
+            "SELECT SUM(n) FROM (" + " UNION ALL ".join([stratum_sql] * ESTIMATE_STRATA) + ")",
+            sample_params
+        ).fetchone()[0]
+        return round(sampled * span / (width * ESTIMATE_STRATA)), 'estimate'
+    
+    def index_generation(self) -> int:
+        """Counter that changes whenever indexed workflows or categories change."""
+        row = self._reader().execute("SELECT value FROM index_meta WHERE key = 'generation'").fetchone()
+        return row[0] if row else 0
+    
+    def needs_reindex(self) -> bool:
+        """Whether init_database() reset indexed rows that no full index run has rebuilt yet."""
+        row = self._reader().execute("SELECT value FROM index_meta WHERE key = 'needs_reindex'").fetchone()
+        return bool(row and row[0])
+    
+    def index_version(self) -> Tuple[int, int]:
+        """(database id, generation): the pair never repeats, even when the database is recreated."""
+        meta = {row[0]: row[1] for row in self._reader().execute(
+            "SELECT key, value FROM index_meta WHERE key IN ('database_id', 'generation')"
+        )}
+        return meta.get('database_id', 0), meta.get('generation', 0)
+    
+    def get_by_filename(self, filename: str) -> Optional[Dict[str, Any]]:
+        """One workflow by exact filename (a UNIQUE index seek), or None."""
+        return self.get_many([filename]).get(filename)
+    
+    def get_many(self, filenames: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Workflows by exact filename, keyed by filename; unknown names are left out."""
+        conn = self._reader()
+        results = {}
+        filenames = list(dict.fromkeys(filenames))
+        for start in range(0, len(filenames), LOOKUP_BATCH_SIZE):
+            batch = filenames[start:start + LOOKUP_BATCH_SIZE]
+            placeholders = ",".join("?" for _ in batch)
+            for row in conn.execute(
+                f"SELECT {WORKFLOW_COLUMNS_SQL}, {CATEGORY_COLUMN_SQL} FROM workflows w WHERE w.filename IN ({placeholders})", batch
+            ):
+                workflow = dict(row)
+                workflow['integrations'] = json.loads(workflow['integrations'] or '[]')
+                workflow['tags'] = tag_names(json.loads(workflow['tags'] or '[]'))
+                results[workflow['filename']] = workflow
+        return results
+    
+    def get_svg(self, filename: str, thumbnail: bool = False) -> Optional[Tuple[str, Optional[str]]]:
+        """(pre-rendered SVG, file_hash) for a workflow, or None; thumbnail=True for the card version."""
+        column = "d.thumbnail" if thumbnail else "d.svg"
+        row = self._reader().execute(f"""
+            SELECT {column}, w.file_hash FROM workflows w
+            JOIN workflow_diagrams d ON d.workflow_rowid = w.id
+            WHERE w.filename = ?
+        """, (filename,)).fetchone()
+        return (row[0], row[1]) if row else None
+    
+    def suggest(self, query: str, limit: int = 8) -> Dict[str, List[Dict[str, Any]]]:
+        """Type-ahead completions for workflow names, integrations and node types.
         
-        # Unique integrations count
-        cursor = conn.execute("SELECT integrations FROM workflows WHERE integrations != '[]'")
-        all_integrations = set()
-        for row in cursor.fetchall():
-            integrations = json.loads(row['integrations'])
-            all_integrations.update(integrations)
+        Served from an in-memory prefix index (see suggest_index.py) that is
+        rebuilt on the first call after the index generation changes.
+        """
+        index = self.current_suggest_index()
+        if index is None:
+            with self._suggest_lock:
+                index = self.current_suggest_index()
+                if index is None:
+                    generation = self.index_generation()
+                    index = self._suggest_index = SuggestIndex.build(self._reader(), generation)
+        return index.complete(query, limit)
+    
+    def current_suggest_index(self, generation: Optional[int] = None) -> Optional[SuggestIndex]:
+        """The suggestion index if it matches `generation` (default: read the current one), else None."""
+        index = self._suggest_index
+        if generation is None and index is not None:
+            generation = self.index_generation()
+        if index is not None and index.generation == generation:
+            return index
+        return None
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get database statistics (one read of the trigger-maintained workflow_stats table)."""
+        conn = self._reader()
         
-        conn.close()
+        stats = {'total': {}, 'active': {}, 'nodes': {}, 'trigger': {}, 'complexity': {}, 'integration': {}}
+        for stat, key, value in conn.execute("SELECT stat, key, value FROM workflow_stats WHERE value != 0"):
+            stats[stat][key] = value
+        total = stats['total'].get('', 0)
+        active = stats['active'].get('', 0)
         
         return {
             'total': total,
             'active': active,
             'inactive': total - active,
-            'triggers': triggers,
-            'complexity': complexity,
-            'total_nodes': total_nodes,
-            'unique_integrations': len(all_integrations),
+            'triggers': stats['trigger'],
+            'complexity': stats['complexity'],
+            'total_nodes': stats['nodes'].get('', 0),
+            'unique_integrations': len(stats['integration']),
             'last_indexed': datetime.datetime.now().isoformat()
         }
 
+    def get_integrations(self, sort: str = "count", limit: int = 50, offset: int = 0,
+                         top: int = 3) -> Tuple[List[Dict[str, Any]], int]:
+        """Integrations with workflow counts, trigger mix and their `top` newest workflows.
+
+        Counts come from integration_stats, maintained by triggers at index time;
+        top workflows are a seek on the workflow_integrations primary key.
+        Returns (page of integrations, number of integrations).
+        """
+        if sort not in INTEGRATION_SORTS:
+            raise ValueError(f"sort must be one of {', '.join(INTEGRATION_SORTS)}")
+        conn = self._reader()
+        
+        total = conn.execute(
+            "SELECT COUNT(DISTINCT integration) FROM integration_stats WHERE workflows > 0"
+        ).fetchone()[0]
+        rows = conn.execute(f"""
+            SELECT integration, SUM(workflows) AS workflows FROM integration_stats
+            WHERE workflows > 0
+            GROUP BY integration
+            ORDER BY {INTEGRATION_SORTS[sort]}
+            LIMIT ? OFFSET ?
+        """, (limit, offset)).fetchall()
+        
+        names = [row['integration'] for row in rows]
+        mix = {name: {} for name in names}
+        if names:
+            placeholders = ",".join("?" for _ in names)
+            for row in conn.execute(f"""
+                SELECT integration, trigger_type, workflows FROM integration_stats
+                WHERE integration IN ({placeholders}) AND workflows > 0
+                ORDER BY workflows DESC
+            """, names):
+                mix[row['integration']][row['trigger_type']] = row['workflows']
+        
+        results = []
+        for row in rows:
+            top_workflows = [dict(w) for w in conn.execute("""
+                SELECT w.id, w.filename, w.name FROM workflow_integrations wi
+                JOIN workflows w ON w.id = wi.workflow_rowid
+                WHERE wi.integration = ?
+                ORDER BY wi.workflow_rowid DESC
+                LIMIT ?
+            """, (row['integration'], top))] if top > 0 else []
+            results.append({
+                'name': row['integration'],
+                'count': row['workflows'],
+                'triggers': mix[row['integration']],
+                'top_workflows': top_workflows,
+            })
+        return results, total
+
+    def get_category_counts(self) -> Dict[str, int]:
+        """Number of indexed workflows per category (from workflow_categories)."""
+        conn = self._reader()
+        cursor = conn.execute("""
+            SELECT c.category, COUNT(*) FROM workflow_categories c
+            JOIN workflows w ON w.filename = c.filename
+            GROUP BY c.category
+        """)
+        counts = {category: count for category, count in cursor.fetchall()}
+        total = conn.execute("SELECT COUNT(*) FROM workflows").fetchone()[0]
+        uncategorized = total - sum(counts.values())
+        if uncategorized:
+            counts['Uncategorized'] = uncategorized
+        return counts
+
     def get_service_categories(self) -> Dict[str, List[str]]:
         """Get service categories for enhanced filtering."""
         return {
@@ -803,28 +1724,23 @@ class WorkflowDatabase:
             return [], 0
         
         services = categories[category]
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._reader()
         
-        # Build OR conditions for all services in category
-        service_conditions = []
-        params = []
-        for service in services:
-            service_conditions.append("integrations LIKE ?")
-            params.append(f'%"{service}"%')
-        
-        where_clause = " OR ".join(service_conditions)
+        # Semi-join against the integrations junction table (one index range per service)
+        placeholders = ", ".join("?" for _ in services)
+        where_clause = f"w.id IN (SELECT workflow_rowid FROM workflow_integrations WHERE integration IN ({placeholders}))"
+        params = list(services)
         
         # Count total results
-        count_query = f"SELECT COUNT(*) as total FROM workflows WHERE {where_clause}"
+        count_query = f"SELECT COUNT(*) as total FROM workflows w WHERE {where_clause}"
         cursor = conn.execute(count_query, params)
         total = cursor.fetchone()['total']
         
         # Get paginated results
         query = f"""
-            SELECT * FROM workflows 
+            SELECT {WORKFLOW_COLUMNS_SQL}, {CATEGORY_COLUMN_SQL} FROM workflows w
             WHERE {where_clause}
-            ORDER BY analyzed_at DESC
+            ORDER BY w.analyzed_at DESC
             LIMIT {limit} OFFSET {offset}
         """
         
@@ -836,17 +1752,9 @@ class WorkflowDatabase:
         for row in rows:
             workflow = dict(row)
             workflow['integrations'] = json.loads(workflow['integrations'] or '[]')
-            raw_tags = json.loads(workflow['tags'] or '[]')
-            clean_tags = []
-            for tag in raw_tags:
-                if isinstance(tag, dict):
-                    clean_tags.append(tag.get('name', str(tag.get('id', 'tag'))))
-                else:
-                    clean_tags.append(str(tag))
-            workflow['tags'] = clean_tags
+            workflow['tags'] = tag_names(json.loads(workflow['tags'] or '[]'))
             results.append(workflow)
         
-        conn.close()
         return results, total
 
 
@@ -857,17 +1765,56 @@ def main():
     parser = argparse.ArgumentParser(description='N8N Workflow Database')
     parser.add_argument('--index', action='store_true', help='Index all workflows')
     parser.add_argument('--force', action='store_true', help='Force reindex all files')
+    parser.add_argument('--jobs', type=int, default=1, help='Worker processes for indexing (default: 1)')
+    parser.add_argument('--bulk', action='store_true', help='Bulk-load mode for full rebuilds (deferred FTS maintenance)')
+    parser.add_argument('--watch', action='store_true', help='Watch the workflows directory and reindex changed files (Linux)')
+    parser.add_argument('--no-cache', action='store_true', help='Ignore the shared analysis cache and analyze every file')
     parser.add_argument('--search', help='Search workflows')
     parser.add_argument('--stats', action='store_true', help='Show database statistics')
+    parser.add_argument('--fts-tokenize', help="FTS5 tokenizer, e.g. 'porter unicode61' or trigram")
+    parser.add_argument('--fts-prefix', help="FTS5 prefix index lengths, e.g. '2 3 4' ('' for none)")
+    parser.add_argument('--fts-detail', choices=FTS_DETAIL_LEVELS, help='FTS5 detail level')
+    parser.add_argument('--fts-no-columnsize', action='store_true', help='Build the FTS5 index with columnsize=0')
+    parser.add_argument('--fts-weights', help='bm25 column weights, e.g. name=10,description=5,content=1')
     
     args = parser.parse_args()
     
-    db = WorkflowDatabase()
+    # Any --fts-* option rebuilds workflows_fts with that configuration
+    fts_config = {}
+    if args.fts_tokenize is not None:
+        fts_config['tokenize'] = args.fts_tokenize
+    if args.fts_prefix is not None:
+        fts_config['prefix'] = args.fts_prefix
+    if args.fts_detail:
+        fts_config['detail'] = args.fts_detail
+    if args.fts_no_columnsize:
+        fts_config['columnsize'] = False
+    if args.fts_weights:
+        try:
+            fts_config['weights'] = {
+                column.strip(): float(weight)
+                for column, weight in (item.split('=') for item in args.fts_weights.split(','))
+            }
+        except ValueError:
+            parser.error('--fts-weights expects column=weight pairs separated by commas')
+    
+    try:
+        db = WorkflowDatabase(use_analysis_cache=not args.no_cache, fts_config=fts_config or None)
+    except ValueError as e:
+        parser.error(str(e))
     
     if args.index:
-        stats = db.index_all_workflows(force_reindex=args.force)
+        stats = db.index_all_workflows(force_reindex=args.force, jobs=args.jobs, bulk=args.bulk)
         print(f"Indexed {stats['processed']} workflows")
     
+    elif args.watch:
+        from workflow_watcher import WorkflowWatcher
+        db.index_all_workflows()
+        try:
+            WorkflowWatcher(db).run()
+        except KeyboardInterrupt:
+            print("\nStopped watching.")
+    
     elif args.search:
         results, total = db.search_workflows(args.search, limit=10)
         print(f"Found {total} workflows:")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Workflow SVG
+Static SVG diagrams drawn straight from n8n node positions and connections,
+so clients get a diagram without running a layout engine. Rendered at index
+time from the analysis `nodes` / `edges` rows (see workflow_analysis.node_row
+and edge_rows), in a full-size variant and a small text-free thumbnail.
+"""
+
+from typing import Dict, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+# Bump when the drawing changes: stored SVGs are re-rendered on the next index run,
+# and the version is part of the SVG ETags and ?v= URLs
+RENDER_VERSION = 1
+
+# Node box drawn at each n8n position (canvas units; n8n nodes are about 100 wide)
+NODE_WIDTH = 140
+NODE_HEIGHT = 56
+PADDING = 40
+
+# Largest width a full diagram is displayed at before the client scales it
+MAX_DISPLAY_WIDTH = 1200
+
+THUMBNAIL_WIDTH = 240
+THUMBNAIL_HEIGHT = 120
+
+# Characters of a node name shown in its box
+LABEL_CHARS = 20
+
+# (fill, stroke) by node role, matching the Mermaid diagram colours
+NODE_COLOURS = {
+    'trigger': ('#b3e0ff', '#0066cc'),
+    'condition': ('#ffffb3', '#e6e600'),
+    'code': ('#d9b3ff', '#6600cc'),
+    'error': ('#ffb3b3', '#cc0000'),
+    'other': ('#d9d9d9', '#666666'),
+}
+
+# Annotation-only nodes, left out of diagrams
+SKIPPED_NODE_TYPES = ('n8n-nodes-base.stickyNote',)
+
+
+def node_role(node_type: str) -> str:
+    """Colour group for a node type (same rules as the Mermaid diagram)."""
+    short = node_type.rsplit('.', 1)[-1].lower()
+    if any(x in short for x in ('trigger', 'webhook', 'cron')):
+        return 'trigger'
+    if any(x in short for x in ('if', 'switch')):
+        return 'condition'
+    if any(x in short for x in ('function', 'code')):
+        return 'code'
+    if 'error' in short:
+        return 'error'
+    return 'other'
+
+
+def layout(nodes: Sequence[Sequence]) -> Dict[str, Tuple[float, float, str]]:
+    """name -> (x, y, type) for drawable nodes; nodes without a position go in a row below the rest."""
+    placed = {}
+    unplaced = []
+    for name, node_type, _, x, y in nodes:
+        if not isinstance(name, str) or node_type in SKIPPED_NODE_TYPES or name in placed:
+            continue
+        if isinstance(x, (int, float)) and isinstance(y, (int, float)):
+            placed[name] = (float(x), float(y), node_type or '')
+        else:
+            unplaced.append((name, node_type or ''))
+    if unplaced:
+        left = min((x for x, _, _ in placed.values()), default=0.0)
+        below = max((y for _, y, _ in placed.values()), default=-NODE_HEIGHT * 2) + NODE_HEIGHT * 2
+        for i, (name, node_type) in enumerate(unplaced):
+            placed.setdefault(name, (left + i * NODE_WIDTH * 1.5, below, node_type))
+    return placed
+
+
+def _bounds(positions: Dict[str, Tuple[float, float, str]]) -> Tuple[float, float, float, float]:
+    xs = [x for x, _, _ in positions.values()]
+    ys = [y for _, y, _ in positions.values()]
+    left, top = min(xs) - PADDING, min(ys) - PADDING
+    return left, top, max(xs) + NODE_WIDTH + PADDING - left, max(ys) + NODE_HEIGHT + PADDING - top
+
+
+def _edge_path(source: Tuple[float, float, str], target: Tuple[float, float, str]) -> str:
+    """Cubic curve from the right edge of source to the left edge of target."""
+    x1, y1 = source[0] + NODE_WIDTH, source[1] + NODE_HEIGHT / 2
+    x2, y2 = target[0], target[1] + NODE_HEIGHT / 2
+    bend = max(40.0, abs(x2 - x1) / 2)
+    return f"M{x1:.0f},{y1:.0f} C{x1 + bend:.0f},{y1:.0f} {x2 - bend:.0f},{y2:.0f} {x2:.0f},{y2:.0f}"
+
+
+def render_svg(nodes: Sequence[Sequence], edges: Sequence[Sequence], thumbnail: bool = False) -> str:
+    """SVG for a workflow graph; thumbnail=True draws a small version without labels."""
+    positions = layout(nodes)
+    if not positions:
+        return _empty_svg(thumbnail)
+    left, top, width, height = _bounds(positions)
+    if thumbnail:
+        size = f'width="{THUMBNAIL_WIDTH}" height="{THUMBNAIL_HEIGHT}"'
+    else:
+        scale = min(1.0, MAX_DISPLAY_WIDTH / width)
+        size = f'width="{width * scale:.0f}" height="{height * scale:.0f}"'
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="{left:.0f} {top:.0f} {width:.0f} {height:.0f}" '
+        f'{size} preserveAspectRatio="xMidYMid meet" font-family="sans-serif">'
+    ]
+
+    stroke = 6 if thumbnail else 2
+    parts.append(f'<g fill="none" stroke="#888" stroke-width="{stroke}">')
+    for source, target, connection_type, _, _ in edges:
+        if source in positions and target in positions:
+            dash = '' if connection_type == 'main' else ' stroke-dasharray="6 4"'
+            parts.append(f'<path d="{_edge_path(positions[source], positions[target])}"{dash}/>')
+    parts.append('</g>')
+
+    for name, (x, y, node_type) in positions.items():
+        fill, outline = NODE_COLOURS[node_role(node_type)]
+        parts.append(
+            f'<rect x="{x:.0f}" y="{y:.0f}" width="{NODE_WIDTH}" height="{NODE_HEIGHT}" rx="8" '
+            f'fill="{fill}" stroke="{outline}" stroke-width="{stroke}"/>'
+        )
+        if thumbnail:
+            continue
+        label = name if len(name) <= LABEL_CHARS else name[:LABEL_CHARS - 1] + '…'
+        short_type = node_type.rsplit('.', 1)[-1]
+        cx = x + NODE_WIDTH / 2
+        parts.append(
+            f'<text x="{cx:.0f}" y="{y + 24:.0f}" font-size="13" text-anchor="middle" fill="#222">'
+            f'<title>{escape(name)}</title>{escape(label)}</text>'
+        )
+        parts.append(
+            f'<text x="{cx:.0f}" y="{y + 42:.0f}" font-size="10" text-anchor="middle" fill="#555">'
+            f'{escape(short_type[:LABEL_CHARS + 4])}</text>'
+        )
+    parts.append('</svg>')
+    return ''.join(parts)
+
+
+def _empty_svg(thumbnail: bool) -> str:
+    width, height = (THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT) if thumbnail else (320, 80)
+    label = '' if thumbnail else (
+        f'<text x="{width / 2:.0f}" y="{height / 2:.0f}" font-size="14" text-anchor="middle" '
+        f'fill="#666">No nodes found in workflow</text>'
+    )
+    return (f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+            f'width="{width}" height="{height}" font-family="sans-serif">{label}</svg>')
+
+
+def render_svgs(nodes: Sequence[Sequence], edges: Sequence[Sequence]) -> Tuple[str, str]:
+    """(full diagram, thumbnail) for one workflow."""
+    return render_svg(nodes, edges), render_svg(nodes, edges, thumbnail=True)
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Workflow Directory Watcher
+Linux inotify watcher that keeps the workflow index fresh without full rescans.
+"""
+
+import os
+import sys
+import time
+import select
+import struct
+import ctypes
+import ctypes.util
+import threading
+from typing import Callable, Dict, Optional, Set
+
+# inotify event flags (see <sys/inotify.h>)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+WATCH_MASK = (IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE |
+              IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF | IN_ONLYDIR)
+
+EVENT_HEADER = struct.Struct('iIII')  # wd, mask, cookie, len
+
+
+class Inotify:
+    """Minimal ctypes binding for the Linux inotify API."""
+
+    def __init__(self):
+        if not sys.platform.startswith('linux'):
+            raise RuntimeError("Watch mode requires Linux inotify")
+        self._libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self._libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_init1 failed: {os.strerror(errno)}")
+
+    def add_watch(self, path: str, mask: int) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), ctypes.c_uint32(mask))
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch failed for {path}: {os.strerror(errno)}")
+        return wd
+
+    def read_events(self, timeout: float):
+        """Yield (wd, mask, name) tuples, waiting at most `timeout` seconds for the first."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return
+        try:
+            buffer = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset < len(buffer):
+            wd, mask, _, name_len = EVENT_HEADER.unpack_from(buffer, offset)
+            offset += EVENT_HEADER.size
+            name = buffer[offset:offset + name_len].rstrip(b'\0')
+            offset += name_len
+            yield wd, mask, os.fsdecode(name)
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+
+class WorkflowWatcher:
+    """Watch the workflows directory and reindex only the files that change.
+
+    Events are debounced: touched paths are collected until the directory has
+    been quiet for `debounce` seconds (or `max_delay` seconds have passed since
+    the first pending event), then handed to WorkflowDatabase.index_paths.
+    """
+
+    def __init__(self, db, debounce: float = 0.25, max_delay: float = 1.0,
+                 on_update: Optional[Callable[[Dict[str, int]], None]] = None):
+        self.db = db
+        self.debounce = debounce
+        self.max_delay = max_delay
+        self.on_update = on_update
+        self.inotify = Inotify()
+        self.watches: Dict[int, str] = {}
+        self.pending: Set[str] = set()
+        self.needs_full_scan = False
+
+    def watch_tree(self, root: str):
+        """Add watches for root and every directory below it."""
+        for dirpath, _, _ in os.walk(root):
+            try:
+                wd = self.inotify.add_watch(dirpath, WATCH_MASK)
+            except OSError as e:
+                print(f"Warning: cannot watch {dirpath}: {e}")
+                continue
+            self.watches[wd] = dirpath
+
+    def _handle_event(self, wd: int, mask: int, name: str):
+        if mask & IN_Q_OVERFLOW:
+            # Events were dropped; fall back to one incremental scan
+            self.needs_full_scan = True
+            return
+        if mask & IN_IGNORED:
+            self.watches.pop(wd, None)
+            return
+
+        directory = self.watches.get(wd)
+        if directory is None:
+            return
+        if mask & (IN_DELETE_SELF | IN_MOVE_SELF):
+            self.pending.add(directory)
+            return
+
+        path = os.path.join(directory, name)
+        if mask & IN_ISDIR:
+            if mask & (IN_CREATE | IN_MOVED_TO):
+                # New subtree: watch it and pick up files that landed before the watch existed
+                self.watch_tree(path)
+                for dirpath, _, filenames in os.walk(path):
+                    self.pending.update(os.path.join(dirpath, f) for f in filenames if f.endswith('.json'))
+            elif mask & (IN_DELETE | IN_MOVED_FROM):
+                self.pending.add(path)
+            return
+
+        if name.endswith('.json') and mask & (IN_CLOSE_WRITE | IN_MOVED_TO | IN_MOVED_FROM | IN_DELETE):
+            self.pending.add(path)
+
+    def flush(self) -> Optional[Dict[str, int]]:
+        """Reindex pending paths (or rescan after an overflow)."""
+        if self.needs_full_scan:
+            self.needs_full_scan = False
+            self.pending.clear()
+            stats = self.db.index_all_workflows()
+        elif self.pending:
+            paths, self.pending = self.pending, set()
+            stats = self.db.index_paths(paths)
+        else:
+            return None
+        if self.on_update:
+            self.on_update(stats)
+        return stats
+
+    def run(self, stop_event: Optional[threading.Event] = None):
+        """Watch until stop_event is set (or forever)."""
+        self.watch_tree(self.db.workflows_dir)
+        print(f"👀 Watching {self.db.workflows_dir} ({len(self.watches)} directories)")
+
+        first_pending = None
+        last_event = None
+        try:
+            while stop_event is None or not stop_event.is_set():
+                got_event = False
+                for wd, mask, name in self.inotify.read_events(timeout=self.debounce):
+                    self._handle_event(wd, mask, name)
+                    got_event = True
+
+                now = time.monotonic()
+                if got_event:
+                    last_event = now
+                    if first_pending is None:
+                        first_pending = now
+
+                if first_pending is not None and (
+                        now - last_event >= self.debounce or now - first_pending >= self.max_delay):
+                    try:
+                        self.flush()
+                    except Exception as e:
+                        print(f"Error reindexing changed workflows: {e}")
+                    first_pending = None
+                    last_event = None
+        finally:
+            self.inotify.close()
+
+
+def start_watch_thread(db, **kwargs) -> threading.Event:
+    """Run a WorkflowWatcher on a daemon thread; set the returned event to stop it."""
+    stop_event = threading.Event()
+    watcher = WorkflowWatcher(db, **kwargs)
+    thread = threading.Thread(target=watcher.run, args=(stop_event,), name="workflow-watcher", daemon=True)
+    thread.start()
+    return stop_event